@@ -1,21 +1,24 @@
 import pygame
-import random
 import json
 import os
 import sys
-from collections import Counter
+import threading
+import time
+from collections import OrderedDict
 
-pygame.init()
-pygame.font.init()
-pygame.mixer.init() 
+from atlas import KEY_STATES, SpriteAtlas, paint_key, paint_tile
+from layout import LayoutCache
+from profiler import FrameProfiler
+from renderer import TextureTarget
+from storage import DebouncedJsonWriter, GameLogStore, atomic_write_json
+from wordle_engine import WordleEngine
 
 # --- ค่าคงที่และการตั้งค่าเริ่มต้น ---
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
 DEFAULT_SETTINGS = {"sound_enabled": True, "bg_volume": 0.3, "fx_volume": 0.5}
 
 WIDTH, HEIGHT = 600, 750
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("Wordle BioHazard") 
+SCREEN = None # สร้างใน init_display() ก่อนวาดเฟรมแรก (import โมดูลนี้จึงไม่เปิดหน้าต่าง)
 
 # --- ฟังก์ชันสำหรับโหลดทรัพยากร (รูปภาพ, เสียง, ฟอนต์) ---
 
@@ -34,16 +37,54 @@ def load_image(filename, use_convert_alpha=True):
         print(f"Could not load image {filename}: {e}")
         return None
 
-# โหลดไอคอนและรูปภาพ
-try:
-    icon = load_image("icon.png", use_convert_alpha=False)
-    if icon:
-        pygame.display.set_icon(icon)
-except Exception as e:
-    print(f"Could not set icon: {e}")
+# รูปภาพของปุ่ม (โหลดใน init_display เพราะ convert_alpha ต้องมีหน้าจอก่อน)
+SETTING_IMG = None
+RETURN_IMG = None
 
-SETTING_IMG = load_image("setting_image.jpg")
-RETURN_IMG = load_image("return_image.png")
+class ImageCache:
+    """
+    แคชรูปที่ย่อ/ขยายแล้ว (key: ชื่อรูป) เก็บไว้หนึ่งขนาดต่อรูป
+    smoothscale จะทำใหม่เฉพาะเมื่อขนาดเปลี่ยน (เช่นหลัง VIDEORESIZE) ไม่ใช่ทุกเฟรม
+    """
+    def __init__(self):
+        self.images = {}
+        self.scaled = {} # name -> (size, Surface)
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, name, image):
+        """
+        เพิ่มรูปต้นฉบับ (ถ้า image เป็น None ถือว่าไม่มีรูปนี้)
+        """
+        self.images[name] = image
+        self.scaled.pop(name, None)
+
+    def get(self, name, size):
+        """
+        คืนรูปขนาด size (กว้าง, สูง) หรือ None ถ้าไม่มีรูปต้นฉบับ
+        """
+        image = self.images.get(name)
+        if image is None:
+            return None
+        size = (int(size[0]), int(size[1]))
+        entry = self.scaled.get(name)
+        if entry is not None and entry[0] == size:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        surf = pygame.transform.smoothscale(image, size)
+        self.scaled[name] = (size, surf)
+        return surf
+
+    def clear(self):
+        self.scaled.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.scaled),
+                "hit_rate": self.hits / total if total else 0.0}
+
+IMAGE_CACHE = ImageCache()
 
 # --- การตั้งค่าสี ---
 BG_COLOR = (35, 65, 150)
@@ -91,25 +132,116 @@ def load_settings(path=SETTINGS_FILE):
 
 def save_settings(settings, path=SETTINGS_FILE):
     """
-    บันทึกการตั้งค่า (dict) ลงในไฟล์ JSON
+    บันทึกการตั้งค่า (dict) ลงในไฟล์ JSON (เขียนไฟล์ชั่วคราวแล้วเปลี่ยนชื่อทับ)
     """
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=4)
+        atomic_write_json(path, settings, indent=4)
     except Exception as e:
         print(f"Could not save settings: {e}")
 
+FONT_FILES = ["Poppins-Regular.ttf", "Montserrat-Regular.ttf", "Kanit-Regular.ttf"]
+
+class FontRegistry:
+    """
+    หาไฟล์ฟอนต์เพียงครั้งแรกที่ใช้ แล้วเก็บ pygame.font.Font ที่สร้างแล้วไว้ตามขนาด
+    ฟอนต์ขนาดเดิมจึงถูกใช้ซ้ำทุกครั้งที่ update_fonts สร้างฟอนต์ของหน้าจอ
+    """
+    def __init__(self, candidates=FONT_FILES, system_font="segoeui", max_size=64):
+        self.candidates = candidates
+        self.system_font = system_font
+        self.max_size = max_size
+        self.path = None
+        self.resolved = False
+        self.fonts = OrderedDict()
+
+    def resolve(self):
+        """
+        หาไฟล์ฟอนต์ตัวแรกที่มีอยู่ (โฟลเดอร์ปัจจุบัน หรือโฟลเดอร์ของเกม)
+        ถ้าไม่พบเลยจะใช้ฟอนต์ระบบแทน
+        """
+        self.path = None
+        for f in self.candidates:
+            for path in (f, os.path.join(os.path.dirname(__file__), f)):
+                if os.path.exists(path):
+                    self.path = path
+                    break
+            if self.path:
+                break
+        self.resolved = True
+        self.fonts.clear()
+
+    def get(self, size):
+        font = self.fonts.get(size)
+        if font is not None:
+            self.fonts.move_to_end(size)
+            return font
+        if not self.resolved:
+            self.resolve()
+        if self.path:
+            font = pygame.font.Font(self.path, size)
+        else:
+            font = pygame.font.SysFont(self.system_font, size, bold=True)
+        self.fonts[size] = font
+        if len(self.fonts) > self.max_size:
+            self.fonts.popitem(last=False) # ทิ้งขนาดที่ไม่ได้ใช้นานที่สุด
+        return font
+
+FONT_REGISTRY = FontRegistry()
+
 def get_font(size):
     """
-    โหลดฟอนต์ที่กำหนดเอง (ถ้ามีในโฟลเดอร์)
-    หรือใช้ฟอนต์ระบบ (segoeui) หากไม่พบ
+    คืนฟอนต์ขนาด size จาก FONT_REGISTRY (ฟอนต์ที่กำหนดเองถ้ามีในโฟลเดอร์
+    หรือฟอนต์ระบบ segoeui หากไม่พบ)
     """
-    for f in ["Poppins-Regular.ttf", "Montserrat-Regular.ttf", "Kanit-Regular.ttf"]:
-        if os.path.exists(f):
-            return pygame.font.Font(f, size)
-    return pygame.font.SysFont("segoeui", size, bold=True)
+    return FONT_REGISTRY.get(size)
 
 FONTS = {}
+
+class TextCache:
+    """
+    แคชแบบ LRU ของข้อความที่ render แล้ว (key: บทบาทฟอนต์, ข้อความ, สี, antialias)
+    ข้อความบนจอแทบไม่เปลี่ยนระหว่างเฟรม จึงไม่ต้อง render ตัวอักษรใหม่ทุกเฟรม
+    ถูกล้างทุกครั้งที่ update_fonts สร้างฟอนต์ใหม่ (เช่นตอนปรับขนาดหน้าจอ)
+    """
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, role, text, color, antialias=True):
+        key = (role, text, tuple(color), antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = FONTS[role].render(text, antialias, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False) # ทิ้งรายการที่ไม่ได้ใช้นานที่สุด
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        """
+        คืนสถิติการใช้แคช (hits, misses, จำนวนรายการ, อัตรา hit)
+        """
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces),
+                "hit_rate": self.hits / total if total else 0.0}
+
+TEXT_CACHE = TextCache()
+
+def render_text(role, text, color, antialias=True):
+    """
+    render ข้อความด้วยฟอนต์ FONTS[role] ผ่าน TEXT_CACHE
+    """
+    return TEXT_CACHE.render(role, text, color, antialias)
+
 def update_fonts(width, height):
     """
     อัปเดตขนาดของฟอนต์ทั้งหมดตามขนาดหน้าจอปัจจุบัน
@@ -124,17 +256,69 @@ def update_fonts(width, height):
         FONTS["key"] = get_font(int(base_size * 0.023))
         FONTS["end_game"] = get_font(int(base_size * 0.06))
         FONTS["button"] = get_font(int(base_size * 0.04))
+        FONTS["title"] = get_font(max(28, min(64, width // 14))) # หัวเรื่องของหน้าเมนู (ตามความกว้าง)
     except Exception as e:
         print(f"Error loading fonts: {e}")
         # Fallback ในกรณีที่ get_font มีปัญหา
         for key, size in {"letter": 0.07, "menu": 0.06, "stats": 0.04, "message": 0.035, "key": 0.03, "end_game": 0.07, "button": 0.05}.items():
             FONTS[key] = pygame.font.Font(None, int(base_size * size))
+        FONTS["title"] = pygame.font.Font(None, max(28, min(64, width // 14)))
+    TEXT_CACHE.clear() # ฟอนต์เปลี่ยนขนาด ข้อความที่ render ไว้ใช้ไม่ได้แล้ว
+
+# --- การเริ่มระบบของ pygame (ทำเมื่อต้องใช้ ไม่ใช่ตอน import) ---
 
-update_fonts(WIDTH, HEIGHT) # โหลดฟอนต์ครั้งแรก
+_MIXER_LOCK = threading.Lock()
+
+def init_display():
+    """
+    เริ่มเฉพาะระบบที่ต้องใช้แสดงเฟรมแรก (display, font, timer) แล้วสร้างหน้าจอ
+    โหลดไอคอน, รูปภาพ และฟอนต์ เรียกซ้ำได้ (ทำงานครั้งเดียว)
+    mixer ไม่ถูกเริ่มที่นี่ แต่เริ่มบน thread โหลดเสียง (ดู init_mixer)
+    """
+    global SCREEN, SETTING_IMG, RETURN_IMG
+    if SCREEN is not None:
+        return SCREEN
+    pygame.display.init()
+    pygame.font.init()
+    # เริ่มระบบ timer ของ SDL (get_ticks และ set_timer ต้องใช้)
+    # โดยไม่เรียก pygame.init() ที่จะเปิดอุปกรณ์เสียงไปด้วย
+    pygame.time.set_timer(SFX_START_EVENT, 0)
+
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption("Wordle BioHazard") 
+
+    # โหลดไอคอนและรูปภาพ
+    try:
+        icon = load_image("icon.png", use_convert_alpha=False)
+        if icon:
+            pygame.display.set_icon(icon)
+    except Exception as e:
+        print(f"Could not set icon: {e}")
+    SETTING_IMG = load_image("setting_image.jpg")
+    RETURN_IMG = load_image("return_image.png")
+    IMAGE_CACHE.register("setting", SETTING_IMG)
+    IMAGE_CACHE.register("return", RETURN_IMG)
+
+    update_fonts(WIDTH, HEIGHT) # โหลดฟอนต์ครั้งแรก
+    return SCREEN
+
+def init_mixer():
+    """
+    เริ่ม mixer (ครั้งเดียว) คืน True ถ้าใช้งานได้
+    การเปิดอุปกรณ์เสียงอาจช้า จึงถูกเรียกจาก thread โหลดเสียงแทนตอนเริ่มโปรแกรม
+    """
+    with _MIXER_LOCK:
+        if pygame.mixer.get_init() is None:
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print(f"Could not init mixer: {e}")
+                return False
+        return True
 
 # --- ฟังก์ชันสำหรับวาด UI (ปุ่ม, หัวข้อ) ---
 
-def draw_button(screen, rect, text, mx, my, font):
+def draw_button(screen, rect, text, mx, my, font_role):
     """
     วาดปุ่มสไตล์ใหม่ (ขอบมน, มีเงา hover) ลงบนหน้าจอ
     """
@@ -142,25 +326,14 @@ def draw_button(screen, rect, text, mx, my, font):
     color = BUTTON_HOVER if is_hover else BUTTON_COLOR
     pygame.draw.rect(screen, color, rect, border_radius=20)
     pygame.draw.rect(screen, TEXT_COLOR, rect, 3, border_radius=20) # วาดขอบ
-    label = font.render(text, True, TEXT_COLOR)
+    label = render_text(font_role, text, TEXT_COLOR)
     label_rect = label.get_rect(center=rect.center)
     screen.blit(label, label_rect)
 
-def draw_title(screen, w, text, y=100):
-    """
-    วาดข้อความหัวเรื่องตรงกลางหน้าจอ
-    """
-    y_pos = int(HEIGHT * (y / 750)) 
-    font_size = max(28, min(64, w // 14))
-    title_font = get_font(font_size)
-    label = title_font.render(text, True, TEXT_COLOR)
-    label_rect = label.get_rect(center=(w // 2, y_pos))
-    screen.blit(label, label_rect)
-
-def draw_menu_buttons(screen, mx, my, button_texts, start_y_ratio, font):
+def menu_button_rects(button_texts, start_y_ratio):
     """
-    ฟังก์ชันช่วยวาดปุ่มหลายๆ ปุ่มในแนวตั้งสำหรับเมนู
-    คืนค่า dict ของปุ่มที่วาด (text: rect)
+    ตำแหน่งของปุ่มหลายๆ ปุ่มในแนวตั้งสำหรับเมนู ตามขนาดหน้าจอปัจจุบัน
+    คืนค่า dict ของปุ่ม (text: rect)
     """
     buttons = {}
     button_h, button_w = HEIGHT * 0.08, WIDTH * 0.7
@@ -171,70 +344,528 @@ def draw_menu_buttons(screen, mx, my, button_texts, start_y_ratio, font):
         if text == "Back": # เพิ่มช่องว่างเล็กน้อยสำหรับปุ่ม Back
              y_pos += button_h * 0.3
              
-        rect = pygame.Rect((WIDTH - button_w) / 2, y_pos, button_w, button_h)
-        buttons[text] = rect
-        draw_button(screen, rect, text, mx, my, font)
+        buttons[text] = pygame.Rect((WIDTH - button_w) / 2, y_pos, button_w, button_h)
     return buttons
 
-# --- คลาสหลักของเกม ---
+# --- รายการสิ่งที่วาดของหน้าเมนู (key, Rect, ข้อมูลสำหรับเทียบ, ฟังก์ชันวาด) สำหรับ DirtyRectRenderer ---
 
-class WordleGamePygame:
+def title_item(text, y=100):
     """
-    คลาสหลักที่จัดการตรรกะทั้งหมดของเกม Wordle
-    รวมถึงสถานะเกม, การโหลดเสียง, การวาด, และการจัดการเหตุการณ์
+    ข้อความหัวเรื่องตรงกลางหน้าจอ
     """
-    
-    def __init__(self, stats_file='wordle_stats_en.json'):
+    y_pos = int(HEIGHT * (y / 750)) 
+    label = render_text("title", text, TEXT_COLOR)
+    label_rect = label.get_rect(center=(WIDTH // 2, y_pos))
+    return (("title",), label_rect, text, lambda s: s.blit(label, label_rect))
+
+def button_item(name, rect, text, mouse, font_role):
+    """
+    ปุ่มหนึ่งปุ่ม (วาดใหม่เมื่อข้อความหรือสถานะ hover เปลี่ยน)
+    """
+    mx, my = mouse
+    return (("button", name), rect, (text, rect.collidepoint(mouse)),
+            lambda s: draw_button(s, rect, text, mx, my, font_role))
+
+def text_item(name, role, text, color, pos):
+    """
+    ข้อความหนึ่งบรรทัดที่มุมซ้ายบนอยู่ที่ pos
+    """
+    surf = render_text(role, text, color)
+    rect = surf.get_rect(topleft=(int(pos[0]), int(pos[1]))) # ตัดเศษทิ้งเหมือน blit
+    return (("text", name), rect, (text, color), lambda s: s.blit(surf, rect))
+
+class DirtyRectRenderer:
+    """
+    วาดหน้าจอแบบ dirty rectangle: เทียบรายการสิ่งที่วาด (จาก frame_items ของ Scene) กับเฟรมก่อน
+    แล้ววาดใหม่และส่งขึ้นจอ (pygame.display.update) เฉพาะพื้นที่ที่เปลี่ยน
+    วาดใหม่ทั้งจอเฉพาะครั้งแรก, หลังปรับขนาดหน้าจอ หรือหลังเปลี่ยนหน้าจอ (invalidate)
+    """
+    def __init__(self):
+        self.items = {}
+        self.full_redraw = True
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def present(self, surface, items, profiler=None):
         """
-        (Constructor) เริ่มต้นค่าตัวแปร, โหลดสถิติ, โหลดเสียง, และตั้งค่าเกมเริ่มต้น
+        วาดรายการ items ลง surface (ถ้ามี profiler จะจับเวลาการวาดแยกตามชนิดของรายการ)
+        คืน list ของพื้นที่ที่วาดใหม่ หรือ None ถ้าวาดใหม่ทั้งจอ
         """
-        self.WORD_LENGTH = 5
-        self.MAX_GUESSES = 6
-        self.stats_file = stats_file
-        self.stats = self._load_stats()
-        self.settings = load_settings()
-        self.word_bank, self.target_word = [], ""
-        self.guesses, self.results, self.current_guess = [], [], ""
-        self.game_over, self.win = False, False
-        self.current_mode = 'classic'
-        self.message, self.message_timer = "", 0
-        self.keyboard_colors = {chr(c): "KEY_DEFAULT" for c in range(ord('a'), ord('z') + 1)}
-        self.key_rects = {} 
-        self.sounds = {}
+        new_items = {key: (rect, sig) for key, rect, sig, _ in items}
+
+        if self.full_redraw:
+            surface.fill(BG_COLOR)
+            for key, _, _, draw in items:
+                draw(surface)
+                if profiler: profiler.mark(PROFILE_SECTIONS.get(key[0], "layout"))
+            pygame.display.flip()
+            if profiler: profiler.mark("flip")
+            self.items, self.full_redraw = new_items, False
+            return None
+
+        # หาพื้นที่ที่เปลี่ยน (ทั้งตำแหน่งเก่าและใหม่ของสิ่งที่เปลี่ยน/หายไป/เพิ่มมา)
+        dirty = []
+        for key, (rect, sig) in new_items.items():
+            old = self.items.get(key)
+            if old is None:
+                dirty.append(rect)
+            elif old[1] != sig or old[0] != rect:
+                dirty.append(old[0].union(rect))
+        for key, (rect, _) in self.items.items():
+            if key not in new_items:
+                dirty.append(rect)
+        self.items = new_items
+        if profiler: profiler.mark("layout")
+        if not dirty:
+            return dirty
+
+        # ล้างเฉพาะพื้นที่ที่เปลี่ยน แล้ววาดทุกอย่างที่ทับพื้นที่นั้นใหม่ (จำกัดการวาดด้วย clip)
+        for area in dirty:
+            surface.set_clip(area)
+            surface.fill(BG_COLOR)
+            for key, rect, _, draw in items:
+                if rect.colliderect(area):
+                    draw(surface)
+                    if profiler: profiler.mark(PROFILE_SECTIONS.get(key[0], "layout"))
+        surface.set_clip(None)
+        pygame.display.update(dirty)
+        if profiler: profiler.mark("flip")
+        return dirty
+
+# เปิด/ปิดการวาดแบบ dirty rectangle ของทุกหน้าจอ (False = วาดใหม่ทั้งจอทุกเฟรมแบบเดิม)
+DIRTY_RECT_RENDERING = True
+# วิธีวาดหน้าเกม: "software" = blit ลง SCREEN แล้ว flip, "texture" = SDL2 Renderer (renderer.TextureTarget)
+# ถ้าเปิด texture ไม่ได้จะกลับไปใช้ software เอง
+RENDER_BACKEND = os.environ.get("WORDLE_RENDERER", "software")
+
+# --- การปรับขนาดหน้าต่าง ---
+
+MIN_WIDTH, MIN_HEIGHT = 500, 750
+# ขนาดหน้าต่างต้องนิ่งนานเท่านี้ (มิลลิวินาที) ก่อนสร้างฟอนต์และ layout ใหม่
+RESIZE_SETTLE_MS = 150
+
+class ResizeCoordinator:
+    """
+    รวม VIDEORESIZE ที่มาเป็นชุดตอนลากขอบหน้าต่างให้เหลือการปรับขนาดครั้งเดียว
+    ระหว่างลาก แสดงเฟรมล่าสุดที่ย่อ/ขยายให้เต็มหน้าต่าง (ไม่ set_mode และไม่สร้างฟอนต์ใหม่)
+    เมื่อขนาดนิ่งครบ settle_ms จึง set_mode และ update_fonts ครั้งเดียว
+    ฟอนต์, layout และแคชต่าง ๆ จึงถูกสร้างใหม่ครั้งเดียวที่ขนาดสุดท้าย
+    """
+    def __init__(self, settle_ms=RESIZE_SETTLE_MS):
+        self.settle_ms = settle_ms
+        self.pending = None # ขนาดล่าสุดที่ขอระหว่างลาก (None = ไม่ได้ลากอยู่)
+        self.changed_at = 0
+        self.last_frame = None # สำเนาของเฟรมล่าสุดที่แสดง (ใช้ทำภาพ preview)
+        self.preview_size = None
+        self.previews = 0
+        self.rebuilds = 0
+
+    def remember(self, surface, rects=None):
+        """
+        เก็บสำเนาเฟรมที่เพิ่งแสดง (rects = เฉพาะพื้นที่ที่เปลี่ยน, None = ทั้งจอ)
+        เนื้อหาของหน้าจอหายทันทีที่หน้าต่างเปลี่ยนขนาด จึงต้องเก็บไว้ก่อน
+        """
+        if self.pending is not None:
+            return # ระหว่างลาก บนจอเป็นภาพ preview ไม่ใช่เฟรมจริง
+        if self.last_frame is None or self.last_frame.get_size() != surface.get_size():
+            self.last_frame = surface.copy()
+        elif rects is None:
+            self.last_frame.blit(surface, (0, 0))
+        else:
+            for rect in rects:
+                self.last_frame.blit(surface, rect, rect)
+
+    def request(self, size):
+        """
+        บันทึกขนาดใหม่ที่ขอ (จาก VIDEORESIZE หรือขนาดหน้าต่างที่เปลี่ยน) ยังไม่ปรับจริง
+        """
+        if size != self.pending:
+            self.pending = size
+            self.changed_at = pygame.time.get_ticks()
+
+    def wait_timeout(self, timeout):
+        """
+        เวลารอ event สูงสุด: ระหว่างลากต้องตื่นมาทันเวลาที่ขนาดนิ่ง
+        """
+        if self.pending is None:
+            return timeout
+        remaining = self.settle_ms - (pygame.time.get_ticks() - self.changed_at)
+        return max(1, min(timeout, remaining))
+
+    def preview(self, surface):
+        """
+        วาดเฟรมล่าสุดแบบย่อ/ขยายให้เต็ม surface (วาดเฉพาะเมื่อขนาดหน้าต่างเปลี่ยน)
+        """
+        size = surface.get_size()
+        if size == self.preview_size:
+            return
+        self.preview_size = size
+        if self.last_frame is not None:
+            pygame.transform.scale(self.last_frame, size, surface)
+        else:
+            surface.fill(BG_COLOR)
+        pygame.display.flip()
+        self.previews += 1
 
-        # ตัวแปรสำหรับโหมดจับเวลา
-        self.timer_start_time = 0
-        self.time_limit = 30000 # 30 วินาที (ในหน่วยมิลลิวินาที)
-        self.time_remaining = 30.0 # สำหรับแสดงผล
+    def poll(self, set_mode=True):
+        """
+        ถ้าขนาดนิ่งครบ settle_ms แล้ว ใช้ขนาดใหม่ (ไม่ต่ำกว่า MIN_WIDTH x MIN_HEIGHT) แล้วคืน True
+        set_mode=False สำหรับหน้าต่างที่ไม่ได้วาดผ่าน pygame.display (TextureTarget)
+        """
+        global SCREEN, WIDTH, HEIGHT
+        if self.pending is None or pygame.time.get_ticks() - self.changed_at < self.settle_ms:
+            return False
+        WIDTH, HEIGHT = max(self.pending[0], MIN_WIDTH), max(self.pending[1], MIN_HEIGHT)
+        self.pending = self.preview_size = None
+        if set_mode:
+            SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        update_fonts(WIDTH, HEIGHT)
+        self.rebuilds += 1
+        return True
+
+RESIZE = ResizeCoordinator()
+
+# --- ตัวจับเวลาต่อเฟรม (F3 = overlay p50/p95/p99, F4 = เริ่ม/หยุดบันทึก CSV) ---
 
-        # ฟังก์ชันย่อยสำหรับโหลดเสียง
-        def load_sound(path):
+PROFILER = FrameProfiler()
+# ถ้ากำหนด path ไว้ จะเริ่มบันทึก CSV ตั้งแต่ SceneManager เริ่มลูปครั้งแรก
+PROFILE_CSV = os.environ.get("WORDLE_PROFILE_CSV")
+# ชนิดของรายการใน frame_items -> ส่วนของเฟรมใน profiler
+PROFILE_SECTIONS = {"header": "header", "tile": "board", "key": "keyboard", "message": "message",
+                    "end": "message", "gear": "icons", "return": "icons", "title": "menu",
+                    "button": "menu", "text": "menu", "slider": "menu", "profiler": "overlay"}
+_PROFILER_OVERLAY = None # (key, Surface) ของ overlay ล่าสุด
+
+def profiler_item(surface):
+    """
+    overlay ของ profiler เป็นรายการสำหรับ DirtyRectRenderer หรือ None ถ้าปิดอยู่
+    Surface ถูกสร้างใหม่เฉพาะเมื่อข้อความสรุปหรือขนาดจอเปลี่ยน
+    """
+    global _PROFILER_OVERLAY
+    if not PROFILER.overlay:
+        return None
+    lines = PROFILER.summary_lines()
+    key = (PROFILER.summary_version, surface.get_size())
+    if _PROFILER_OVERLAY is None or _PROFILER_OVERLAY[0] != key:
+        rendered = [render_text("key", line, COLORS["WHITE"]) for line in lines]
+        line_h = max(r.get_height() for r in rendered)
+        overlay = pygame.Surface((max(r.get_width() for r in rendered) + 16, line_h * len(rendered) + 12))
+        overlay.fill(COLORS["BLACK"])
+        for i, r in enumerate(rendered):
+            overlay.blit(r, (8, 6 + i * line_h))
+        _PROFILER_OVERLAY = (key, overlay)
+    overlay = _PROFILER_OVERLAY[1]
+    rect = overlay.get_rect(topright=(surface.get_width() - 10, 10))
+    return (("profiler",), rect, key, lambda s: s.blit(overlay, rect))
+
+# --- ตัวจัดลำดับเสียงตอนจบเกม ---
+
+SFX_START_EVENT = pygame.USEREVENT + 1 # ครบเวลาหน่วงก่อนเล่นเสียง ชนะ/แพ้
+SFX_END_EVENT = pygame.USEREVENT + 2   # เสียง ชนะ/แพ้ เล่นจบ (endevent ของ Channel)
+END_SFX_DELAY = 250 # มิลลิวินาทีหลังแสดงหน้าจบเกมก่อนเล่นเสียง
+
+class AudioScheduler:
+    """
+    จัดลำดับเสียงตอนจบเกมแบบไม่บล็อกลูปหลัก:
+    หยุด BGM -> (รอ END_SFX_DELAY) -> เล่นเสียง ชนะ/แพ้ -> เล่น BGM ต่อจากตำแหน่งเดิม
+    การรอใช้ pygame.time.set_timer และ endevent ของ mixer Channel แทน pygame.time.wait
+    SceneManager ส่งทุก event เข้า handle_event
+    """
+    def __init__(self):
+        self.state = None # None, "delay" (รอเริ่มเสียง) หรือ "sfx" (กำลังเล่นเสียง)
+        self.sound = None
+        self.channel = None
+        self.settings = None
+        self.resume_pos = None # ตำแหน่ง BGM ที่จะเล่นต่อ (วินาที)
+        self.music_offset = 0.0 # ตำแหน่งเริ่มของ BGM ครั้งล่าสุด (get_pos นับจากจุดนี้)
+
+    def play_music(self, start=0.0):
+        """
+        เล่น BGM วนซ้ำตั้งแต่ตำแหน่ง start (วินาที)
+        """
+        try:
+            if start > 0:
+                pygame.mixer.music.play(-1, start) # เล่นต่อจากจุดเดิม
+            else:
+                pygame.mixer.music.play(-1)
+            self.music_offset = start
+        except Exception:
             try:
-                return pygame.mixer.Sound(path)
+                pygame.mixer.music.play(-1) # พยายามเล่นใหม่
+                self.music_offset = 0.0
+            except Exception:
+                pass
+
+    def music_position(self):
+        """
+        ตำแหน่งปัจจุบันของ BGM (วินาที) หรือ None ถ้าไม่ได้เล่นอยู่
+        """
+        try:
+            pos = pygame.mixer.music.get_pos()
+        except Exception:
+            return None
+        if pos < 0:
+            return None
+        return self.music_offset + pos / 1000.0
+
+    def play_end_sfx(self, sound, settings, delay=END_SFX_DELAY):
+        """
+        เริ่มลำดับเสียงจบเกม แล้วคืนค่าทันที (ขั้นตอนถัดไปเกิดจาก event ใน handle_event)
+        settings คือ dict การตั้งค่าของเกม (ดู sound_enabled ตอนเล่นและตอนเล่น BGM ต่อ)
+        """
+        self.cancel()
+        self.resume_pos = self.music_position() # จำตำแหน่ง BGM
+        try:
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
+        self.sound = sound
+        self.settings = settings
+        self.state = "delay"
+        if delay > 0:
+            pygame.time.set_timer(SFX_START_EVENT, delay, 1)
+        else:
+            self._start_sfx()
+
+    def _start_sfx(self):
+        # เล่นเสียง ชนะ/แพ้ ถ้าเปิดเสียงอยู่ ไม่เช่นนั้นข้ามไปเล่น BGM ต่อเลย
+        channel = None
+        if self.settings.get("sound_enabled", True) and self.sound:
+            try:
+                channel = self.sound.play()
             except Exception as e:
-                print(f"Could not load sound {path}: {e}")
-                return None
+                print(f"Could not play end game sound: {e}")
+        if channel is None:
+            self._resume_music()
+            return
+        self.channel = channel
+        self.state = "sfx"
+        channel.set_endevent(SFX_END_EVENT)
+        # กันกรณีไม่ได้รับ endevent (เช่น channel ถูกแย่งไปเล่นเสียงอื่น)
+        pygame.time.set_timer(SFX_END_EVENT, int(self.sound.get_length() * 1000) + 500, 1)
+
+    def _resume_music(self):
+        # กลับมาเล่น BGM ต่อ (ถ้าเปิดเสียงอยู่ และยังไม่มีใครสั่งเล่นใหม่ระหว่างนั้น)
+        if self.channel is not None:
+            self.channel.set_endevent()
+        pygame.time.set_timer(SFX_END_EVENT, 0)
+        resume = self.settings.get("sound_enabled", True)
+        self.state = None
+        self.channel = None
+        self.sound = None
+        try:
+            busy = pygame.mixer.music.get_busy()
+        except Exception:
+            busy = False
+        if resume and not busy:
+            self.play_music(self.resume_pos or 0.0)
 
-        # โหลดเสียง SFX
-        self.sounds = {
-            "win": load_sound(os.path.join("sounds", "win.mp3")),
-            "lose": load_sound(os.path.join("sounds", "lose.mp3")),
-            "type": load_sound(os.path.join("sounds", "type.wav"))
-        }
-        
-        # โหลดเสียง BGM
+    def handle_event(self, event):
+        """
+        เลื่อนลำดับเสียงตาม event (คืน True ถ้าเป็น event ของตัวจัดลำดับเสียง)
+        """
+        if event.type == SFX_START_EVENT:
+            if self.state == "delay":
+                self._start_sfx()
+            return True
+        if event.type == SFX_END_EVENT:
+            if self.state == "sfx":
+                self._resume_music()
+            return True
+        return False
+
+    def cancel(self):
+        """
+        ยกเลิกลำดับเสียงที่ค้างอยู่ (ไม่เล่น BGM ต่อ)
+        """
+        pygame.time.set_timer(SFX_START_EVENT, 0)
+        pygame.time.set_timer(SFX_END_EVENT, 0)
+        if self.channel is not None:
+            self.channel.set_endevent()
+        self.state = None
+        self.channel = None
+        self.sound = None
+
+AUDIO = AudioScheduler()
+
+# --- ตัวโหลดเสียง ---
+
+SOUND_DIR = "sounds"
+SOUND_FILES = {"win": "win.mp3", "lose": "lose.mp3", "type": "type.wav"}
+MUSIC_FILE = "bg_music.mp3"
+# เก็บเสียงที่ถอดรหัสแล้ว (PCM) ไว้ข้างไฟล์ต้นฉบับ การเปิดเกมครั้งถัดไปจะไม่ต้องถอด MP3 ใหม่
+PCM_CACHE = True
+
+class SoundLoader:
+    """
+    โหลดเสียง SFX และ BGM บน thread เบื้องหลัง เพื่อให้เมนูแสดงได้ทันที
+    ถ้าเสียงไหนถูกเล่นก่อนโหลดเสร็จ get จะโหลดเสียงนั้นทันที (lazy) แทน
+    เก็บเวลาที่ใช้โหลดแต่ละไฟล์ไว้ใน load_times
+    """
+    def __init__(self, files=SOUND_FILES, music_file=MUSIC_FILE, directory=SOUND_DIR, pcm_cache=PCM_CACHE):
+        self.files = dict(files)
+        self.music_file = music_file
+        self.directory = directory
+        self.pcm_cache = pcm_cache
+        self.sounds = {}
+        self.load_times = {} # name -> (มิลลิวินาที, วิธีโหลด)
+        self.volume = None
+        self.music_loaded = False
+        self._locks = {name: threading.Lock() for name in self.files}
+        self._thread = None
+
+    def start(self, on_music_ready=None):
+        """
+        เริ่มโหลดบน thread เบื้องหลัง (BGM ก่อน แล้วตามด้วย SFX)
+        on_music_ready จะถูกเรียกเมื่อโหลด BGM สำเร็จ
+        """
+        self._thread = threading.Thread(target=self._load_all, args=(on_music_ready,),
+                                        name="sound-loader", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout=None):
+        # รอให้ thread โหลดเสียงทำงานเสร็จ
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _load_all(self, on_music_ready):
+        start = time.perf_counter()
+        ready = init_mixer()
+        self.load_times["mixer"] = ((time.perf_counter() - start) * 1000, "init" if ready else "failed")
+        if not ready:
+            print(self.report())
+            return
+        if self.load_music() and on_music_ready:
+            on_music_ready()
+        for name in self.files:
+            self.get(name)
+        print(self.report())
+
+    def load_music(self):
+        """
+        โหลดไฟล์ BGM ให้ pygame.mixer.music (คืน True ถ้าสำเร็จ)
+        """
+        start = time.perf_counter()
         try:
-            pygame.mixer.music.load(os.path.join("sounds", "bg_music.mp3"))
+            pygame.mixer.music.load(os.path.join(self.directory, self.music_file))
+            self.music_loaded = True
         except Exception as e:
             print(f"Could not load bg music: {e}")
+        self.load_times["music"] = ((time.perf_counter() - start) * 1000, "stream")
+        return self.music_loaded
+
+    def _pcm_path(self, path):
+        # ชื่อไฟล์ PCM ผูกกับรูปแบบเสียงของ mixer (ความถี่, format, จำนวนช่อง)
+        mixer_format = pygame.mixer.get_init()
+        if not self.pcm_cache or mixer_format is None:
+            return None
+        freq, fmt, channels = mixer_format
+        return f"{path}.{freq}_{fmt}_{channels}.pcm"
+
+    def _load(self, name):
+        # ใช้ PCM ที่ถอดไว้แล้วถ้ายังใหม่กว่าไฟล์ต้นฉบับ ไม่เช่นนั้นถอดรหัสแล้วเขียน PCM ไว้
+        path = os.path.join(self.directory, self.files[name])
+        start = time.perf_counter()
+        sound, source = None, "decode"
+        try:
+            pcm_path = self._pcm_path(path)
+            if pcm_path and os.path.exists(pcm_path) and os.path.getmtime(pcm_path) >= os.path.getmtime(path):
+                with open(pcm_path, 'rb') as f:
+                    sound = pygame.mixer.Sound(buffer=f.read())
+                source = "pcm cache"
+            else:
+                sound = pygame.mixer.Sound(path)
+                if pcm_path:
+                    self._write_pcm(pcm_path, sound.get_raw())
+            if self.volume is not None:
+                sound.set_volume(self.volume)
+        except Exception as e:
+            print(f"Could not load sound {path}: {e}")
+            sound, source = None, "failed"
+        self.load_times[name] = ((time.perf_counter() - start) * 1000, source)
+        return sound
+
+    def _write_pcm(self, pcm_path, data):
+        try:
+            tmp_path = pcm_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, pcm_path)
+        except OSError as e:
+            print(f"Could not write PCM cache {pcm_path}: {e}")
+
+    def get(self, name):
+        """
+        คืน Sound ของ name (โหลดทันทีถ้ายังไม่ได้โหลด) หรือ None ถ้าไม่มีเสียงนี้
+        """
+        if name in self.sounds:
+            return self.sounds[name]
+        lock = self._locks.get(name)
+        if lock is None or pygame.mixer.get_init() is None:
+            return None # ยังไม่มีเสียงนี้ หรือ mixer ยังไม่พร้อม (ลองใหม่ครั้งหน้า)
+        with lock:
+            if name not in self.sounds:
+                self.sounds[name] = self._load(name)
+        return self.sounds[name]
+
+    def set_volume(self, volume):
+        """
+        ตั้งความดังของ SFX ที่โหลดแล้ว (เสียงที่โหลดทีหลังจะใช้ค่านี้ตอนโหลด)
+        """
+        self.volume = volume
+        for sound in list(self.sounds.values()):
+            if sound:
+                sound.set_volume(volume)
+
+    def report(self):
+        """
+        ข้อความสรุปเวลาที่ใช้โหลดแต่ละไฟล์
+        """
+        parts = [f"{name} {ms:.1f} ms ({source})" for name, (ms, source) in self.load_times.items()]
+        return "Sound load times: " + ", ".join(parts)
+
+# --- คลาสหลักของเกม ---
+
+class WordleGamePygame(WordleEngine):
+    """
+    คลาสหลักของเกมฝั่งหน้าจอ pygame
+    ใช้ตรรกะและสถานะเกมจาก WordleEngine และเพิ่มการโหลดเสียง, สถิติ, การวาด, และการจัดการเหตุการณ์
+    """
+    
+    def __init__(self, stats_file='wordle_stats_en.json'):
+        """
+        (Constructor) เริ่มต้นค่าตัวแปร, โหลดสถิติ, โหลดเสียง, และตั้งค่าเกมเริ่มต้น
+        """
+        super().__init__()
+        init_display()
+        self.stats_file = stats_file
+        self.store = GameLogStore(stats_file)
+        self.stats = self.store.stats
+        self.settings = load_settings()
+        # เขียน settings.json แบบหน่วงเวลา (การลากแถบเลื่อนไม่เขียนไฟล์ทุกครั้งที่ขยับ)
+        self.settings_writer = DebouncedJsonWriter(SETTINGS_FILE, lambda: self.settings)
+        # ตำแหน่งกล่อง/ปุ่มของหน้าเกม คำนวณใหม่เฉพาะเมื่อขนาดหน้าจอเปลี่ยน
+        self.layouts = LayoutCache()
+        # sprite ของกล่อง/ปุ่มทุกสถานะที่ขนาดปัจจุบัน (สร้างใหม่เบื้องหลังเมื่อขนาดเปลี่ยน)
+        self.atlas = SpriteAtlas(COLORS, BG_COLOR)
+        self._atlas_layout = None
+        self.render_target = None # TextureTarget ขณะหน้าเกมใช้ backend แบบ texture
+
+        # โหลดเสียง SFX และ BGM เบื้องหลัง (เมนูแสดงได้ทันทีโดยไม่ต้องรอถอดรหัส MP3)
+        self.sounds = SoundLoader()
 
         # ใช้การตั้งค่าเสียง
         self.apply_volume_settings()
-        
+        self.sounds.start(on_music_ready=self._start_music)
+
+    def _start_music(self):
+        """
+        เริ่มเล่น BGM เมื่อโหลดเสร็จ (ถ้าเปิดเสียงอยู่)
+        """
+        self.apply_volume_settings() # mixer เพิ่งพร้อม ตั้งความดังอีกครั้ง
         if self.settings.get("sound_enabled", True):
-            try:
-                pygame.mixer.music.play(-1)
-            except Exception: pass
+            AUDIO.play_music()
 
     def apply_volume_settings(self):
         """
@@ -245,29 +876,22 @@ class WordleGamePygame:
         try:
             pygame.mixer.music.set_volume(bg_vol)
         except Exception: pass
-        for sname in ("win", "lose", "type"):
-            if self.sounds.get(sname):
-                self.sounds[sname].set_volume(fx_vol)
+        self.sounds.set_volume(fx_vol)
 
     def play_sound(self, name):
         """
         เล่นเสียงเอฟเฟกต์ (เช่น ชนะ, แพ้, พิมพ์) ถ้าเสียงเปิดอยู่
         """
-        if self.settings.get("sound_enabled", True) and name in self.sounds and self.sounds[name]:
-            self.sounds[name].play()
+        if self.settings.get("sound_enabled", True):
+            sound = self.sounds.get(name)
+            if sound:
+                sound.play()
 
-    def reset_game_state(self):
+    def now(self):
         """
-        รีเซ็ตสถานะเกม (การเดา, ผลลัพธ์, คีย์บอร์ด) เพื่อเริ่มเกมใหม่
+        ใช้เวลาของ pygame กับตัวจับเวลาและข้อความแจ้งเตือน
         """
-        self.guesses, self.results, self.current_guess = [], [], ""
-        self.game_over, self.win = False, False
-        self.message = ""
-        self.keyboard_colors = {chr(c): "KEY_DEFAULT" for c in range(ord('a'), ord('z') + 1)}
-        self.key_rects = {} 
-        # รีเซ็ตตัวจับเวลา
-        self.timer_start_time = 0
-        self.time_remaining = 30.0
+        return pygame.time.get_ticks()
 
     def set_message(self, text, color_name="WHITE"):
         """
@@ -277,361 +901,167 @@ class WordleGamePygame:
             color = COLORS.get(color_name, COLORS["WHITE"])
         else:
             color = color_name
-        self.message = (text, color)
-        self.message_timer = pygame.time.get_ticks()
+        super().set_message(text, color)
 
-    def _load_words_from_file(self, filename):
+    def update_stats(self, counted=True):
         """
-        โหลดรายการคำศัพท์จากไฟล์ .txt สำหรับโหมดเกมที่เลือก
+        บันทึกเกมที่จบแล้วลง log และอัปเดตสถิติ (เล่น, ชนะ/แพ้, streak)
+        counted=False จะเก็บเกมไว้ใน log แต่ไม่นับในสถิติ (เช่น ชนะในโหมด Unlimited)
         """
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                words = [line.strip().lower() for line in f if len(line.strip()) == self.WORD_LENGTH and line.strip().isalpha()]
-            if not words:
-                print(f"Warning: Word file '{filename}' is empty or invalid. Using default list.")
-                self.word_bank = ['apple', 'train', 'audio', 'house', 'world']
-            else:
-                self.word_bank = words
-        except FileNotFoundError:
-            print(f"Warning: Word file '{filename}' not found. Using default list and creating file.")
-            self.word_bank = ['apple', 'train', 'audio', 'house', 'world']
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    pass 
-            except Exception as e:
-                print(f"Could not create file {filename}: {e}")
+        record = self.game_record()
+        record["counted"] = counted
+        self.store.record_game(record)
 
-    def _load_stats(self):
+    def end_screen_items(self, surface):
         """
-        โหลดสถิติการเล่น (เล่น, ชนะ, ฯลฯ) จากไฟล์ JSON
+        รายการสิ่งที่วาดบนหน้าจอเมื่อจบเกม (แสดงข้อความ ชนะ/แพ้ และคำตอบ)
+        (แก้ไข) วาดบนพื้นหลังสีทึบ ไม่วาดบอร์ด, คีย์บอร์ด และไอคอน
         """
-        if not os.path.exists(self.stats_file):
-            return {"played": 0, "wins": 0, "current_streak": 0, "max_streak": 0, "guess_dist": {}}
-        try:
-            with open(self.stats_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {"played": 0, "wins": 0, "current_streak": 0, "max_streak": 0, "guess_dist": {}}
+        width, height = surface.get_size()
+        end_text_str, color = self.message
+        
+        # 🌟 (เพิ่ม) ตรวจสอบโหมด Unlimited เพื่อเพิ่มข้อความ
+        if self.win and self.current_mode == 'unlimited':
+            guess_count = len(self.guesses)
+            end_text_str = f"YOU WIN! ({guess_count} guesses)"
+        
+        # แสดงข้อความผลลัพธ์ (ชนะ/แพ้/หมดเวลา)
+        lines = [("result", "end_game", end_text_str, color, (width / 2, height / 2 - 30))]
+        # แสดงคำตอบถ้าแพ้
+        if not self.win:
+            lines.append(("answer", "message", f"The word was: {self.target_word.upper()}", COLORS["WHITE"],
+                          (width / 2, height / 2 + 15)))
+        # แสดงข้อความให้กลับเมนู
+        lines.append(("prompt", "message", "Press Enter to return to menu", COLORS["WHITE"], (width / 2, height - 50)))
+
+        items = []
+        for name, role, text, text_color, center in lines:
+            text_surf = render_text(role, text, text_color)
+            text_rect = text_surf.get_rect(center=center)
+            items.append((("end", name), text_rect, (text, text_color),
+                          lambda s, t=text_surf, r=text_rect: s.blit(t, r)))
+        return items
 
-    def _save_stats(self):
+    def _handle_end_game_sfx(self, sound_name):
         """
-        บันทึกสถิติการเล่นปัจจุบันลงไฟล์ JSON
+        จัดการการเล่นเสียงเมื่อจบเกม (หยุด BGM ชั่วคราว, เล่นเสียง ชนะ/แพ้, เล่น BGM ต่อ)
+        ส่งต่อให้ AUDIO ทำงานผ่าน event จึงไม่หยุดลูปหลักระหว่างเล่นเสียง
         """
-        try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            print(f"Could not save stats: {e}")
+        AUDIO.play_end_sfx(self.sounds.get(sound_name), self.settings)
 
-    def update_stats(self):
+    def handle_enter(self):
         """
-        อัปเดตสถิติหลังจบเกม (เพิ่มการเล่น, ชนะ/แพ้, streak)
+        ประมวลผลเมื่อผู้เล่นกด Enter (ตรวจสอบคำเดา, อัปเดตบอร์ด, ตรวจสอบ ชนะ/แพ้)
         """
-        self.stats["played"] += 1
-        if self.win:
-            self.stats["wins"] += 1
-            self.stats["current_streak"] += 1
-            self.stats["max_streak"] = max(self.stats["max_streak"], self.stats["current_streak"])
-            guess_count = str(len(self.guesses))
-            self.stats["guess_dist"][guess_count] = self.stats["guess_dist"].get(guess_count, 0) + 1
-        else:
-            self.stats["current_streak"] = 0
-        self._save_stats()
+        outcome = self.submit_guess()
+        
+        if outcome == "win":
+            self._handle_end_game_sfx("win") 
+            
+            # ชนะในโหมด Unlimited เก็บไว้ใน log แต่ไม่นับในสถิติ
+            self.update_stats(counted=self.current_mode != 'unlimited')
 
-    def check_guess(self, guess):
+        elif outcome == "lose":
+            self._handle_end_game_sfx("lose") 
+            self.update_stats()
+
+    def layout(self, surface):
         """
-        ตรวจสอบคำเดาเทียบกับคำตอบ และคืนผลลัพธ์ (เขียว, เหลือง, เทา)
+        ตำแหน่งกล่อง, ปุ่ม และไอคอนทั้งหมดสำหรับขนาดของ surface (จาก LayoutCache)
         """
-        result = ["GRAY"] * self.WORD_LENGTH
-        target_counts = Counter(self.target_word)
-        
-        # ตรวจสอบตัวที่ถูก (สีเขียว) ก่อน
-        for i, letter in enumerate(guess):
-            if letter == self.target_word[i]:
-                result[i] = "GREEN"
-                target_counts[letter] -= 1
-        
-        # ตรวจสอบตัวที่เกือบถูก (สีเหลือง)
-        for i, letter in enumerate(guess):
-            if result[i] != "GREEN" and letter in target_counts and target_counts[letter] > 0:
-                result[i] = "YELLOW"
-                target_counts[letter] -= 1
-        
-        # อัปเดตสีคีย์บอร์ด
-        for i, letter in enumerate(guess):
-            if 'a' <= letter <= 'z':
-                if result[i] == "GREEN":
-                    self.keyboard_colors[letter] = "GREEN"
-                elif result[i] == "YELLOW" and self.keyboard_colors[letter] != "GREEN":
-                    self.keyboard_colors[letter] = "YELLOW"
-                elif self.keyboard_colors[letter] == "KEY_DEFAULT":
-                    self.keyboard_colors[letter] = "KEY_USED"
-        return result
-
-    def is_valid_guess(self, guess):
-        """
-        ตรวจสอบว่าคำเดาถูกต้องตามรูปแบบหรือไม่ (เช่น ความยาว)
-        """
-        if len(guess) != self.WORD_LENGTH:
-            self.set_message(f"Guess must be {self.WORD_LENGTH} letters", "RED")
-            return False
-        # (สามารถเพิ่มการตรวจสอบว่าคำมีใน word bank หรือไม่ ที่นี่)
-        return True
+        layout = self.layouts.get(surface.get_size(), self.WORD_LENGTH, self.MAX_GUESSES)
+        if layout is not self._atlas_layout:
+            self._atlas_layout = layout
+            self.request_sprites(layout)
+        return layout
 
-    def _render_end_screen(self):
+    def request_sprites(self, layout):
         """
-        วาดหน้าจอเมื่อจบเกม (แสดงข้อความ ชนะ/แพ้ และคำตอบ)
-        (แก้ไข) จะวาดทับพื้นหลังสีทึบ และไม่แสดงไอคอน
+        ขอ sprite atlas สำหรับขนาดกล่องและปุ่มของ layout (ใช้ฟอนต์ปัจจุบัน)
         """
-        try:
-            # 🌟 (แก้ไข) เติมสีพื้นหลังทึบ (ไม่วาดบอร์ดหรือคีย์บอร์ด)
-            SCREEN.fill(BG_COLOR) 
-            
-            end_text_str, color = self.message
-            
-            # 🌟 (เพิ่ม) ตรวจสอบโหมด Unlimited เพื่อเพิ่มข้อความ
-            if self.win and self.current_mode == 'unlimited':
-                guess_count = len(self.guesses)
-                end_text_str = f"YOU WIN! ({guess_count} guesses)"
-            
-            # แสดงข้อความผลลัพธ์ (ชนะ/แพ้/หมดเวลา)
-            end_text_surf = FONTS["end_game"].render(end_text_str, True, color)
-            SCREEN.blit(end_text_surf, end_text_surf.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 30)))
-            
-            # แสดงคำตอบถ้าแพ้
-            if not self.win:
-                answer_surf = FONTS["message"].render(f"The word was: {self.target_word.upper()}", True, COLORS["WHITE"])
-                SCREEN.blit(answer_surf, answer_surf.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 15)))
-                
-            # แสดงข้อความให้กลับเมนู
-            prompt_surf = FONTS["message"].render("Press Enter to return to menu", True, COLORS["WHITE"])
-            SCREEN.blit(prompt_surf, prompt_surf.get_rect(center=(WIDTH / 2, HEIGHT - 50)))
-            
-            # 🌟 (แก้ไข) ลบการวาด self.draw_settings_gear(SCREEN)
-            # 🌟 (แก้ไข) ลบการวาด self.draw_return_button(SCREEN) 
-            
-            pygame.display.flip() # 🌟 (สำคัญ) flip ภายในฟังก์ชันนี้
-        except Exception as e:
-            print(f"Error rendering end screen: {e}")
+        labels = tuple((label, key_rect.size, ("KEY_DEFAULT",) if wide else KEY_STATES)
+                       for _, key_rect, label, wide in layout.keys)
+        self.atlas.request(layout.tiles[0][0].size, labels, FONTS["letter"], FONTS["key"])
 
-    def _handle_end_game_sfx(self, sound_name):
+    def board_row(self, i):
         """
-        จัดการการเล่นเสียงเมื่อจบเกม (หยุด BGM ชั่วคราว, เล่นเสียง ชนะ/แพ้)
+        (คำ, ผลลัพธ์) ของแถวที่ i บนกระดาน โดยผลลัพธ์เป็น None สำหรับแถวที่ยังไม่ได้ตรวจ
+        คืน None ถ้าแถวนี้ไม่ต้องวาด
         """
-        try:
-            bg_pos = pygame.mixer.music.get_pos() # จำตำแหน่ง BGM
-            pygame.mixer.music.stop()
-        except Exception:
-            bg_pos = None
-            
-        # เล่นเสียง ชนะ/แพ้
-        if self.settings.get("sound_enabled", True) and self.sounds.get(sound_name):
-            self.sounds[sound_name].play()
-            pygame.time.wait(int(self.sounds[sound_name].get_length() * 1000))
-        
-        # กลับมาเล่น BGM ต่อ (ถ้าเปิดเสียงอยู่)
-        if self.settings.get("sound_enabled", True):
-            try:
-                if bg_pos is not None and bg_pos >= 0: 
-                    pygame.mixer.music.play(-1, bg_pos / 1000.0) # เล่นต่อจากจุดเดิม
+        if self.current_mode == 'unlimited' and not self.game_over:
+            # แถวปัจจุบันอยู่บนสุด ตามด้วยประวัติ 5 แถวล่าสุด (ย้อนกลับ)
+            if i == 0:
+                return self.current_guess, None
+            index = len(self.guesses) - i
+            if i > 5 or index < 0:
+                return None
+            return self.guesses[index], self.results[index]
+        if i < len(self.guesses): # แถวที่เดาไปแล้ว
+            return self.guesses[i], self.results[i]
+        if i == len(self.guesses) and not self.game_over: # แถวที่กำลังพิมพ์
+            return self.current_guess, None
+        return "", None # แถวว่าง
+
+    def board_tiles(self, surface):
+        """
+        กล่องตัวอักษรที่ต้องวาด: (แถว, คอลัมน์, Rect, ตัวอักษร, สีกล่อง, มีขอบหรือไม่)
+        รองรับโหมด Unlimited (แสดงเฉพาะ 5 แถวสุดท้าย + แถวปัจจุบัน)
+        """
+        for i, row_rects in enumerate(self.layout(surface).tiles):
+            row = self.board_row(i)
+            if row is None:
+                break
+            word, result = row
+            for j, box in enumerate(row_rects):
+                letter = word[j] if j < len(word) else ""
+                if result:
+                    yield i, j, box, letter, result[j], False
                 else:
-                    pygame.mixer.music.play(-1)
-            except Exception:
-                try:
-                    pygame.mixer.music.play(-1) # พยายามเล่นใหม่
-                except Exception:
-                    pass 
+                    yield i, j, box, letter, "BLACK", True
 
-    def handle_enter(self):
+    def _draw_tile(self, surface, box, letter, color_key, outlined):
         """
-        ประมวลผลเมื่อผู้เล่นกด Enter (ตรวจสอบคำเดา, อัปเดตบอร์ด, ตรวจสอบ ชนะ/แพ้)
+        วาดกล่องตัวอักษรหนึ่งช่อง
         """
-        if self.game_over: # ถ้าเกมจบทแล้ว (เช่น หมดเวลา) ไม่ต้องทำอะไร
+        sprite = self.atlas.tile(letter, color_key, outlined, box.size)
+        if sprite is not None:
+            surface.blit(sprite, box)
             return
-        
-        if self.is_valid_guess(self.current_guess):
-            self.guesses.append(self.current_guess)
-            self.results.append(self.check_guess(self.current_guess))
-            self.current_guess = ""
-            
-            # ตรวจสอบว่าชนะหรือไม่
-            if self.guesses[-1] == self.target_word:
-                self.win = self.game_over = True
-                self.set_message("YOU WIN", "GREEN")
-                
-                self._render_end_screen() 
-                pygame.time.wait(250)     
-                self._handle_end_game_sfx("win") 
-                
-                if self.current_mode != 'unlimited':
-                    self.update_stats()
-
-            # ตรวจสอบว่าแพ้ (เดาครบ 6 ครั้ง) หรือไม่
-            elif len(self.guesses) == self.MAX_GUESSES and self.current_mode != 'unlimited':
-                self.game_over = True
-                self.set_message("LOSE", "RED")
-                
-                self._render_end_screen() 
-                pygame.time.wait(250)     
-                self._handle_end_game_sfx("lose") 
-                
-                if self.current_mode != 'unlimited':
-                    self.update_stats()
-
-    def draw_board(self, surface):
-        """
-        วาดตาราง Wordle (กล่องตัวอักษร) ลงบนหน้าจอ
-        รองรับโหมด Unlimited (แสดงเฉพาะ 5 แถวสุดท้าย + แถวปัจจุบัน)
+        # atlas ของขนาดนี้ยังสร้างไม่เสร็จ: วาดตรง
+        text_surf = render_text("letter", letter.upper(), COLORS["WHITE"]) if letter else None
+        paint_tile(surface, box, text_surf, COLORS[color_key], COLORS["GRAY"] if outlined else None)
+
+    def keyboard_keys(self, surface):
         """
-        width, height = surface.get_size()
-        
-        # --- คำนวณขนาดและตำแหน่งของตาราง ---
-        board_area_h = height * 0.5
-        padding_ratio = 0.1 
-        grid_width_ratio = self.WORD_LENGTH + (self.WORD_LENGTH - 1) * padding_ratio
-        box_size_w = (width * 0.8) / grid_width_ratio 
-        
-        grid_height_ratio = self.MAX_GUESSES + (self.MAX_GUESSES - 1) * padding_ratio
-        box_size_h = board_area_h / grid_height_ratio
-        
-        box_size = min(box_size_w, box_size_h, 80) 
-        padding = box_size * padding_ratio
-        
-        grid_width = (box_size * self.WORD_LENGTH) + (padding * (self.WORD_LENGTH - 1))
-        start_x = (width - grid_width) / 2
-        start_y = height * 0.1 
-        # --- จบการคำนวณ ---
+        ปุ่มของแป้นพิมพ์เสมือน (QWERTY): (ชื่อปุ่ม, Rect, ชื่อสี, ข้อความบนปุ่ม)
+        """
+        colors = self.keyboard_colors
+        for key, key_rect, label, wide in self.layout(surface).keys:
+            yield key, key_rect, "KEY_DEFAULT" if wide else colors.get(key, "KEY_DEFAULT"), label
 
-        # กรณีโหมด Unlimited: แสดงผลต่างออกไป
-        if self.current_mode == 'unlimited' and not self.game_over:
-            guesses_to_show = self.guesses[-1:-6:-1] # 5 แถวสุดท้าย (ย้อนกลับ)
-            results_to_show = self.results[-1:-6:-1]
-            num_history_rows_to_show = min(len(self.guesses), 5)
-            total_rows_to_draw = 1 + num_history_rows_to_show # 1 (แถวปัจจุบัน) + ประวัติ
-
-            for i in range(total_rows_to_draw): 
-                y_pos = start_y + i * (box_size + padding)
-                
-                if i == 0: # วาดแถวปัจจุบัน (แถวบนสุด)
-                    for j in range(self.WORD_LENGTH):
-                        box = pygame.Rect(start_x + j * (box_size + padding), y_pos, box_size, box_size)
-                        letter, l_color = "", COLORS["WHITE"]
-                        
-                        if j < len(self.current_guess):
-                            letter = self.current_guess[j]
-                            pygame.draw.rect(surface, COLORS["BLACK"], box, border_radius=5) 
-                            pygame.draw.rect(surface, COLORS["GRAY"], box, 2, border_radius=5) 
-                            l_color = COLORS["WHITE"] 
-                        else:
-                            pygame.draw.rect(surface, COLORS["BLACK"], box, border_radius=5) 
-                            pygame.draw.rect(surface, COLORS["GRAY"], box, 2, border_radius=5) 
-
-                        if letter:
-                            text_surf = FONTS["letter"].render(letter.upper(), True, l_color)
-                            surface.blit(text_surf, text_surf.get_rect(center=box.center))
-                            
-                else: # วาดแถวประวัติ (5 แถวล่าสุด)
-                    guess_idx = i - 1 
-                    guess = guesses_to_show[guess_idx]
-                    result = results_to_show[guess_idx]
-                    
-                    for j in range(self.WORD_LENGTH):
-                        box = pygame.Rect(start_x + j * (box_size + padding), y_pos, box_size, box_size)
-                        letter, color_key, l_color = guess[j], result[j], COLORS["WHITE"]
-                        pygame.draw.rect(surface, COLORS[color_key], box, border_radius=5)
-                        
-                        text_surf = FONTS["letter"].render(letter.upper(), True, l_color)
-                        surface.blit(text_surf, text_surf.get_rect(center=box.center))
-            return # จบการวาดสำหรับโหมด Unlimited
-
-        # กรณีโหมด Classic/Hard (วาดปกติ 6 แถว)
-        for i in range(self.MAX_GUESSES): 
-            for j in range(self.WORD_LENGTH):
-                box = pygame.Rect(start_x + j * (box_size + padding), start_y + i * (box_size + padding), box_size, box_size)
-                letter, color_key, l_color = "", "BLACK", COLORS["WHITE"] 
-                
-                if i < len(self.guesses): # แถวที่เดาไปแล้ว
-                    letter, color_key, l_color = self.guesses[i][j], self.results[i][j], COLORS["WHITE"]
-                    pygame.draw.rect(surface, COLORS[color_key], box, border_radius=5)
-                elif i == len(self.guesses) and j < len(self.current_guess) and not self.game_over: # แถวที่กำลังพิมพ์
-                    letter = self.current_guess[j]
-                    pygame.draw.rect(surface, COLORS["BLACK"], box, border_radius=5) 
-                    pygame.draw.rect(surface, COLORS["GRAY"], box, 2, border_radius=5) 
-                    l_color = COLORS["WHITE"] 
-                else: # แถวว่าง
-                    pygame.draw.rect(surface, COLORS["BLACK"], box, border_radius=5) 
-                    pygame.draw.rect(surface, COLORS["GRAY"], box, 2, border_radius=5) 
-
-                if letter:
-                    text_surf = FONTS["letter"].render(letter.upper(), True, l_color)
-                    surface.blit(text_surf, text_surf.get_rect(center=box.center))
-
-    def draw_keyboard(self, surface):
-        """
-        วาดแป้นพิมพ์เสมือนจริง (QWERTY) พร้อมสีที่อัปเดตแล้ว
-        เก็บตำแหน่ง (Rect) ของแต่ละปุ่มไว้ใน self.key_rects
-        """
-        self.key_rects.clear() 
-        width, height = surface.get_size()
-        
-        key_rows = [
-            list("qwertyuiop"), 
-            list("asdfghjkl"), 
-            ["ENTER"] + list("zxcvbnm") + ["BACK"]
-        ]
-        
-        # คำนวณขนาดและตำแหน่ง
-        keyboard_area_y = height * 0.25 
-        key_h = (keyboard_area_y / 4) * 0.9 
-        key_w = min(width * 0.08, key_h * 1.3) 
-        padding = key_w * 0.15
-        start_y = height * 0.7 
-
-        for i, row in enumerate(key_rows):
-            # คำนวณความกว้างแถว (ปุ่ม ENTER/BACK กว้างกว่า)
-            total_key_units = 0
-            for key in row:
-                total_key_units += 1 if len(key) == 1 else 1.5 
-            
-            row_width = (total_key_units * key_w) + ((len(row) - 1) * padding)
-            current_x = (width - row_width) / 2
-            current_y = start_y + i * (key_h + padding * 0.8)
-
-            # วาดแต่ละปุ่มในแถว
-            for key in row:
-                current_key_w = key_w
-                color_name = self.keyboard_colors.get(key, "KEY_DEFAULT") 
-                
-                if key == "ENTER" or key == "BACK":
-                    current_key_w = key_w * 1.5
-                    color_name = "KEY_DEFAULT"
-                
-                key_rect = pygame.Rect(current_x, current_y, current_key_w, key_h)
-                self.key_rects[key] = key_rect # เก็บ Rect สำหรับการคลิก
-                
-                pygame.draw.rect(surface, COLORS[color_name], key_rect, border_radius=8)
-                
-                key_text_str = key.upper()
-                if key == "BACK":
-                    key_text_str = "<=" 
-                
-                key_text = FONTS["key"].render(key_text_str, True, COLORS["WHITE"])
-                surface.blit(key_text, key_text.get_rect(center=key_rect.center))
-                
-                current_x += current_key_w + padding
-
-    def draw_header(self, surface):
-        """
-        วาดหัวข้อด้านบน (ชื่อโหมด และ ตัวจับเวลา)
+    def _draw_key(self, surface, key_rect, color_name, label):
+        """
+        วาดปุ่มแป้นพิมพ์หนึ่งปุ่ม
+        """
+        sprite = self.atlas.key(label, color_name, key_rect.size)
+        if sprite is not None:
+            surface.blit(sprite, key_rect)
+            return
+        paint_key(surface, key_rect, render_text("key", label, COLORS["WHITE"]), COLORS[color_name])
+
+    def header_items(self, surface):
+        """
+        คืนข้อความส่วนหัว (ชื่อโหมด และ ตัวจับเวลา) เป็น list ของ (ชื่อ, Surface, Rect, ข้อมูลสำหรับเทียบ)
         """
         width, height = surface.get_size()
+        items = []
         
         # 🌟 (เปลี่ยนชื่อ) อัปเกรด .capitalize()
         # เพื่อให้ 'limited_time' แสดงเป็น 'Limited Time'
         mode_text = f"Mode: {self.current_mode.replace('_', ' ').title()}"
         
-        title_text = FONTS["menu"].render(mode_text, True, COLORS["WHITE"])
-        surface.blit(title_text, title_text.get_rect(center=(width / 2, height * 0.04)))
+        title_text = render_text("menu", mode_text, COLORS["WHITE"])
+        items.append(("title", title_text, title_text.get_rect(center=(width / 2, height * 0.04)), mode_text))
 
         # 🌟 (เปลี่ยนชื่อ) แสดงตัวจับเวลาในโหมด Limited Time
         if self.current_mode == 'limited_time' and not self.game_over:
@@ -640,359 +1070,745 @@ class WordleGamePygame:
             timer_text = f"Time: {timer_display}"
             # เปลี่ยนเป็นสีแดงเมื่อเหลือน้อย
             timer_color = COLORS["WHITE"] if self.time_remaining > 5 else COLORS["RED"]
-            timer_surf = FONTS["stats"].render(timer_text, True, timer_color)
+            timer_surf = render_text("stats", timer_text, timer_color)
             timer_rect = timer_surf.get_rect(topright=(width - 20, height * 0.02))
-            surface.blit(timer_surf, timer_rect)
+            items.append(("timer", timer_surf, timer_rect, (timer_text, timer_color)))
+        return items
+
+    def gear_rect(self, surface):
+        """
+        ตำแหน่งของปุ่มตั้งค่า (มุมล่างซ้าย)
+        """
+        return self.layout(surface).gear_rect
+
+    def return_rect(self, surface):
+        """
+        ตำแหน่งของปุ่มย้อนกลับ (มุมบนซ้าย)
+        """
+        return self.layout(surface).return_rect
 
     def draw_settings_gear(self, surface):
         """
         วาดไอคอนรูปเฟือง (หรือข้อความ "⚙") สำหรับปุ่มตั้งค่า
         """
-        width, height = surface.get_size()
-        margin = 10
-        gear_size = int(min(width, height) * 0.06)
-        gear_rect = pygame.Rect(margin, height - gear_size - margin, gear_size, gear_size) 
-
-        try:
-            if not SETTING_IMG: raise ValueError("No setting image")
-            img = pygame.transform.smoothscale(SETTING_IMG, (gear_size, gear_size))
-            surface.blit(img, gear_rect)
-        except Exception:
-            # Fallback ถ้าไม่มีรูป
-            gear_surf = FONTS["menu"].render("⚙", True, COLORS["WHITE"])
-            surface.blit(gear_surf, gear_surf.get_rect(center=gear_rect.center))
-        return gear_rect 
+        return self.draw_icon(surface, "setting", self.gear_rect(surface), "⚙")
     
     def draw_return_button(self, surface):
         """
         วาดไอคอนลูกศร (หรือข้อความ "<-") สำหรับปุ่มย้อนกลับ
         """
-        width, height = surface.get_size()
-        margin = 10
-        btn_size = int(min(width, height) * 0.06) 
-        btn_rect = pygame.Rect(margin, margin, btn_size, btn_size) 
+        return self.draw_icon(surface, "return", self.return_rect(surface), "<-")
 
+    def draw_icon(self, surface, name, rect, fallback_text):
+        """
+        วาดไอคอนจาก IMAGE_CACHE ให้พอดีกับ rect (หรือข้อความ fallback_text ถ้าไม่มีรูป)
+        """
         try:
-            if not RETURN_IMG: raise ValueError("No return image")
-            img = pygame.transform.smoothscale(RETURN_IMG, (btn_size, btn_size))
-            surface.blit(img, btn_rect)
+            img = IMAGE_CACHE.get(name, rect.size)
+            if img is None: raise ValueError(f"No {name} image")
+            surface.blit(img, rect)
         except Exception:
             # Fallback ถ้าไม่มีรูป
-            fallback_text = FONTS["menu"].render("<-", True, COLORS["WHITE"])
-            surface.blit(fallback_text, fallback_text.get_rect(center=btn_rect.center))
-        return btn_rect
+            fallback = render_text("menu", fallback_text, COLORS["WHITE"])
+            surface.blit(fallback, fallback.get_rect(center=rect.center))
+        return rect
     
-    def draw_message(self, surface):
+    def message_item(self, surface):
         """
-        วาดข้อความแจ้งเตือนชั่วคราว (จาก set_message)
+        คืนข้อความแจ้งเตือนที่ยังต้องแสดงเป็น (Surface, Rect, ข้อมูลสำหรับเทียบ) หรือ None
         """
         width, height = surface.get_size()
         if self.message and pygame.time.get_ticks() - self.message_timer < 2000 and not self.game_over:
             text, color = self.message
-            msg_surface = FONTS["message"].render(text, True, color)
-            surface.blit(msg_surface, msg_surface.get_rect(center=(width / 2, height * 0.95)))
+            msg_surface = render_text("message", text, color)
+            return msg_surface, msg_surface.get_rect(center=(width / 2, height * 0.95)), (text, color)
+        return None
+
+    def frame_items(self, surface):
+        """
+        รายการสิ่งที่วาดบนหน้าเกมหนึ่งเฟรม (เรียงตามลำดับการวาด) สำหรับ DirtyRectRenderer
+        แต่ละรายการคือ (key, Rect, ข้อมูลสำหรับเทียบ, ฟังก์ชันวาด)
+        """
+        items = []
+        for name, text_surf, text_rect, sig in self.header_items(surface):
+            items.append((("header", name), text_rect, sig,
+                          lambda s, t=text_surf, r=text_rect: s.blit(t, r)))
+        for i, j, box, letter, color_key, outlined in self.board_tiles(surface):
+            items.append((("tile", i, j), box, (letter, color_key, outlined),
+                          lambda s, b=box, l=letter, c=color_key, o=outlined: self._draw_tile(s, b, l, c, o)))
+        for key, key_rect, color_name, label in self.keyboard_keys(surface):
+            items.append((("key", key), key_rect, (color_name, label),
+                          lambda s, r=key_rect, c=color_name, l=label: self._draw_key(s, r, c, l)))
+        message = self.message_item(surface)
+        if message:
+            msg_surface, msg_rect, sig = message
+            items.append((("message",), msg_rect, sig, lambda s, t=msg_surface, r=msg_rect: s.blit(t, r)))
+        items.append((("gear",), self.gear_rect(surface), None, self.draw_settings_gear))
+        items.append((("return",), self.return_rect(surface), None, self.draw_return_button))
+        return items
 
     def start_new_game(self, mode):
         """
         เริ่มต้นเกมใหม่ในโหมดที่เลือก (โหลดคำ, รีเซ็ตสถานะ, เริ่มจับเวลา)
         """
-        # 🌟 (เปลี่ยนชื่อ) อัปเดต key สำหรับไฟล์คำศัพท์
-        file_map = {'classic': 'words_medium.txt', 'unlimited': 'words_easy.txt', 'limited_time': 'words_hard.txt'}
-        filename = file_map.get(mode, 'words_medium.txt')
-        
-        self._load_words_from_file(filename)
-        self.reset_game_state()
-        self.current_mode = mode
-        if not self.word_bank:
-            print("Error: Word bank is empty. Cannot start game.")
-            return False 
-        self.target_word = random.choice(self.word_bank)
-        
-        # 🌟 (เปลี่ยนชื่อ) เริ่มจับเวลาถ้าเป็นโหมด Limited Time
-        if self.current_mode == 'limited_time':
-            self.timer_start_time = pygame.time.get_ticks()
-            
+        if not super().start_new_game(mode):
+            return False
         print(f"Starting {mode} mode. Hint: {self.target_word}")
         return True
 
-    def run_game(self):
+    def open_render_target(self):
         """
-        ลูปหลักของเกม (Game Loop) สำหรับหน้าเล่นเกม
-        จัดการ input, อัปเดตตรรกะ, และวาดหน้าจอ
+        เปิดหน้าต่างแบบ texture สำหรับหน้าเกม (เมื่อ RENDER_BACKEND เป็น "texture")
+        ถ้าเปิดไม่ได้ จะใช้ software ไปตลอดการทำงานของโปรแกรม
         """
-        global SCREEN, WIDTH, HEIGHT
-        running = True
-        clock = pygame.time.Clock()
-        
-        # ฟังก์ชันย่อยสำหรับดึงตำแหน่งปุ่ม UI (เฟือง, ย้อนกลับ)
-        def get_ui_rects():
-            gear_margin = 10
-            gear_size = int(min(WIDTH, HEIGHT) * 0.06)
-            gear_rect = pygame.Rect(gear_margin, HEIGHT - gear_size - gear_margin, gear_size, gear_size)
-            
-            return_margin = 10
-            return_size = int(min(WIDTH, HEIGHT) * 0.06)
-            return_rect = pygame.Rect(return_margin, return_margin, return_size, return_size)
-            return gear_rect, return_rect
-
-        gear_rect_for_events, return_rect_for_events = get_ui_rects()
-
-        while running:
-            # --- 1. จัดการ Event (Input) ---
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                # ปรับขนาดหน้าจอ
-                if event.type == pygame.VIDEORESIZE:
-                    WIDTH, HEIGHT = max(event.w, 500), max(event.h, 750) 
-                    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                    update_fonts(WIDTH, HEIGHT) 
-                    gear_rect_for_events, return_rect_for_events = get_ui_rects()
-                
-                # คลิกเมาส์
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if return_rect_for_events.collidepoint(event.pos) and not self.game_over:
-                        running = False # กลับไปหน้าเลือกโหมด
-                        continue
-                        
-                    if gear_rect_for_events.collidepoint(event.pos) and not self.game_over:
-                        settings_menu(self)
-                        self.apply_volume_settings() # ใช้การตั้งค่าใหม่
-                        continue
-                    
-                    if not self.game_over:
-                        # ตรวจสอบการคลิกคีย์บอร์ด
-                        clicked_key = None
-                        for key, rect in self.key_rects.items():
-                            if rect.collidepoint(event.pos):
-                                clicked_key = key
-                                break
-                        
-                        if clicked_key:
-                            if clicked_key == "ENTER":
-                                if len(self.current_guess) == self.WORD_LENGTH:
-                                    self.handle_enter()
-                            elif clicked_key == "BACK":
-                                self.current_guess = self.current_guess[:-1]
-                            elif len(clicked_key) == 1 and len(self.current_guess) < self.WORD_LENGTH:
-                                self.current_guess += clicked_key
-                                self.play_sound("type")
-                            continue
-
-                # กดคีย์บอร์ด
-                if event.type == pygame.KEYDOWN:
-                    if self.game_over:
-                        if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
-                            running = False # กลับเมนูหลังจบเกม
-                        continue
-                    
-                    if event.key == pygame.K_ESCAPE:
-                        running = False # ออกจากเกม
-                    elif event.key == pygame.K_BACKSPACE:
-                        self.current_guess = self.current_guess[:-1]
-                    elif event.key == pygame.K_RETURN and len(self.current_guess) == self.WORD_LENGTH:
-                        self.handle_enter()
-                    elif 'a' <= event.unicode.lower() <= 'z' and len(self.current_guess) < self.WORD_LENGTH:
-                        self.current_guess += event.unicode.lower()
-                        self.play_sound("type")  
-
-            # --- 2. อัปเดตตรรกะ (Update Logic) ---
-            
-            # 🌟 (เปลี่ยนชื่อ) ตรรกะการจับเวลาสำหรับโหมด Limited Time
-            if self.current_mode == 'limited_time' and not self.game_over:
-                current_ticks = pygame.time.get_ticks()
-                elapsed = current_ticks - self.timer_start_time
-                self.time_remaining = (self.time_limit - elapsed) / 1000.0 # แปลงเป็นวินาที (ทศนิยม)
-
-                if self.time_remaining <= 0:
-                    self.time_remaining = 0
-                    self.game_over = True
-                    self.win = False # แพ้เพราะหมดเวลา
-                    self.set_message("TIME'S UP!", "RED")
-                    
-                    # เรียกกระบวนการจบเกม (เสียง, สถิติ)
-                    self._render_end_screen()
-                    pygame.time.wait(250)
-                    self._handle_end_game_sfx("lose")
-                    self.update_stats() # บันทึกสถิติว่าแพ้
-            # --- จบส่วนจับเวลา ---
-
-
-            # --- 3. วาดหน้าจอ (Draw) ---
-            if self.game_over:
-                # ถ้าเกมจบ, วาดหน้าจอจบเกม (ซึ่งจะ fill BG และ flip เอง)
-                self._render_end_screen() 
+        global RENDER_BACKEND
+        if RENDER_BACKEND == "texture" and self.render_target is None:
+            self.render_target = TextureTarget.create(pygame.display.get_caption()[0], (WIDTH, HEIGHT))
+            if self.render_target is None:
+                RENDER_BACKEND = "software"
+        return self.render_target
+
+    def close_render_target(self):
+        """
+        ปิดหน้าต่างแบบ texture แล้วกลับไปวาดลง SCREEN (ขนาดตามหน้าต่างเกมล่าสุด)
+        """
+        global SCREEN
+        if self.render_target is not None:
+            self.render_target.close()
+            self.render_target = None
+            SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+
+# --- หน้าจอต่างๆ (Scene) และลูปหลักของโปรแกรม (SceneManager) ---
+
+# เฟรมต่อวินาทีของหน้าเกม
+GAME_FPS = 60
+# เพดานเฟรมของหน้าเมนู และเวลาสูงสุดที่รอ event ในแต่ละรอบ (มิลลิวินาที)
+MENU_FPS_CAP = 60
+MENU_IDLE_TIMEOUT = 1000
+
+class Scene:
+    """
+    หน้าจอหนึ่งหน้าใน SceneManager ไม่มีลูปของตัวเอง: รับ event (handle_event), อัปเดต (update)
+    และคืนรายการสิ่งที่วาด (frame_items) ส่วนการรอ event, การปรับขนาดหน้าต่าง, การวาด
+    การจำกัดเฟรม และตัวจับเวลาต่อเฟรมเป็นหน้าที่ของ SceneManager
+    """
+    # True = วาดใหม่ทุกเฟรมที่ GAME_FPS (หน้าเกม)
+    # False = รอ event แบบบล็อก แล้ววาดใหม่เฉพาะเมื่อมี input หรือเมาส์ย้ายไปชี้ปุ่มอื่น (หน้าเมนู)
+    continuous = False
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.game = manager.game
+        self.size = None # ขนาดหน้าจอที่ create_ui สร้างปุ่มไว้
+
+    def enter(self):
+        """
+        เรียกเมื่อหน้านี้ถูกเปิด (push)
+        """
+
+    def exit(self):
+        """
+        เรียกเมื่อหน้านี้ถูกปิด (pop)
+        """
+
+    def pause(self):
+        """
+        เรียกเมื่อมีหน้าอื่นเปิดทับหน้านี้
+        """
+
+    def resume(self):
+        """
+        เรียกเมื่อหน้าที่เปิดทับถูกปิด และหน้านี้กลับมาอยู่บนสุด
+        """
+
+    def create_ui(self):
+        """
+        สร้างปุ่ม/ตำแหน่งตามขนาดหน้าจอปัจจุบัน (เรียกเฉพาะเมื่อขนาดเปลี่ยน)
+        """
+
+    def hover_rects(self):
+        """
+        พื้นที่ที่ต้องวาดใหม่เมื่อเมาส์เลื่อนเข้า/ออก
+        """
+        return ()
+
+    def render_target(self):
+        """
+        TextureTarget ที่หน้านี้วาดลงไป หรือ None ถ้าวาดลง SCREEN
+        """
+        return None
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def frame_items(self, surface):
+        """
+        รายการสิ่งที่วาดหนึ่งเฟรม (key, Rect, ข้อมูลสำหรับเทียบ, ฟังก์ชันวาด) เรียงตามลำดับการวาด
+        """
+        return []
+
+class SceneManager:
+    """
+    ลูปเดียวของโปรแกรม: หน้าจอต่างๆ ซ้อนกันเป็น stack (push เปิดหน้าใหม่ทับ, pop กลับหน้าก่อน)
+    ทุกหน้าใช้การรับ event, ResizeCoordinator, DirtyRectRenderer, การจำกัดเฟรม และ PROFILER ชุดเดียวกัน
+    Scene แต่ละชนิดถูกสร้างครั้งแรกที่เปิดแล้วใช้ซ้ำ (สร้างปุ่มใหม่เฉพาะเมื่อขนาดหน้าจอเปลี่ยน)
+    """
+    def __init__(self, game):
+        self.game = game
+        self.stack = []
+        self.scenes = {}
+        self.renderer = DirtyRectRenderer()
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.clock = pygame.time.Clock()
+        self.needs_redraw = True
+        self.hovered = None
+
+    def get(self, scene_class):
+        """
+        Scene ของชนิดนี้ (สร้างครั้งแรกที่เรียก)
+        """
+        scene = self.scenes.get(scene_class)
+        if scene is None:
+            scene = self.scenes[scene_class] = scene_class(self)
+        return scene
+
+    def push(self, scene):
+        """
+        เปิดหน้า scene (ชนิดของ Scene) ทับหน้าปัจจุบัน
+        """
+        scene = self.get(scene)
+        if self.stack:
+            self.stack[-1].pause()
+        self.stack.append(scene)
+        scene.enter()
+        self._scene_changed()
+
+    def pop(self):
+        """
+        ปิดหน้าบนสุดแล้วกลับไปหน้าก่อนหน้า (ถ้าไม่เหลือหน้าใด run จะจบ)
+        """
+        self.stack.pop().exit()
+        if self.stack:
+            self.stack[-1].resume()
+        self._scene_changed()
+
+    def _scene_changed(self):
+        # เปลี่ยนหน้าจอ: ต้องวาดใหม่ทั้งจอ
+        self.renderer.invalidate()
+        self.needs_redraw = True
+        self.hovered = None
+
+    def invalidate(self):
+        """
+        ขอให้วาดหน้าปัจจุบันใหม่ในรอบถัดไป (สำหรับสิ่งที่เปลี่ยนโดยไม่มีการคลิก เช่นการลากแถบเลื่อน)
+        """
+        self.needs_redraw = True
+
+    def quit(self):
+        # บันทึกการตั้งค่าที่ยังค้างอยู่ก่อนปิดโปรแกรม
+        self.game.settings_writer.flush()
+        pygame.quit()
+        sys.exit()
+
+    def run(self, scene):
+        """
+        เปิด scene แล้ววนลูปจนกว่าทุกหน้าจะถูกปิด
+        """
+        if PROFILE_CSV and PROFILER.frames == 0 and PROFILER.csv_path is None:
+            PROFILER.start_csv(PROFILE_CSV)
+        self.push(scene)
+        while self.stack:
+            self.step()
+
+    def step(self):
+        """
+        หนึ่งรอบของลูป: รับ event -> ส่งให้หน้าบนสุด -> ปรับขนาดหน้าต่าง -> update -> วาด -> จำกัดเฟรม
+        """
+        scene = self.stack[-1]
+        if scene.continuous or self.needs_redraw:
+            events = pygame.event.get()
+        else:
+            # ไม่มีอะไรต้องวาด: รอ event (ระหว่างลากขอบหน้าต่างจะตื่นมาทันเวลาที่ขนาดนิ่ง)
+            event = pygame.event.wait(RESIZE.wait_timeout(MENU_IDLE_TIMEOUT))
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        if scene.continuous or events:
+            PROFILER.begin_frame() # รอบที่ตื่นเพราะหมดเวลารอ ไม่นับเป็นเฟรม
+
+        for event in events:
+            self.dispatch(event)
+            if not self.stack:
+                break
+        if not self.stack:
+            PROFILER.end_frame()
+            return
+        scene = self.stack[-1] # อาจเปลี่ยนหน้าระหว่างจัดการ event
+        resizing = self.poll_resize(scene)
+        self.prepare(scene)
+        PROFILER.mark("events")
+
+        scene.update()
+        PROFILER.mark("update")
+
+        drawn = False
+        if resizing:
+            # กำลังลากขอบหน้าต่าง: แสดงเฟรมล่าสุดที่ย่อ/ขยาย ไม่วาดหน้าจอที่ขนาดชั่วคราว
+            RESIZE.preview(SCREEN)
+            self.needs_redraw = False
+        elif scene.continuous or self.needs_redraw:
+            self.draw(scene)
+            self.needs_redraw = False
+            drawn = True
+        PROFILER.end_frame()
+
+        if scene.continuous:
+            self.clock.tick(GAME_FPS)
+        elif drawn and MENU_FPS_CAP:
+            self.clock.tick(MENU_FPS_CAP)
+
+    def prepare(self, scene):
+        """
+        สร้างปุ่มของหน้า scene ถ้ายังไม่ได้สร้างที่ขนาดหน้าจอปัจจุบัน
+        """
+        if scene.size != (WIDTH, HEIGHT):
+            scene.create_ui()
+            scene.size = (WIDTH, HEIGHT)
+
+    def dispatch(self, event):
+        """
+        จัดการ event ที่ใช้ร่วมกันทุกหน้า แล้วส่งต่อให้หน้าบนสุด
+        """
+        if AUDIO.handle_event(event):
+            return # เสียงเปลี่ยนลำดับ ไม่ต้องวาดใหม่
+        scene = self.stack[-1]
+        self.prepare(scene)
+        if event.type == pygame.QUIT or (event.type == pygame.WINDOWCLOSE and scene.render_target()):
+            self.quit()
+        if event.type == pygame.VIDEORESIZE:
+            if not scene.render_target():
+                RESIZE.request((event.w, event.h)) # ปรับจริงเมื่อขนาดนิ่งแล้ว (poll_resize)
+            return
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_F3, pygame.K_F4):
+            self.profiler_hotkey(event.key)
+            return
+
+        if event.type == pygame.MOUSEMOTION:
+            # การขยับเมาส์ทำให้วาดใหม่เฉพาะเมื่อปุ่มที่ชี้อยู่เปลี่ยน
+            hovered = None
+            for i, rect in enumerate(scene.hover_rects()):
+                if rect.collidepoint(event.pos):
+                    hovered = i
+                    break
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.needs_redraw = True
+        else:
+            self.needs_redraw = True
+        scene.handle_event(event)
+
+    def profiler_hotkey(self, key):
+        """
+        F3 = แสดง/ซ่อนเวลาต่อเฟรม, F4 = เริ่ม/หยุดบันทึกเวลาทุกเฟรมลง CSV
+        """
+        self.needs_redraw = True
+        if key == pygame.K_F3:
+            PROFILER.toggle_overlay()
+            return
+        message = None
+        if PROFILER.csv_path:
+            message = f"Saved {os.path.basename(PROFILER.stop_csv())}"
+        elif PROFILER.start_csv(time.strftime("frame_times_%Y%m%d_%H%M%S.csv")):
+            message = "Recording frame times (F4 to stop)"
+        if message:
+            self.game.set_message(message)
+
+    def poll_resize(self, scene):
+        """
+        ใช้ขนาดหน้าต่างใหม่เมื่อขนาดนิ่งแล้ว คืน True ถ้ายังลากขอบหน้าต่างอยู่ (ให้แสดงภาพ preview)
+        """
+        target = scene.render_target()
+        if target is not None:
+            # หน้าต่างแบบ texture ถูกปรับขนาด: ระหว่างลากให้ Renderer ย่อ/ขยายเฟรมขนาดเดิมให้เต็มหน้าต่าง
+            if RESIZE.pending is None and target.window.size == (WIDTH, HEIGHT):
+                return False
+            RESIZE.request(target.window.size)
+            if RESIZE.poll(set_mode=False):
+                if target.window.size != (WIDTH, HEIGHT):
+                    target.window.size = (WIDTH, HEIGHT) # ไม่ให้เล็กกว่า MIN_WIDTH x MIN_HEIGHT
+                target.set_logical_size(None)
             else:
-                # ถ้าเกมยังไม่จบ, วาดหน้าจอเกมปกติ
-                SCREEN.fill(BG_COLOR)
-                self.draw_header(SCREEN)
-                self.draw_board(SCREEN)
-                self.draw_keyboard(SCREEN)
-                self.draw_message(SCREEN)
-                self.draw_settings_gear(SCREEN)
-                self.draw_return_button(SCREEN) 
-                
-                # Flip display สำหรับหน้าจอเกม
-                pygame.display.flip()
+                target.set_logical_size((WIDTH, HEIGHT))
+            return False
+        if RESIZE.pending is None:
+            return False
+        if RESIZE.poll():
+            # ขนาดหน้าต่างนิ่งแล้ว: ฟอนต์ถูกสร้างใหม่ครั้งเดียว ปุ่มและการวาดต้องเริ่มใหม่ทั้งจอ
+            self.renderer.invalidate()
+            self.needs_redraw = True
+            return False
+        return True
+
+    def draw(self, scene):
+        """
+        วาดหน้า scene หนึ่งเฟรม (พร้อม overlay ของ profiler) แล้วส่งขึ้นจอ
+        """
+        target = scene.render_target()
+        surface = target or SCREEN
+        items = scene.frame_items(surface)
+        overlay = profiler_item(surface)
+        if overlay:
+            items.append(overlay)
+        PROFILER.mark("layout")
+
+        if target is not None:
+            # ประกอบทั้งเฟรมจาก Texture
+            target.fill(BG_COLOR)
+            for key, _, _, draw in items:
+                draw(target)
+                PROFILER.mark(PROFILE_SECTIONS.get(key[0], "layout"))
+            target.present()
+            PROFILER.mark("flip")
+            return
+        if not self.dirty_rendering:
+            self.renderer.invalidate() # วาดใหม่ทั้งจอทุกเฟรม
+        # วาดเฉพาะสิ่งที่เปลี่ยน
+        updated = self.renderer.present(SCREEN, items, PROFILER if PROFILER.active else None)
+        RESIZE.remember(SCREEN, updated)
 
-            clock.tick(60)
+class GameScene(Scene):
+    """
+    หน้าเล่นเกม: จัดการ input ของเกม, ตัวจับเวลา และวาดกระดาน/คีย์บอร์ด (หรือหน้าจอจบเกม)
+    วาดลงหน้าต่างแบบ texture เมื่อ RENDER_BACKEND เป็น "texture"
+    """
+    continuous = True
+
+    def enter(self):
+        self.game.open_render_target()
+
+    def exit(self):
+        self.game.close_render_target()
 
-# --- ฟังก์ชันสำหรับหน้าจอเมนูต่างๆ ---
+    def pause(self):
+        self.game.close_render_target() # หน้าตั้งค่าวาดลง SCREEN
 
-def settings_menu(game):
+    def resume(self):
+        self.game.open_render_target()
+        self.game.apply_volume_settings() # ใช้การตั้งค่าใหม่
+
+    def render_target(self):
+        return self.game.render_target
+
+    def handle_event(self, event):
+        game = self.game
+        # คลิกเมาส์
+        if event.type == pygame.MOUSEBUTTONDOWN and not game.game_over:
+            layout = game.layout(game.render_target or SCREEN)
+            if layout.return_rect.collidepoint(event.pos):
+                self.manager.pop() # กลับไปหน้าเลือกโหมด
+            elif layout.gear_rect.collidepoint(event.pos):
+                self.manager.push(SettingsScene)
+            else:
+                # ตรวจสอบการคลิกคีย์บอร์ด
+                clicked_key = layout.key_at(event.pos)
+                if clicked_key == "ENTER":
+                    if len(game.current_guess) == game.WORD_LENGTH:
+                        game.handle_enter()
+                elif clicked_key == "BACK":
+                    game.backspace()
+                elif clicked_key and len(clicked_key) == 1 and game.type_letter(clicked_key):
+                    game.play_sound("type")
+
+        # กดคีย์บอร์ด
+        elif event.type == pygame.KEYDOWN:
+            if game.game_over:
+                if event.key in [pygame.K_RETURN, pygame.K_ESCAPE]:
+                    self.manager.pop() # กลับเมนูหลังจบเกม
+            elif event.key == pygame.K_ESCAPE:
+                self.manager.pop() # ออกจากเกม
+            elif event.key == pygame.K_BACKSPACE:
+                game.backspace()
+            elif event.key == pygame.K_TAB:
+                # ขอคำใบ้จาก solver
+                hint_word = game.hint()
+                if hint_word:
+                    game.set_message(f"Hint: {hint_word.upper()} ({game.remaining_candidates()} words left)", "YELLOW")
+            elif event.key == pygame.K_RETURN and len(game.current_guess) == game.WORD_LENGTH:
+                game.handle_enter()
+            elif 'a' <= event.unicode.lower() <= 'z' and game.type_letter(event.unicode.lower()):
+                game.play_sound("type")
+
+    def update(self):
+        # 🌟 (เปลี่ยนชื่อ) ตรรกะการจับเวลาสำหรับโหมด Limited Time
+        if self.game.update_timer():
+            # เรียกกระบวนการจบเกม (เสียง, สถิติ)
+            self.game._handle_end_game_sfx("lose")
+            self.game.update_stats() # บันทึกสถิติว่าแพ้
+
+    def frame_items(self, surface):
+        game = self.game
+        if game.game_over:
+            return game.end_screen_items(surface)
+        items = game.frame_items(surface)
+        if surface is not SCREEN:
+            game.atlas.wait() # วาด pygame.draw ลง TextureTarget ไม่ได้ ต้องรอ sprite atlas
+        return items
+
+class MenuScene(Scene):
     """
-    หน้าจอสำหรับจัดการการตั้งค่า (เปิด/ปิดเสียง, ปรับความดัง)
+    หน้าเมนูที่มีหัวข้อ ปุ่มเรียงในแนวตั้ง และปุ่มตั้งค่า (มุมล่างซ้าย)
     """
-    global SCREEN, WIDTH, HEIGHT
+    title = ""
+    button_texts = []
+
+    def create_ui(self):
+        self.buttons = menu_button_rects(self.button_texts, 0.25)
+
+    def resume(self):
+        self.game.apply_volume_settings() # อาจกลับมาจากหน้าตั้งค่า
+
+    def hover_rects(self):
+        return list(self.buttons.values()) + [self.game.gear_rect(SCREEN)]
+
+    def handle_event(self, event):
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        if self.game.gear_rect(SCREEN).collidepoint(event.pos):
+            self.manager.push(SettingsScene)
+            return
+        for text, rect in self.buttons.items():
+            if rect.collidepoint(event.pos):
+                self.select(text)
+                return
 
-    class VolumeSlider:
+    def select(self, text):
         """
-        (คลาสย่อย) คลาสสำหรับวาดและจัดการแถบเลื่อนปรับความดัง
+        ผู้เล่นคลิกปุ่ม text
         """
-        def __init__(self, x, y, width, height, initial_value=0.5):
-            self.rect = pygame.Rect(x, y, width, height)
-            self.knob = pygame.Rect(x, y, 20, height)
-            self.value = initial_value
-            self.active = False
-            self.update_knob_position()
-        
-        def update_knob_position(self):
-            # อัปเดตตำแหน่งปุ่มจับตามค่า value (0.0 - 1.0)
-            self.knob.centerx = self.rect.left + (self.rect.width * self.value)
-            self.knob.centery = self.rect.centery
-        
-        def handle_event(self, event):
-            # จัดการการลากแถบเลื่อน
-            changed = False
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.rect.collidepoint(event.pos) or self.knob.collidepoint(event.pos):
-                    self.active = True
-                    self.value = (event.pos[0] - self.rect.left) / self.rect.width
-                    self.value = min(max(self.value, 0), 1) 
-                    self.update_knob_position()
-                    changed = True
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self.active = False
-            elif event.type == pygame.MOUSEMOTION and self.active:
-                rel_x = min(max(event.pos[0], self.rect.left), self.rect.right)
-                self.value = (rel_x - self.rect.left) / self.rect.width
+
+    def frame_items(self, surface):
+        mouse = pygame.mouse.get_pos()
+        items = [title_item(self.title, y=int(HEIGHT * 0.15))]
+        for text, rect in self.buttons.items():
+            items.append(button_item(text, rect, text, mouse, "stats"))
+        items.append((("gear",), self.game.gear_rect(surface), None, self.game.draw_settings_gear))
+        return items
+
+class MainMenuScene(MenuScene):
+    """
+    หน้าจอเมนูหลัก (Play, Statistics, Exit)
+    """
+    title = "Wordle"
+    button_texts = ["Play", "Statistics", "Exit"]
+
+    def select(self, text):
+        if text == 'Play':
+            self.manager.push(ModeSelectScene) # ไปหน้าเลือกโหมด
+        elif text == 'Statistics':
+            self.manager.push(StatsScene) # ไปหน้าสถิติ
+        elif text == 'Exit':
+            self.manager.quit()
+
+class ModeSelectScene(MenuScene):
+    """
+    หน้าจอสำหรับเลือกโหมดเกม (Classic, Unlimited, Limited Time)
+    """
+    title = "Mode"
+    # 🌟 (เปลี่ยนชื่อ) อัปเดตข้อความบนปุ่ม
+    button_texts = ["Classic", "Unlimited", "Limited Time", "Back"]
+    MODES = {"Classic": "classic", "Unlimited": "unlimited", "Limited Time": "limited_time"}
+
+    def select(self, text):
+        if text == "Back":
+            self.manager.pop() # กลับเมนูหลัก
+        elif self.game.start_new_game(self.MODES[text]):
+            self.manager.push(GameScene)
+
+class VolumeSlider:
+    """
+    คลาสสำหรับวาดและจัดการแถบเลื่อนปรับความดัง
+    """
+    def __init__(self, x, y, width, height, initial_value=0.5):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.knob = pygame.Rect(x, y, 20, height)
+        self.value = initial_value
+        self.active = False
+        self.update_knob_position()
+    
+    def update_knob_position(self):
+        # อัปเดตตำแหน่งปุ่มจับตามค่า value (0.0 - 1.0)
+        self.knob.centerx = self.rect.left + (self.rect.width * self.value)
+        self.knob.centery = self.rect.centery
+    
+    def handle_event(self, event):
+        # จัดการการลากแถบเลื่อน
+        changed = False
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.rect.collidepoint(event.pos) or self.knob.collidepoint(event.pos):
+                self.active = True
+                self.value = (event.pos[0] - self.rect.left) / self.rect.width
+                self.value = min(max(self.value, 0), 1) 
                 self.update_knob_position()
                 changed = True
-            return changed
-        
-        def draw(self, surface):
-            # วาดแถบและปุ่มจับ
-            pygame.draw.rect(surface, COLORS["LIGHT_GRAY"], self.rect, border_radius=5)
-            pygame.draw.rect(surface, COLORS["WHITE"], self.knob, border_radius=5) 
-    
-    # --- เริ่มต้นเมนูตั้งค่า ---
-    settings_running = True
-    sound_enabled = bool(game.settings.get("sound_enabled", True))
+        elif event.type == pygame.MOUSEBUTTONUP:
+            self.active = False
+        elif event.type == pygame.MOUSEMOTION and self.active:
+            rel_x = min(max(event.pos[0], self.rect.left), self.rect.right)
+            self.value = (rel_x - self.rect.left) / self.rect.width
+            self.update_knob_position()
+            changed = True
+        return changed
     
-    # ฟังก์ชันสร้าง UI (เผื่อปรับขนาดจอ)
-    def create_ui(bg_val, fx_val):
+    def draw(self, surface):
+        # วาดแถบและปุ่มจับ
+        pygame.draw.rect(surface, COLORS["LIGHT_GRAY"], self.rect, border_radius=5)
+        pygame.draw.rect(surface, COLORS["WHITE"], self.knob, border_radius=5) 
+
+    def item(self, name):
+        # รายการสำหรับ DirtyRectRenderer (ปุ่มจับยื่นออกนอกแถบได้ครึ่งหนึ่ง)
+        return (("slider", name), self.rect.union(self.knob), self.value, self.draw)
+
+class SettingsScene(Scene):
+    """
+    หน้าจอสำหรับจัดการการตั้งค่า (เปิด/ปิดเสียง, ปรับความดัง)
+    ค่าถูกใช้ทันทีที่เปลี่ยน ส่วนการเขียนไฟล์ถูกรวมไว้ใน game.settings_writer
+    """
+    def enter(self):
+        self.sound_enabled = bool(self.game.settings.get("sound_enabled", True))
+        self.bg_slider = self.fx_slider = None
+        self.size = None # สร้างแถบเลื่อนใหม่ด้วยค่าจาก settings
+
+    def exit(self):
+        # กลับ (บันทึกค่าที่ยังค้างอยู่ทันที)
+        self.apply_settings()
+        self.game.settings_writer.flush()
+
+    def create_ui(self):
+        if self.bg_slider is None:
+            bg_val = float(self.game.settings.get("bg_volume", DEFAULT_SETTINGS["bg_volume"]))
+            fx_val = float(self.game.settings.get("fx_volume", DEFAULT_SETTINGS["fx_volume"]))
+        else:
+            bg_val, fx_val = self.bg_slider.value, self.fx_slider.value
         slider_width = WIDTH * 0.4
         slider_height = HEIGHT * 0.03
-        bg_slider = VolumeSlider(WIDTH * 0.45, HEIGHT * 0.35, slider_width, slider_height, bg_val)
-        fx_slider = VolumeSlider(WIDTH * 0.45, HEIGHT * 0.5, slider_width, slider_height, fx_val)
-        sound_button = pygame.Rect(WIDTH * 0.3, HEIGHT * 0.2, WIDTH * 0.4, HEIGHT * 0.08)
-        back_button = pygame.Rect(WIDTH * 0.3, HEIGHT * 0.8, WIDTH * 0.4, HEIGHT * 0.08)
-        return bg_slider, fx_slider, sound_button, back_button
-
-    bg_val = float(game.settings.get("bg_volume", DEFAULT_SETTINGS["bg_volume"]))
-    fx_val = float(game.settings.get("fx_volume", DEFAULT_SETTINGS["fx_volume"]))
-    bg_slider, fx_slider, sound_button, back_button = create_ui(bg_val, fx_val)
-
-    # ฟังก์ชันบันทึกและใช้ค่า
-    def apply_and_save_settings():
-        game.settings["bg_volume"] = bg_slider.value
-        game.settings["fx_volume"] = fx_slider.value
-        game.settings["sound_enabled"] = sound_enabled
-        save_settings(game.settings)
+        self.bg_slider = VolumeSlider(WIDTH * 0.45, HEIGHT * 0.35, slider_width, slider_height, bg_val)
+        self.fx_slider = VolumeSlider(WIDTH * 0.45, HEIGHT * 0.5, slider_width, slider_height, fx_val)
+        self.sound_button = pygame.Rect(WIDTH * 0.3, HEIGHT * 0.2, WIDTH * 0.4, HEIGHT * 0.08)
+        self.back_button = pygame.Rect(WIDTH * 0.3, HEIGHT * 0.8, WIDTH * 0.4, HEIGHT * 0.08)
+
+    def apply_settings(self):
+        # ใช้ค่าทันที (การเขียนไฟล์ถูกรวมไว้ใน game.settings_writer)
+        game = self.game
+        values = {"bg_volume": self.bg_slider.value, "fx_volume": self.fx_slider.value,
+                  "sound_enabled": self.sound_enabled}
+        if all(game.settings.get(key) == value for key, value in values.items()):
+            return # ไม่มีอะไรเปลี่ยน
+        game.settings.update(values)
         game.apply_volume_settings() # ใช้ค่าทันที
+        game.settings_writer.mark_dirty()
+
+    def hover_rects(self):
+        return [self.sound_button, self.back_button]
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.sound_button.collidepoint(event.pos):
+                # เปิด/ปิดเสียง
+                self.sound_enabled = not self.sound_enabled
+                if self.sound_enabled:
+                    try:
+                        pygame.mixer.music.set_volume(self.bg_slider.value)
+                    except Exception: pass
+                    AUDIO.play_music()
+                else:
+                    try: pygame.mixer.music.stop()
+                    except Exception: pass
+                self.apply_settings()
+            elif self.back_button.collidepoint(event.pos):
+                self.manager.pop()
+                return
+
+        # จัดการการลากแถบเลื่อน
+        bg_changed = self.bg_slider.handle_event(event)
+        fx_changed = self.fx_slider.handle_event(event)
+        if bg_changed or fx_changed:
+            self.apply_settings()
+            self.manager.invalidate() # ปุ่มจับของแถบเลื่อนขยับ
+
+    def update(self):
+        # เขียนไฟล์เมื่อหยุดลากแถบเลื่อนแล้ว
+        self.game.settings_writer.poll()
+
+    def frame_items(self, surface):
+        mouse = pygame.mouse.get_pos()
+        sound_text = "Sound: ON" if self.sound_enabled else "Sound: OFF"
+        return [
+            title_item("Sound Settings", y=int(HEIGHT * 0.1)),
+            button_item("sound", self.sound_button, sound_text, mouse, "stats"),
+            text_item("bg_label", "stats", "Background Music", COLORS["WHITE"], (WIDTH * 0.12, HEIGHT * 0.34)),
+            text_item("fx_label", "stats", "Sound Effects", COLORS["WHITE"], (WIDTH * 0.12, HEIGHT * 0.49)),
+            self.bg_slider.item("bg"),
+            self.fx_slider.item("fx"),
+            button_item("back", self.back_button, "Back", mouse, "menu"),
+        ]
 
-    # ลูปของหน้าตั้งค่า
-    while settings_running:
-        mx, my = pygame.mouse.get_pos()
-        SCREEN.fill(BG_COLOR)
-        
-        draw_title(SCREEN, WIDTH, "Sound Settings", y=int(HEIGHT * 0.1))
-
-        # วาดปุ่มเปิด/ปิดเสียง
-        sound_text = "Sound: ON" if sound_enabled else "Sound: OFF"
-        draw_button(SCREEN, sound_button, sound_text, mx, my, FONTS["stats"])
-
-        # วาดแถบเลื่อน
-        bg_label = FONTS["stats"].render("Background Music", True, COLORS["WHITE"])
-        fx_label = FONTS["stats"].render("Sound Effects", True, COLORS["WHITE"])
-        SCREEN.blit(bg_label, (WIDTH * 0.12, HEIGHT * 0.34))
-        SCREEN.blit(fx_label, (WIDTH * 0.12, HEIGHT * 0.49))
-        bg_slider.draw(SCREEN)
-        fx_slider.draw(SCREEN)
-
-        # วาดปุ่มย้อนกลับ
-        draw_button(SCREEN, back_button, "Back", mx, my, FONTS["menu"])
-
-        # จัดการ Event
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                apply_and_save_settings()
-                pygame.quit()
-                sys.exit()
-            
-            if event.type == pygame.VIDEORESIZE:
-                WIDTH, HEIGHT = max(event.w, 500), max(event.h, 750)
-                SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                update_fonts(WIDTH, HEIGHT)
-                bg_slider, fx_slider, sound_button, back_button = create_ui(bg_slider.value, fx_slider.value)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if sound_button.collidepoint(event.pos):
-                    # เปิด/ปิดเสียง
-                    sound_enabled = not sound_enabled
-                    if sound_enabled:
-                        try:
-                            pygame.mixer.music.set_volume(bg_slider.value)
-                            pygame.mixer.music.play(-1)
-                        except Exception: pass
-                    else:
-                        try: pygame.mixer.music.stop()
-                        except Exception: pass
-                    apply_and_save_settings() 
-                
-                elif back_button.collidepoint(event.pos):
-                    # กลับ
-                    apply_and_save_settings()
-                    settings_running = False
-
-            # จัดการการลากแถบเลื่อน
-            bg_changed = bg_slider.handle_event(event)
-            fx_changed = fx_slider.handle_event(event)
-            if bg_changed or fx_changed:
-                apply_and_save_settings()
-
-        pygame.display.flip()
+# โหมดที่เลือกดูได้ในหน้าสถิติ (key ใน analytics, ข้อความบนปุ่ม)
+STATS_VIEWS = [("all", "All Modes"), ("classic", "Classic"), ("unlimited", "Unlimited"), ("limited_time", "Limited Time")]
 
-def display_stats(stats):
+def analytics_lines(analytics, mode):
+    """
+    ข้อความสถิติเชิงวิเคราะห์ของโหมดหนึ่ง (อ่านจากค่าที่สะสมไว้ ไม่ต้องอ่านประวัติใหม่)
+    """
+    if analytics is None or mode not in analytics.modes:
+        return ["No games yet"]
+    mode_stats = analytics.modes[mode]
+    p50, p90 = mode_stats.solve_percentile(50), mode_stats.solve_percentile(90)
+    lines = [
+        f"Played: {mode_stats.played}",
+        f"Win rate: {mode_stats.win_rate():.0%}",
+        f"Last {len(mode_stats.recent)}: {mode_stats.rolling_win_rate():.0%}",
+        f"Avg guesses: {mode_stats.average_guesses():.2f}",
+        f"Solve p50: {p50}s" if p50 is not None else "Solve p50: -",
+        f"Solve p90: {p90}s" if p90 is not None else "Solve p90: -",
+    ]
+    hardest = analytics.hardest_words(mode)
+    if hardest:
+        lines.append("Hardest: " + ", ".join(word.upper() for word in hardest))
+    return lines
+
+class StatsScene(Scene):
     """
     หน้าจอสำหรับแสดงสถิติการเล่น
+    analytics (analytics.StatsAnalytics ของเกม) ใช้แสดงสถิติแยกตามโหมดในคอลัมน์ขวา
     """
-    global SCREEN, WIDTH, HEIGHT
-    running = True
-
-    def create_ui():
-        # สร้างปุ่ม Back
-        return pygame.Rect(WIDTH * 0.3, HEIGHT * 0.82, WIDTH * 0.4, HEIGHT * 0.08)
-    
-    back_button = create_ui()
-
-    while running:
-        mx, my = pygame.mouse.get_pos()
-        SCREEN.fill(BG_COLOR)
-
-        draw_title(SCREEN, WIDTH, "Statistics", y=int(HEIGHT * 0.08))
+    def enter(self):
+        # อ่านสถิติล่าสุดของเกมทุกครั้งที่เปิด
+        self.stats, self.analytics = self.game.stats, self.game.store.analytics
+        self.view_index = 0
+        self.mode_lines = analytics_lines(self.analytics, STATS_VIEWS[self.view_index][0])
+
+    def create_ui(self):
+        # สร้างปุ่ม Back และปุ่มเลือกโหมดของคอลัมน์ขวา
+        self.back_button = pygame.Rect(WIDTH * 0.3, HEIGHT * 0.82, WIDTH * 0.4, HEIGHT * 0.08)
+        self.view_button = pygame.Rect(WIDTH * 0.52, HEIGHT * 0.17, WIDTH * 0.4, HEIGHT * 0.06)
+
+    def hover_rects(self):
+        return [self.back_button, self.view_button]
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_button.collidepoint(event.pos):
+                self.manager.pop() # กลับเมนูหลัก
+            elif self.view_button.collidepoint(event.pos):
+                self.view_index = (self.view_index + 1) % len(STATS_VIEWS)
+                self.mode_lines = analytics_lines(self.analytics, STATS_VIEWS[self.view_index][0])
+
+    def frame_items(self, surface):
+        mouse = pygame.mouse.get_pos()
+        stats = self.stats
+        white = COLORS["WHITE"]
+        items = [title_item("Statistics", y=int(HEIGHT * 0.08))]
 
         # แสดงสถิติหลัก
         stats_text = [
@@ -1002,131 +1818,34 @@ def display_stats(stats):
             f"Max Streak: {stats.get('max_streak', 0)}"
         ]
         for i, text in enumerate(stats_text):
-            surf = FONTS["stats"].render(text, True, COLORS["WHITE"])
-            SCREEN.blit(surf, (WIDTH * 0.12, HEIGHT * (0.18 + i * 0.06)))
+            items.append(text_item(("stats", i), "stats", text, white, (WIDTH * 0.12, HEIGHT * (0.18 + i * 0.06))))
 
         # แสดงสถิติการเดา
-        dist_title = FONTS["stats"].render("Guess Distribution:", True, COLORS["WHITE"])
-        SCREEN.blit(dist_title, (WIDTH * 0.12, HEIGHT * 0.44))
+        items.append(text_item("dist_title", "stats", "Guess Distribution:", white, (WIDTH * 0.12, HEIGHT * 0.44)))
         guess_dist = stats.get("guess_dist", {})
-        
         for i in range(1, 7): 
             count = guess_dist.get(str(i), 0)
-            line = FONTS["message"].render(f"{i}: {count}", True, COLORS["WHITE"])
-            SCREEN.blit(line, (WIDTH * 0.18, HEIGHT * (0.44 + 0.06 * i)))
-
-        # วาดปุ่ม Back
-        draw_button(SCREEN, back_button, "Back", mx, my, FONTS["menu"])
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.VIDEORESIZE:
-                WIDTH, HEIGHT = max(event.w, 500), max(event.h, 750)
-                SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                update_fonts(WIDTH, HEIGHT)
-                back_button = create_ui() 
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if back_button.collidepoint(event.pos):
-                    running = False # กลับเมนูหลัก
+            items.append(text_item(("dist", i), "message", f"{i}: {count}", white,
+                                   (WIDTH * 0.18, HEIGHT * (0.44 + 0.06 * i))))
 
-        pygame.display.flip()
+        # คอลัมน์ขวา: สถิติแยกตามโหมด (คลิกปุ่มเพื่อเปลี่ยนโหมด)
+        items.append(button_item("view", self.view_button, STATS_VIEWS[self.view_index][1], mouse, "message"))
+        for i, text in enumerate(self.mode_lines):
+            items.append(text_item(("mode", i), "message", text, white, (WIDTH * 0.54, HEIGHT * (0.26 + 0.05 * i))))
 
-def mode_select_menu(game):
-    """
-    หน้าจอสำหรับเลือกโหมดเกม (Classic, Unlimited, Limited Time)
-    """
-    global SCREEN, WIDTH, HEIGHT
-    running = True
-    # 🌟 (เปลี่ยนชื่อ) อัปเดตข้อความบนปุ่ม
-    button_texts = ["Classic", "Unlimited", "Limited Time", "Back"]
-    
-    while running:
-        mx, my = pygame.mouse.get_pos()
-        SCREEN.fill(BG_COLOR)
-
-        draw_title(SCREEN, WIDTH, "Mode", y=int(HEIGHT * 0.15))
-        # ใช้ฟังก์ชันช่วยวาดปุ่ม
-        buttons = draw_menu_buttons(SCREEN, mx, my, button_texts, 0.25, FONTS["stats"])
-        gear_rect = game.draw_settings_gear(SCREEN) # วาดปุ่มตั้งค่า
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.VIDEORESIZE:
-                WIDTH, HEIGHT = max(event.w, 500), max(event.h, 750)
-                SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                update_fonts(WIDTH, HEIGHT)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if gear_rect.collidepoint(event.pos):
-                    settings_menu(game)
-                    game.apply_volume_settings()
-                    continue
-
-                # ตรวจสอบการคลิกปุ่มโหมด
-                for text, rect in buttons.items():
-                    if rect.collidepoint(event.pos):
-                        if text == "Classic":
-                            if game.start_new_game('classic'): game.run_game()
-                        elif text == "Unlimited":
-                            if game.start_new_game('unlimited'): game.run_game()
-                        # 🌟 (เปลี่ยนชื่อ) อัปเดตเงื่อนไขการคลิก
-                        elif text == "Limited Time":
-                            # 🌟 (เปลี่ยนชื่อ) อัปเดต ID ที่ส่งไป
-                            if game.start_new_game('limited_time'): game.run_game()
-                        elif text == "Back":
-                            running = False # กลับเมนูหลัก
-        
-        pygame.display.flip()
+        # ปุ่ม Back
+        items.append(button_item("back", self.back_button, "Back", mouse, "menu"))
+        return items
+
+# --- เปิดหน้าจอเดียวใน SceneManager (หน้านั้นปิดเมื่อไหร่ ฟังก์ชันคืนค่าเมื่อนั้น) ---
 
 def main_menu():
     """
     หน้าจอเมนูหลัก (Play, Statistics, Exit)
-    นี่คือลูปหลักของโปรแกรม
+    นี่คือลูปหลักของโปรแกรม: ทุกหน้าจอทำงานใน SceneManager เดียวกัน
     """
-    global SCREEN, WIDTH, HEIGHT
     game = WordleGamePygame() # สร้าง instance ของเกม
-    button_texts = ["Play", "Statistics", "Exit"]
-    
-    while True:
-        mx, my = pygame.mouse.get_pos()
-        SCREEN.fill(BG_COLOR)
-        
-        draw_title(SCREEN, WIDTH, "Wordle", y=int(HEIGHT * 0.15))
-        # ใช้ฟังก์ชันช่วยวาดปุ่ม
-        buttons = draw_menu_buttons(SCREEN, mx, my, button_texts, 0.25, FONTS["stats"])
-        gear_rect = game.draw_settings_gear(SCREEN) # วาดปุ่มตั้งค่า
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.VIDEORESIZE:
-                WIDTH, HEIGHT = max(event.w, 500), max(event.h, 750)
-                SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                update_fonts(WIDTH, HEIGHT)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if gear_rect.collidepoint(event.pos):
-                    settings_menu(game)
-                    game.apply_volume_settings()
-                    continue 
-                
-                # ตรวจสอบการคลิกปุ่มเมนูหลัก
-                for text, rect in buttons.items():
-                    if rect.collidepoint(event.pos):
-                        if text == 'Play':
-                            mode_select_menu(game) # ไปหน้าเลือกโหมด
-                        elif text == 'Statistics':
-                            display_stats(game.stats) # ไปหน้าสถิติ
-                        elif text == 'Exit':
-                            pygame.quit()
-                            sys.exit()
-
-        pygame.display.flip()
+    SceneManager(game).run(MainMenuScene)
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,149 @@
+"""
+สถิติเชิงวิเคราะห์ที่อัปเดตทีละเกม (ไม่ต้องอ่านประวัติทั้งหมดใหม่)
+แยกตามโหมด: อัตราชนะ, อัตราชนะของ N เกมล่าสุด, จำนวนครั้งที่เดาเฉลี่ย,
+เปอร์เซ็นไทล์ของเวลาที่ใช้แก้ (จาก histogram รายวินาที) และความยากของแต่ละคำ (แยกตามโหมดเช่นกัน)
+สถานะทั้งหมดแปลงเป็น dict ได้ (to_dict/from_dict) เพื่อเก็บใน snapshot ของ storage.GameLogStore
+"""
+from collections import deque
+
+# จำนวนเกมล่าสุดที่ใช้คิดอัตราชนะแบบ rolling
+ROLLING_WINDOW = 20
+# เวลาที่ใช้แก้เกิน MAX_SOLVE_SECONDS วินาทีถูกนับรวมในช่องสุดท้าย
+MAX_SOLVE_SECONDS = 600
+# key ของสถิติรวมทุกโหมด
+ALL_MODES = "all"
+
+
+class ModeStats:
+    """
+    ตัวเลขสรุปของโหมดหนึ่ง (หรือรวมทุกโหมด)
+    """
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.played = 0
+        self.wins = 0
+        self.guess_sum = 0 # ผลรวมจำนวนครั้งที่เดาของเกมที่ชนะ
+        self.recent = deque(maxlen=window) # 1 = ชนะ, 0 = แพ้
+        self.recent_wins = 0
+        self.solve_seconds = {} # วินาที -> จำนวนเกมที่ชนะ
+
+    def add(self, win, guesses, duration_ms):
+        self.played += 1
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_wins -= self.recent[0] # ค่าที่กำลังจะหลุดออกจากหน้าต่าง
+        self.recent.append(1 if win else 0)
+        if win:
+            self.wins += 1
+            self.recent_wins += 1
+            self.guess_sum += guesses
+            second = min(int(duration_ms // 1000), MAX_SOLVE_SECONDS)
+            self.solve_seconds[second] = self.solve_seconds.get(second, 0) + 1
+
+    def win_rate(self):
+        return self.wins / self.played if self.played else 0.0
+
+    def rolling_win_rate(self):
+        return self.recent_wins / len(self.recent) if self.recent else 0.0
+
+    def average_guesses(self):
+        return self.guess_sum / self.wins if self.wins else 0.0
+
+    def solve_percentile(self, q):
+        """
+        เวลาที่ใช้แก้ (วินาที) ที่เปอร์เซ็นไทล์ q (0-100) หรือ None ถ้ายังไม่เคยชนะ
+        """
+        if not self.wins:
+            return None
+        rank = q / 100 * self.wins
+        seen = 0
+        for second in sorted(self.solve_seconds):
+            seen += self.solve_seconds[second]
+            if seen >= rank:
+                return second
+        return MAX_SOLVE_SECONDS
+
+    def to_dict(self):
+        return {"played": self.played, "wins": self.wins, "guess_sum": self.guess_sum,
+                "recent": list(self.recent),
+                "solve_seconds": {str(k): v for k, v in self.solve_seconds.items()}}
+
+    @classmethod
+    def from_dict(cls, data, window=ROLLING_WINDOW):
+        stats = cls(window)
+        stats.played = int(data.get("played", 0))
+        stats.wins = int(data.get("wins", 0))
+        stats.guess_sum = int(data.get("guess_sum", 0))
+        stats.recent.extend(int(x) for x in data.get("recent", []))
+        stats.recent_wins = sum(stats.recent)
+        stats.solve_seconds = {int(k): int(v) for k, v in data.get("solve_seconds", {}).items()}
+        return stats
+
+
+class StatsAnalytics:
+    """
+    สถิติของทุกโหมด (key: ชื่อโหมด และ ALL_MODES) และของแต่ละคำตอบในแต่ละโหมด
+    อันดับคำที่ยากที่สุดถูก cache ไว้ต่อโหมด และล้างเฉพาะโหมดที่มีเกมใหม่
+    """
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.window = window
+        self.modes = {}
+        self.words = {} # โหมด -> {คำตอบ -> [เล่น, ชนะ, ผลรวมจำนวนครั้งที่เดาตอนชนะ]}
+        self._hardest = {} # (โหมด, count, min_played) -> list ของคำ
+
+    def mode(self, name):
+        stats = self.modes.get(name)
+        if stats is None:
+            stats = self.modes[name] = ModeStats(self.window)
+        return stats
+
+    def add_game(self, record):
+        """
+        อัปเดตด้วยเกมหนึ่งเกม (record รูปแบบเดียวกับใน log ของ storage.GameLogStore)
+        """
+        win = bool(record.get("win"))
+        guesses = len(record.get("guesses", []))
+        duration_ms = record.get("duration_ms", 0) or 0
+        target = record.get("target")
+        modes = (ALL_MODES, record.get("mode", "classic"))
+        for name in modes:
+            self.mode(name).add(win, guesses, duration_ms)
+            if target:
+                word = self.words.setdefault(name, {}).setdefault(target, [0, 0, 0])
+                word[0] += 1
+                if win:
+                    word[1] += 1
+                    word[2] += guesses
+        if target:
+            for key in [key for key in self._hardest if key[0] in modes]:
+                del self._hardest[key]
+
+    def hardest_words(self, mode=ALL_MODES, count=3, min_played=1):
+        """
+        คำที่ยากที่สุดของโหมด: อัตราชนะต่ำสุดก่อน ถ้าเท่ากันดูจำนวนครั้งที่เดาเฉลี่ยมากกว่า
+        ผลลัพธ์ถูก cache ไว้จนกว่าโหมดนี้จะมีเกมใหม่ (สลับหน้าสถิติไปมาไม่ต้องเรียงคำใหม่)
+        """
+        key = (mode, count, min_played)
+        hardest = self._hardest.get(key)
+        if hardest is None:
+            def difficulty(item):
+                played, wins, guess_sum = item[1]
+                return (wins / played, -(guess_sum / wins if wins else 7))
+            eligible = [item for item in self.words.get(mode, {}).items() if item[1][0] >= min_played]
+            eligible.sort(key=difficulty)
+            hardest = self._hardest[key] = [word for word, _ in eligible[:count]]
+        return hardest
+
+    def to_dict(self):
+        return {"window": self.window,
+                "modes": {name: stats.to_dict() for name, stats in self.modes.items()},
+                "words": self.words}
+
+    @classmethod
+    def from_dict(cls, data):
+        analytics = cls(int(data.get("window", ROLLING_WINDOW)))
+        for name, stats in data.get("modes", {}).items():
+            analytics.modes[name] = ModeStats.from_dict(stats, analytics.window)
+        for name, words in data.get("words", {}).items():
+            analytics.words[name] = {word: list(values) for word, values in words.items()}
+        return analytics
@@ -0,0 +1,146 @@
+"""
+sprite ของกล่องตัวอักษรและปุ่มแป้นพิมพ์ที่วาดไว้ล่วงหน้า (sprite atlas) สำหรับขนาดกล่อง/ปุ่มปัจจุบัน
+ทุกสถานะ (ตัวอักษร x สีกล่อง และ ปุ่ม x สีปุ่ม) ถูกวาดครั้งเดียว การวาดหน้าเกมจึงเหลือแค่ blit
+เมื่อขนาดเปลี่ยน atlas ชุดใหม่ถูกสร้างใน thread เบื้องหลัง ระหว่างนั้นผู้เรียกวาดแบบเดิมไปก่อน
+"""
+import string
+import threading
+
+import pygame
+
+# สถานะของกล่อง: (ชื่อสี, มีขอบหรือไม่) กล่องว่าง/ที่กำลังพิมพ์ และกล่องที่ตรวจแล้ว 3 สี
+TILE_STATES = (("BLACK", True), ("GREEN", False), ("YELLOW", False), ("GRAY", False))
+TILE_LETTERS = ("",) + tuple(string.ascii_lowercase)
+# สีของปุ่มตัวอักษรตามผลการเดา (ปุ่ม ENTER/BACK ใช้ KEY_DEFAULT เสมอ)
+KEY_STATES = ("KEY_DEFAULT", "GREEN", "YELLOW", "KEY_USED")
+TILE_OUTLINE = "GRAY"
+TEXT_COLOR = "WHITE"
+
+
+def paint_tile(surface, box, text_surf, fill, outline=None):
+    """
+    วาดกล่องตัวอักษรหนึ่งช่อง (text_surf เป็น None สำหรับกล่องว่าง)
+    """
+    pygame.draw.rect(surface, fill, box, border_radius=5)
+    if outline is not None: # กล่องที่ยังไม่ได้ตรวจ มีขอบสีเทา
+        pygame.draw.rect(surface, outline, box, 2, border_radius=5)
+    if text_surf is not None:
+        surface.blit(text_surf, text_surf.get_rect(center=box.center))
+
+
+def paint_key(surface, key_rect, text_surf, fill):
+    """
+    วาดปุ่มแป้นพิมพ์หนึ่งปุ่ม
+    """
+    pygame.draw.rect(surface, fill, key_rect, border_radius=8)
+    surface.blit(text_surf, text_surf.get_rect(center=key_rect.center))
+
+
+class SpriteAtlas:
+    """
+    sprite ของทุกกล่อง (ตัวอักษร, สี) และทุกปุ่ม (ข้อความบนปุ่ม, สี) ที่ขนาดหนึ่ง
+    sprite ทึบ (พื้นเป็นสีพื้นหลัง) จึงใช้ได้เฉพาะเมื่อวาดทับพื้นหลังสีนั้น
+    """
+
+    def __init__(self, colors, background):
+        self.colors = colors
+        self.background = background
+        self.spec = None # ขนาดและฟอนต์ของ atlas ชุดปัจจุบัน
+        # (ขนาดกล่อง, sprite กล่อง, sprite ปุ่ม) ของชุดปัจจุบัน เปลี่ยนทั้ง tuple ในครั้งเดียว
+        self.sprites = (None, {}, {})
+        self.builds = 0
+        self._requested = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def request(self, tile_size, labels, letter_font, key_font):
+        """
+        ขอ atlas สำหรับกล่องขนาด tile_size (กว้าง, สูง) และปุ่มใน labels:
+        ((ข้อความบนปุ่ม, ขนาดปุ่ม, สีที่เป็นไปได้), ...)
+        ถ้ายังไม่มี จะสร้างใน thread เบื้องหลัง (คำขอใหม่ยกเลิกคำขอเก่าที่ยังสร้างไม่เสร็จ)
+        """
+        spec = (tile_size, labels, letter_font, key_font)
+        with self._lock:
+            if spec == self.spec or spec == self._requested:
+                return
+            self._requested = spec
+            if self._running:
+                return # thread ที่ทำงานอยู่จะเห็นคำขอใหม่เองเมื่อสร้างชุดเดิมเสร็จหรือถูกยกเลิก
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                spec = self._requested
+                if spec is None or spec == self.spec:
+                    self._requested = None
+                    self._running = False
+                    return
+            tiles, keys = self._build(spec)
+            with self._lock:
+                if tiles is not None and spec == self._requested:
+                    # สลับทั้งชุดในครั้งเดียว ผู้วาดจึงไม่เห็น atlas ที่สร้างไม่ครบ
+                    self.sprites = (spec[0], tiles, keys)
+                    self.spec = spec
+                    self._requested = None
+                    self._running = False
+                    self.builds += 1
+                    return
+
+    def _stale(self, spec):
+        return spec is not self._requested
+
+    def _build(self, spec):
+        tile_size, labels, letter_font, key_font = spec
+        colors = self.colors
+        box = pygame.Rect((0, 0), tile_size)
+        tiles = {}
+        for letter in TILE_LETTERS:
+            text_surf = letter_font.render(letter.upper(), True, colors[TEXT_COLOR]) if letter else None
+            for color_key, outlined in TILE_STATES:
+                sprite = pygame.Surface(tile_size)
+                sprite.fill(self.background)
+                paint_tile(sprite, box, text_surf, colors[color_key],
+                           colors[TILE_OUTLINE] if outlined else None)
+                tiles[(letter, color_key, outlined)] = sprite
+            if self._stale(spec):
+                return None, None
+
+        keys = {}
+        for label, size, states in labels:
+            rect = pygame.Rect((0, 0), size)
+            text_surf = key_font.render(label, True, colors[TEXT_COLOR])
+            for color_name in states:
+                sprite = pygame.Surface(size)
+                sprite.fill(self.background)
+                paint_key(sprite, rect, text_surf, colors[color_name])
+                keys[(label, color_name)] = sprite
+            if self._stale(spec):
+                return None, None
+        return tiles, keys
+
+    def tile(self, letter, color_key, outlined, size):
+        """
+        sprite ของกล่อง หรือ None ถ้า atlas ของขนาดนี้ยังไม่พร้อม
+        """
+        tile_size, tiles, _ = self.sprites
+        if size != tile_size:
+            return None
+        return tiles.get((letter, color_key, outlined))
+
+    def key(self, label, color_name, size):
+        """
+        sprite ของปุ่ม หรือ None ถ้า atlas ของขนาดนี้ยังไม่พร้อม
+        """
+        sprite = self.sprites[2].get((label, color_name))
+        if sprite is None or sprite.get_size() != size:
+            return None
+        return sprite
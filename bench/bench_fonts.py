@@ -0,0 +1,55 @@
+"""
+วัดเวลาต่อเฟรมของการวาดหัวข้อเมนู: get_font แบบเดิม (ตรวจไฟล์ + สร้าง Font ทุกครั้ง)
+เทียบกับ FONT_REGISTRY ที่สร้างฟอนต์ครั้งเดียวต่อขนาด
+ทั้งสองแบบ render ข้อความใหม่ทุกเฟรม (ไม่ผ่าน TEXT_CACHE) จึงวัดเฉพาะส่วนที่ได้จากการ cache ฟอนต์
+
+วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+    python bench/bench_fonts.py [จำนวนเฟรม]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import Wordle
+
+
+def uncached_get_font(size):
+    """
+    get_font แบบเดิม: ตรวจไฟล์ฟอนต์และสร้าง Font ใหม่ทุกครั้งที่เรียก
+    """
+    for f in Wordle.FONT_FILES:
+        if os.path.exists(f):
+            return pygame.font.Font(f, size)
+    return pygame.font.SysFont("segoeui", size, bold=True)
+
+
+def time_frames(screen, get_font, frames):
+    # วาดหัวข้อแบบเดียวกับ title_item หนึ่งเฟรม (หาฟอนต์ด้วย get_font และ render ใหม่) แล้วคืนเวลาเฉลี่ยต่อเฟรม (ms)
+    y_pos = int(Wordle.HEIGHT * (int(Wordle.HEIGHT * 0.15) / 750)) # ตำแหน่งเดียวกับหัวข้อของเมนูหลัก
+    font_size = max(28, min(64, Wordle.WIDTH // 14))
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill(Wordle.BG_COLOR)
+        label = get_font(font_size).render("Wordle", True, Wordle.TEXT_COLOR)
+        screen.blit(label, label.get_rect(center=(Wordle.WIDTH // 2, y_pos)))
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    screen = Wordle.init_display()
+    before = time_frames(screen, uncached_get_font, frames)
+    after = time_frames(screen, Wordle.FONT_REGISTRY.get, frames)
+    print(f"title, uncached get_font + render: {before:.3f} ms/frame")
+    print(f"title, FONT_REGISTRY.get + render: {after:.3f} ms/frame")
+    print(f"saved per frame                  : {before - after:.3f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+ตรวจสอบและวัดความเร็วของ feedback.score_many เทียบกับ check_guess แบบเดิม
+
+วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+    python bench/bench_score.py [จำนวนคู่]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import feedback
+from wordle_engine import WordleEngine
+
+
+_REFERENCE = WordleEngine() # ไม่มี feedback_table จึงใช้วิธีนับตัวอักษรแบบเดิมของ check_guess
+
+
+def reference_check(guess, target_word):
+    """
+    ผลลัพธ์จากตรรกะ check_guess เดิม (ไม่รวมการอัปเดตคีย์บอร์ด)
+    """
+    _REFERENCE.target_word = target_word
+    return _REFERENCE._score_guess(guess)
+
+
+def verify(words):
+    # เทียบทุกคู่ของรายการคำ ผลต้องตรงกันทุกตำแหน่ง
+    codes = feedback.build_matrix(words)
+    mismatches = 0
+    for g, guess in enumerate(words):
+        for a, answer in enumerate(words):
+            if feedback.decode_pattern(codes[g, a]) != reference_check(guess, answer):
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    n_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    words = []
+    for filename in feedback.WORD_FILES:
+        words.extend(feedback.read_word_file(filename))
+    encoded = feedback.encode_words(words)
+
+    small = feedback.read_word_file("words_easy.txt")
+    print(f"verify words_easy.txt ({len(small) ** 2} pairs): {verify(small)} mismatches")
+
+    rng = np.random.default_rng(0)
+    guesses = encoded[rng.integers(0, len(words), n_pairs)]
+    targets = encoded[rng.integers(0, len(words), n_pairs)]
+
+    start = time.perf_counter()
+    codes = feedback.score_many(guesses, targets)
+    elapsed = time.perf_counter() - start
+    print(f"score_many: {n_pairs / elapsed / 1e6:.1f} M pairs/sec")
+
+    sample = min(n_pairs, 200_000)
+    start = time.perf_counter()
+    mismatches = 0
+    for k in range(sample):
+        guess = "".join(chr(c + ord('a')) for c in guesses[k])
+        target = "".join(chr(c + ord('a')) for c in targets[k])
+        if feedback.decode_pattern(codes[k]) != reference_check(guess, target):
+            mismatches += 1
+    elapsed = time.perf_counter() - start
+    print(f"reference : {sample / elapsed / 1e6:.2f} M pairs/sec (incl. decode), {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+วัดเวลาเปิดเกมแบบ cold start: ตั้งแต่เริ่ม process จนถึงเฟรมแรกของเมนูหลัก
+และแยกเวลา import ของแต่ละโมดูลด้วย python -X importtime
+
+โหมด legacy จำลองลำดับเดิม (pygame.init() ที่เปิด mixer ด้วย และโหลดเสียงทั้งหมดก่อนวาดเมนู)
+เพื่อเทียบกับลำดับปัจจุบันในเครื่องเดียวกัน
+ไฟล์ settings และสถิติของแต่ละรอบถูกเขียนลงโฟลเดอร์ชั่วคราว ไม่ปนกับไฟล์ของผู้เล่นในโปรเจกต์
+
+วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+    python bench/bench_startup.py [จำนวนรอบ]
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# โค้ดที่รันใน process ใหม่: พิมพ์เวลา (ms) ตอน flip เฟรมแรกของ main_menu แล้วออกทันที
+CHILD = """
+import os, sys, time
+sys.path.insert(0, {root!r})
+import pygame
+_flip = pygame.display.flip
+def first_flip():
+    _flip()
+    # os.write ไม่ผ่าน buffer ของ sys.stdout จึงไม่ปนกับข้อความจาก thread โหลดเสียง
+    os.write(1, ("\\nFIRST_FRAME %f\\n" % ((time.time() - {start!r}) * 1000)).encode())
+    os._exit(0)
+pygame.display.flip = first_flip
+import Wordle
+# ชี้ไฟล์ settings และสถิติไปที่โฟลเดอร์ชั่วคราว (ค่า default ของฟังก์ชันถูกผูกไว้ตอน import จึงต้องแก้ด้วย)
+Wordle.SETTINGS_FILE = os.path.join({tmp!r}, "settings.json")
+Wordle.load_settings.__defaults__ = (Wordle.SETTINGS_FILE,)
+Wordle.save_settings.__defaults__ = (Wordle.SETTINGS_FILE,)
+Wordle.WordleGamePygame.__init__.__defaults__ = (os.path.join({tmp!r}, "wordle_stats_en.json"),)
+if {legacy!r}:
+    pygame.init()
+    pygame.mixer.init()
+    Wordle.SoundLoader.start = lambda self, on_music_ready=None: self._load_all(on_music_ready)
+Wordle.main_menu()
+"""
+
+
+def time_to_first_frame(legacy):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    with tempfile.TemporaryDirectory() as tmp:
+        code = CHILD.format(root=ROOT, start=time.time(), legacy=legacy, tmp=tmp)
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, timeout=60)
+    match = re.search(r"FIRST_FRAME ([0-9.]+)", out.stdout)
+    if match:
+        return float(match.group(1))
+    raise RuntimeError(f"no frame drawn: {out.stderr[-500:]}")
+
+
+def import_breakdown(top=12):
+    # รัน -X importtime แล้วคืนโมดูลที่ใช้เวลาสะสมมากที่สุด (ms, ชื่อโมดูล)
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import Wordle"],
+                         cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us) / 1000, name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {}
+    for legacy in (True, False):
+        times = [time_to_first_frame(legacy) for _ in range(runs)]
+        results[legacy] = statistics.median(times)
+        label = "legacy " if legacy else "current"
+        print(f"{label}: time to first frame median {results[legacy]:.1f} ms "
+              f"(min {min(times):.1f}, max {max(times):.1f}, {runs} runs)")
+    print(f"speedup: {results[True] / results[False]:.2f}x")
+
+    print("\nimport Wordle (-X importtime, cumulative):")
+    for ms, name in import_breakdown():
+        print(f"  {ms:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+ตรวจสอบและวัดเวลาของ storage.GameLogStore ในโฟลเดอร์ชั่วคราว (ไม่แตะไฟล์สถิติของผู้เล่น)
+- เวลาบันทึกหนึ่งเกมต้องคงที่ ไม่ว่าประวัติจะยาวแค่ไหน
+- โหลดใหม่แล้วได้สถิติและ analytics เท่าเดิม และ iter_games คืนครบทุกเกม (log เป็น append-only)
+- บรรทัดสุดท้ายที่เขียนไม่ครบ (โปรแกรมดับกลางการเขียน) ถูกตัดทิ้ง และเกมถัดไปต่อท้ายได้ปกติ
+- log ที่สั้นกว่า log_offset ใน snapshot (ถูกลบหรือตัดทิ้ง) ไม่ทำให้โหลดพัง
+
+วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+    python bench/bench_storage.py [จำนวนเกม]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import GameLogStore
+
+
+def make_record(i):
+    # เกมจำลอง: แพ้ทุกเกมที่สาม จำนวนครั้งที่เดา 1-6 วนไป
+    guesses = ["crane"] * (i % 6 + 1)
+    return {"mode": ("classic", "unlimited", "limited_time")[i % 3], "target": f"w{i % 40:04d}",
+            "guesses": guesses, "results": [["GRAY"] * 5] * len(guesses),
+            "win": i % 3 != 0, "duration_ms": 1000 + 37 * i}
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(f"FAIL: {message}")
+    print(f"ok   {message}")
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 2023
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        store = GameLogStore(stats_file)
+
+        # เวลาเฉลี่ยต่อเกมของ 100 เกมแรกเทียบกับ 100 เกมสุดท้าย
+        times = []
+        for i in range(games):
+            start = time.perf_counter()
+            store.record_game(make_record(i))
+            times.append(time.perf_counter() - start)
+        first = sum(times[:100]) / 100 * 1000
+        last = sum(times[-100:]) / 100 * 1000
+        print(f"record_game: first 100 {first:.3f} ms/game, last 100 {last:.3f} ms/game ({games} games)")
+
+        stats, analytics = dict(store.stats), store.analytics.to_dict()
+        start = time.perf_counter()
+        reloaded = GameLogStore(stats_file)
+        print(f"load: {(time.perf_counter() - start) * 1000:.2f} ms (replayed {reloaded.pending} games from the log tail)")
+        check(reloaded.stats == stats, "reload gives the same summary")
+        check(reloaded.analytics.to_dict() == analytics, "reload gives the same analytics")
+        check(sum(1 for _ in reloaded.iter_games()) == games, f"iter_games returns all {games} games")
+
+        # จำลองโปรแกรมดับกลางการเขียนบรรทัดสุดท้าย
+        with open(reloaded.log_file, 'ab') as f:
+            f.write(b'{"mode":"classic","target":"tor')
+        repaired = GameLogStore(stats_file)
+        check(repaired.stats == stats, "torn last line is ignored")
+        repaired.record_game(make_record(games))
+        after_crash = GameLogStore(stats_file)
+        check(after_crash.stats["played"] == stats["played"] + 1, "next game after a torn line is counted")
+        check(sum(1 for _ in after_crash.iter_games()) == games + 1, "log stays readable after the repair")
+
+        # log หายไปทั้งไฟล์ ขณะที่ snapshot ยังชี้ offset เดิม
+        after_crash.compact()
+        summary = dict(after_crash.stats)
+        os.remove(after_crash.log_file)
+        missing = GameLogStore(stats_file)
+        check(missing.stats == summary, "missing log falls back to the snapshot")
+        missing.record_game(make_record(0))
+        check(GameLogStore(stats_file).stats["played"] == summary["played"] + 1, "new log after a missing one is counted")
+
+
+if __name__ == "__main__":
+    main()
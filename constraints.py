@@ -0,0 +1,110 @@
+"""
+ดัชนี bitset สำหรับกรองคำที่ยังเป็นไปได้หลังการเดาแต่ละครั้ง
+แต่ละชุดคำเก็บเป็น int ของ Python (บิตที่ i = คำที่ i ใน word bank)
+การใช้ผลลัพธ์หนึ่งแถวจึงเป็นแค่การ AND ไม่กี่ครั้ง และนับจำนวนคำด้วย bit_count()
+"""
+
+WORD_LENGTH = 5
+
+# ดัชนีที่สร้างแล้วของแต่ละไฟล์คำศัพท์
+_INDEXES = {}
+
+
+class ConstraintIndex:
+    """
+    bitset ของคำต่อ (ตำแหน่ง, ตัวอักษร) และต่อ (ตัวอักษร, จำนวนขั้นต่ำ)
+    """
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        self.word_index = {word: i for i, word in enumerate(self.words)}
+        self.all_bits = (1 << len(self.words)) - 1
+        # position[i][letter] = คำที่มี letter อยู่ที่ตำแหน่ง i
+        self.position = [{} for _ in range(WORD_LENGTH)]
+        # at_least[letter][k] = คำที่มี letter อย่างน้อย k ตัว (k = 0..5)
+        self.at_least = {}
+
+        for n, word in enumerate(self.words):
+            bit = 1 << n
+            for i, letter in enumerate(word):
+                self.position[i][letter] = self.position[i].get(letter, 0) | bit
+            for letter in set(word):
+                levels = self.at_least.setdefault(letter, [self.all_bits] + [0] * WORD_LENGTH)
+                for k in range(1, word.count(letter) + 1):
+                    levels[k] |= bit
+
+    def apply(self, bits, guess, result):
+        """
+        กรองชุดคำ bits ด้วยผลลัพธ์ของคำเดาหนึ่งครั้ง (result เป็น list ของชื่อสี)
+        """
+        counts = {} # letter -> [จำนวนที่เป็นเขียว/เหลือง, มีสีเทาหรือไม่]
+        for i, (letter, color) in enumerate(zip(guess, result)):
+            pos_bits = self.position[i].get(letter, 0)
+            if color == "GREEN":
+                bits &= pos_bits
+            else:
+                bits &= ~pos_bits
+            seen = counts.setdefault(letter, [0, False])
+            if color == "GRAY":
+                seen[1] = True
+            else:
+                seen[0] += 1
+
+        for letter, (found, capped) in counts.items():
+            levels = self.at_least.get(letter)
+            if levels is None: # ไม่มีคำไหนมีตัวอักษรนี้เลย
+                if found:
+                    return 0
+                continue
+            if found:
+                bits &= levels[found]
+            if capped and found < WORD_LENGTH:
+                # มีสีเทา แปลว่าคำตอบมีตัวอักษรนี้พอดี found ตัว
+                bits &= ~levels[found + 1]
+        return bits
+
+    def filter(self, history, bits=None):
+        """
+        ใช้ผลลัพธ์ทุกแถวของประวัติการเดา history: list ของ (คำเดา, ผลลัพธ์)
+        """
+        if bits is None:
+            bits = self.all_bits
+        for guess, result in history:
+            bits = self.apply(bits, guess, result)
+        return bits
+
+    def count(self, bits):
+        """
+        จำนวนคำในชุด
+        """
+        return bits.bit_count()
+
+    def contains(self, bits, word):
+        """
+        ตรวจสอบว่าคำนี้อยู่ในชุดหรือไม่ (คำที่ไม่อยู่ใน word bank คืน False)
+        """
+        n = self.word_index.get(word)
+        return n is not None and (bits >> n) & 1 == 1
+
+    def words_in(self, bits):
+        """
+        คืน list ของคำในชุด (เรียงตามลำดับใน word bank)
+        """
+        words = []
+        while bits:
+            low = bits & -bits
+            n = low.bit_length() - 1
+            words.append(self.words[n])
+            bits ^= low
+        return words
+
+
+def get_constraint_index(words, name):
+    """
+    คืนดัชนีของรายการคำ (สร้างใหม่เฉพาะเมื่อรายการคำของไฟล์นี้เปลี่ยน)
+    """
+    index = _INDEXES.get(name)
+    if index is None or (index.words is not words and index.words != tuple(words)):
+        index = ConstraintIndex(words)
+        _INDEXES[name] = index
+    return index
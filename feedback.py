@@ -0,0 +1,284 @@
+"""
+ตารางผลลัพธ์ (feedback matrix) ที่คำนวณไว้ล่วงหน้าสำหรับทุกคู่ (คำเดา, คำตอบ)
+เก็บผลลัพธ์ GREEN/YELLOW/GRAY ของแต่ละคู่เป็นรหัสฐาน 3 ขนาด uint8 (3^5 = 243 แบบ)
+และบันทึกลงไฟล์ .npy ในโฟลเดอร์ cache โดยตั้งชื่อตาม hash ของรายการคำ
+ทำให้การตรวจคำเดา (check_guess) และ solver กลายเป็นการเปิดตารางเท่านั้น
+"""
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+import lexicon
+
+WORD_LENGTH = 5
+GRAY, YELLOW, GREEN = 0, 1, 2
+COLOR_NAMES = ("GRAY", "YELLOW", "GREEN")
+NUM_PATTERNS = 3 ** WORD_LENGTH
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+WORD_FILES = ("words_easy.txt", "words_medium.txt", "words_hard.txt")
+
+# ตารางแปลงรหัส -> รายชื่อสี (สร้างครั้งเดียว)
+_DECODED = tuple(
+    tuple(COLOR_NAMES[(code // 3 ** i) % 3] for i in range(WORD_LENGTH))
+    for code in range(NUM_PATTERNS)
+)
+_COLOR_DIGITS = {name: digit for digit, name in enumerate(COLOR_NAMES)}
+
+# ตารางที่โหลดแล้วในโปรเซสนี้ (key: ชื่อรายการคำ, digest)
+_LOADED = {}
+# ตารางล่าสุดของแต่ละชื่อ (ใช้ตรวจแบบเร็วเมื่อได้ tuple เดิมจาก lexicon)
+_LATEST = {}
+
+
+def encode_words(words):
+    """
+    แปลงรายการคำ (a-z) เป็นอาร์เรย์ uint8 ขนาด (N, 5) โดย a=0 ... z=25
+    """
+    if not words:
+        return np.zeros((0, WORD_LENGTH), dtype=np.uint8)
+    raw = "".join(words).encode("ascii")
+    letters = np.frombuffer(raw, dtype=np.uint8).reshape(len(words), WORD_LENGTH)
+    return letters - ord('a')
+
+
+def pattern_code(result):
+    """
+    แปลงผลลัพธ์ (list ของ "GREEN"/"YELLOW"/"GRAY") เป็นรหัสฐาน 3
+    """
+    return sum(_COLOR_DIGITS[name] * 3 ** i for i, name in enumerate(result))
+
+
+def decode_pattern(code):
+    """
+    แปลงรหัสฐาน 3 กลับเป็น list ของชื่อสี (รูปแบบเดียวกับ check_guess)
+    """
+    return list(_DECODED[int(code)])
+
+
+def words_digest(words):
+    """
+    คำนวณ hash ของรายการคำ ใช้เป็น key ของไฟล์ cache
+    (ถ้าไฟล์คำศัพท์เปลี่ยน digest จะเปลี่ยนและตารางจะถูกคำนวณใหม่)
+    """
+    return hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()[:16]
+
+
+def read_word_file(filename):
+    """
+    อ่านไฟล์คำศัพท์ด้วยกฎเดียวกับ _load_words_from_file ของเกม (ผ่านแคชของ lexicon)
+    """
+    return lexicon.load_word_bank(filename, WORD_LENGTH)
+
+
+# จำนวนคู่ที่ประมวลผลต่อรอบ (ให้ข้อมูลทั้งหมดพอดีกับ cache ของ CPU)
+SCORE_CHUNK = 1 << 16
+
+# ค่าพิเศษสำหรับตัวอักษรที่ถูกใช้เป็นสีเขียวแล้ว (ไม่มีวันตรงกับ 0-25)
+_USED_TARGET = 255
+_USED_GUESS = 254
+
+
+def _as_encoded(words):
+    """
+    รับ list ของคำ หรืออาร์เรย์ที่เข้ารหัสแล้ว คืนอาร์เรย์ uint8 ขนาด (N, 5) หรือ (5,)
+    """
+    if isinstance(words, str):
+        return encode_words([words])[0]
+    if isinstance(words, np.ndarray):
+        return words.astype(np.uint8, copy=False)
+    return encode_words(list(words))
+
+
+def _score_chunk(guesses_t, targets_t):
+    """
+    ให้คะแนนหนึ่งช่วงของคู่คำ อาร์เรย์อยู่ในรูป (5, n) เพื่อให้แต่ละตำแหน่งต่อเนื่องกันในหน่วยความจำ
+    (ใช้ buffer เดิมซ้ำด้วย out= เพื่อไม่ให้สร้างอาร์เรย์ชั่วคราวในลูป)
+    """
+    n = guesses_t.shape[1]
+    green = guesses_t == targets_t
+    green_u8 = green.view(np.uint8)
+    codes = np.zeros(n, dtype=np.uint8)
+    weighted = np.empty(n, dtype=np.uint8)
+    for i in range(WORD_LENGTH):
+        np.multiply(green_u8[i], np.uint8(GREEN * 3 ** i), out=weighted)
+        codes += weighted
+
+    # ตัดตัวอักษรที่เป็นสีเขียวออก (รอบแรก) ก่อนนับสีเหลือง (รอบสอง)
+    targets_free = np.where(green, np.uint8(_USED_TARGET), targets_t)
+    guesses_free = np.where(green, np.uint8(_USED_GUESS), guesses_t)
+
+    match = np.empty(n, dtype=bool)
+    match_u8 = match.view(np.uint8)
+    available = np.empty(n, dtype=np.uint8)
+    used_before = np.empty(n, dtype=np.uint8)
+    for i in range(WORD_LENGTH):
+        letter = guesses_free[i]
+        # จำนวนตัวอักษรนี้ในคำตอบที่ยังเหลืออยู่
+        available.fill(0)
+        for k in range(WORD_LENGTH):
+            np.equal(targets_free[k], letter, out=match)
+            available += match_u8
+        # จำนวนตัวเดียวกันก่อนหน้าในคำเดา (ได้สีเหลืองไปก่อนตามลำดับ)
+        used_before.fill(0)
+        for j in range(i):
+            np.equal(guesses_free[j], letter, out=match)
+            used_before += match_u8
+        np.less(used_before, available, out=match)
+        np.multiply(match_u8, np.uint8(YELLOW * 3 ** i), out=weighted)
+        codes += weighted
+    return codes
+
+
+def score_many(guesses, targets):
+    """
+    ให้คะแนนคำเดาเทียบกับคำตอบทีละคู่แบบ vectorized (ตรรกะเดียวกับ check_guess)
+    guesses/targets เป็น list ของคำ หรืออาร์เรย์ (N, 5) ที่ได้จาก encode_words
+    ฝั่งใดฝั่งหนึ่งเป็นคำเดียวได้ (จะ broadcast) คืนรหัสผลลัพธ์ uint8 ขนาด (N,)
+    """
+    guesses, targets = np.broadcast_arrays(_as_encoded(guesses), _as_encoded(targets))
+    if guesses.ndim == 1:
+        return _score_chunk(guesses[:, None], targets[:, None])
+    n = len(guesses)
+    codes = np.empty(n, dtype=np.uint8)
+    for start in range(0, n, SCORE_CHUNK):
+        stop = min(start + SCORE_CHUNK, n)
+        codes[start:stop] = _score_chunk(
+            np.ascontiguousarray(guesses[start:stop].T),
+            np.ascontiguousarray(targets[start:stop].T),
+        )
+    return codes
+
+
+def build_matrix(guess_words, answer_words=None):
+    """
+    สร้างตาราง (จำนวนคำเดา, จำนวนคำตอบ) ของรหัสผลลัพธ์แบบ uint8
+    """
+    if answer_words is None:
+        answer_words = guess_words
+    guesses = _as_encoded(guess_words)
+    answers = _as_encoded(answer_words)
+    matrix = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    if len(answers) == 0:
+        return matrix
+    rows_per_block = max(1, SCORE_CHUNK // len(answers))
+    for start in range(0, len(guesses), rows_per_block):
+        block = guesses[start:start + rows_per_block]
+        pairs_g = np.repeat(block, len(answers), axis=0)
+        pairs_t = np.tile(answers, (len(block), 1))
+        matrix[start:start + len(block)] = score_many(pairs_g, pairs_t).reshape(len(block), len(answers))
+    return matrix
+
+
+class FeedbackMatrix:
+    """
+    ตารางผลลัพธ์ของรายการคำหนึ่งชุด (ใช้ทั้งเป็นคำเดาและคำตอบ)
+    """
+
+    def __init__(self, words, matrix, digest):
+        self.words = tuple(words)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.matrix = matrix
+        self.digest = digest
+
+    def code(self, guess, answer):
+        """
+        คืนรหัสผลลัพธ์ของคู่ (guess, answer) หรือ None ถ้าคำใดไม่อยู่ในตาราง
+        """
+        g = self.index.get(guess)
+        a = self.index.get(answer)
+        if g is None or a is None:
+            return None
+        return int(self.matrix[g, a])
+
+    def pattern(self, guess, answer):
+        """
+        คืนผลลัพธ์เป็น list ของชื่อสี หรือ None ถ้าคำใดไม่อยู่ในตาราง
+        """
+        code = self.code(guess, answer)
+        return None if code is None else decode_pattern(code)
+
+
+def _cache_path(name, digest):
+    stem = os.path.splitext(os.path.basename(name))[0]
+    return os.path.join(CACHE_DIR, f"feedback_{stem}_{digest}.npy")
+
+
+def _remove_stale(name, keep_path):
+    # ลบไฟล์ cache เก่าของรายการคำเดียวกันที่ digest ไม่ตรงแล้ว
+    stem = os.path.splitext(os.path.basename(name))[0]
+    prefix = f"feedback_{stem}_"
+    try:
+        for entry in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, entry)
+            if entry.startswith(prefix) and entry.endswith(".npy") and path != keep_path:
+                os.remove(path)
+    except OSError as e:
+        print(f"Could not clean feedback cache: {e}")
+
+
+def load_feedback_matrix(words, name):
+    """
+    โหลดตารางผลลัพธ์ของรายการคำ (memory-mapped จากไฟล์ .npy)
+    ถ้ายังไม่มีไฟล์หรือรายการคำเปลี่ยน จะคำนวณใหม่และบันทึกลง cache
+    """
+    latest = _LATEST.get(os.path.basename(name))
+    if latest is not None and latest.words is words:
+        return latest
+
+    words = tuple(words)
+    digest = words_digest(words)
+    key = (os.path.basename(name), digest)
+    if key in _LOADED:
+        _LATEST[key[0]] = _LOADED[key]
+        return _LOADED[key]
+
+    path = _cache_path(name, digest)
+    matrix = None
+    if os.path.exists(path):
+        try:
+            matrix = np.load(path, mmap_mode='r')
+            if matrix.shape != (len(words), len(words)) or matrix.dtype != np.uint8:
+                matrix = None
+        except Exception as e:
+            print(f"Could not load feedback cache {path}: {e}")
+            matrix = None
+
+    if matrix is None:
+        matrix = build_matrix(words)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, path) # เขียนไฟล์ชั่วคราวก่อนแล้วค่อยแทนที่
+            _remove_stale(name, path)
+        except OSError as e:
+            print(f"Could not save feedback cache {path}: {e}")
+
+    table = FeedbackMatrix(words, matrix, digest)
+    _LOADED[key] = table
+    _LATEST[key[0]] = table
+    return table
+
+
+def precompute_all(filenames=WORD_FILES):
+    """
+    คำนวณ (หรือตรวจสอบ) ตารางของไฟล์คำศัพท์ทั้งหมดล่วงหน้า
+    """
+    tables = {}
+    for filename in filenames:
+        try:
+            words = read_word_file(filename)
+        except FileNotFoundError:
+            print(f"Warning: Word file '{filename}' not found. Skipping.")
+            continue
+        tables[filename] = load_feedback_matrix(words, filename)
+    return tables
+
+
+if __name__ == "__main__":
+    for filename, table in precompute_all(sys.argv[1:] or WORD_FILES).items():
+        print(f"{filename}: {len(table.words)} words, digest {table.digest}")
@@ -0,0 +1,130 @@
+"""
+ตำแหน่งของกล่องตัวอักษร ปุ่มแป้นพิมพ์ และไอคอนในหน้าเกม
+คำนวณครั้งเดียวต่อขนาดหน้าจอ (และขนาดตาราง) แล้วเก็บไว้ใน LayoutCache
+โค้ดวาดและโค้ดตรวจการคลิกอ่าน Rect จากที่คำนวณไว้ ไม่ต้องสร้าง Rect ใหม่ทุกเฟรม
+ห้ามแก้ค่า Rect ที่ได้จากที่นี่ (ใช้ร่วมกันทุกเฟรม)
+"""
+from collections import OrderedDict
+
+import pygame
+
+# แถวของแป้นพิมพ์เสมือน (QWERTY)
+KEY_ROWS = (
+    tuple("qwertyuiop"),
+    tuple("asdfghjkl"),
+    ("ENTER",) + tuple("zxcvbnm") + ("BACK",),
+)
+# ปุ่มที่กว้าง 1.5 เท่า และใช้สีเริ่มต้นเสมอ
+WIDE_KEYS = ("ENTER", "BACK")
+KEY_LABELS = {"BACK": "<="}
+# จำนวน layout ที่เก็บไว้ (เช่น ตอนลากปรับขนาดหน้าต่างไปมา)
+MAX_LAYOUTS = 8
+
+
+class GameLayout:
+    """
+    ตำแหน่งทั้งหมดของหน้าเกมสำหรับหน้าจอขนาด size
+    tiles[แถว][คอลัมน์] = Rect ของกล่อง, keys = ((ชื่อปุ่ม, Rect, ข้อความบนปุ่ม, ปุ่มกว้างหรือไม่), ...)
+    """
+
+    def __init__(self, size, word_length, rows):
+        self.size = size
+        self.word_length = word_length
+        self.rows = rows
+        width, height = size
+        self.tiles = self._tile_rects(width, height, word_length, rows)
+        self.keys = self._key_rects(width, height)
+
+        margin = 10
+        icon_size = int(min(width, height) * 0.06)
+        self.gear_rect = pygame.Rect(margin, height - icon_size - margin, icon_size, icon_size) # มุมล่างซ้าย
+        self.return_rect = pygame.Rect(margin, margin, icon_size, icon_size) # มุมบนซ้าย
+
+    @staticmethod
+    def _tile_rects(width, height, word_length, rows):
+        board_area_h = height * 0.5
+        padding_ratio = 0.1
+        grid_width_ratio = word_length + (word_length - 1) * padding_ratio
+        box_size_w = (width * 0.8) / grid_width_ratio
+
+        grid_height_ratio = rows + (rows - 1) * padding_ratio
+        box_size_h = board_area_h / grid_height_ratio
+
+        box_size = min(box_size_w, box_size_h, 80)
+        padding = box_size * padding_ratio
+
+        grid_width = (box_size * word_length) + (padding * (word_length - 1))
+        start_x = (width - grid_width) / 2
+        start_y = height * 0.1
+        return tuple(
+            tuple(pygame.Rect(start_x + j * (box_size + padding), start_y + i * (box_size + padding),
+                              box_size, box_size)
+                  for j in range(word_length))
+            for i in range(rows))
+
+    @staticmethod
+    def _key_rects(width, height):
+        keyboard_area_y = height * 0.25
+        key_h = (keyboard_area_y / 4) * 0.9
+        key_w = min(width * 0.08, key_h * 1.3)
+        padding = key_w * 0.15
+        start_y = height * 0.7
+
+        keys = []
+        for i, row in enumerate(KEY_ROWS):
+            # ความกว้างแถว (ปุ่ม ENTER/BACK กว้างกว่า)
+            total_key_units = sum(1.5 if key in WIDE_KEYS else 1 for key in row)
+            row_width = (total_key_units * key_w) + ((len(row) - 1) * padding)
+            current_x = (width - row_width) / 2
+            current_y = start_y + i * (key_h + padding * 0.8)
+            for key in row:
+                wide = key in WIDE_KEYS
+                current_key_w = key_w * 1.5 if wide else key_w
+                keys.append((key, pygame.Rect(current_x, current_y, current_key_w, key_h),
+                             KEY_LABELS.get(key, key.upper()), wide))
+                current_x += current_key_w + padding
+        return tuple(keys)
+
+    def key_at(self, pos):
+        """
+        ชื่อปุ่มแป้นพิมพ์ที่ตำแหน่ง pos หรือ None
+        """
+        for key, rect, _, _ in self.keys:
+            if rect.collidepoint(pos):
+                return key
+        return None
+
+
+class LayoutCache:
+    """
+    เก็บ GameLayout ตาม (ขนาดหน้าจอ, ความยาวคำ, จำนวนแถว) แบบ LRU
+    layout ที่ใช้ล่าสุดถูกคืนทันทีโดยไม่ต้องสร้าง key ใหม่
+    """
+
+    def __init__(self, max_size=MAX_LAYOUTS):
+        self.max_size = max_size
+        self.layouts = OrderedDict()
+        self.current = None
+        self.builds = 0
+
+    def get(self, size, word_length, rows):
+        layout = self.current
+        if (layout is not None and layout.size == size and layout.word_length == word_length
+                and layout.rows == rows):
+            return layout
+
+        key = (size, word_length, rows)
+        layout = self.layouts.get(key)
+        if layout is None:
+            layout = self.layouts[key] = GameLayout(size, word_length, rows)
+            self.builds += 1
+            if len(self.layouts) > self.max_size:
+                self.layouts.popitem(last=False)
+        else:
+            self.layouts.move_to_end(key)
+        self.current = layout
+        return layout
+
+    def clear(self):
+        self.layouts.clear()
+        self.current = None
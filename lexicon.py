@@ -0,0 +1,130 @@
+"""
+แคชรายการคำศัพท์ระดับโปรเซส (ใช้ร่วมกันทุกโหมดและทุกอินสแตนซ์ของเกม)
+key คือ path ของไฟล์ และจะอ่านไฟล์ใหม่เฉพาะเมื่อ mtime หรือขนาดไฟล์เปลี่ยน
+คืนค่าเป็น tuple ที่ผ่านการ strip/lower/กรองแล้ว (แก้ไขไม่ได้)
+"""
+import os
+import threading
+from array import array
+
+WORD_LENGTH = 5
+
+# path -> ((mtime_ns, size, word_length), words)
+_CACHE = {}
+_LOCK = threading.Lock()
+
+# รายการคำที่อนุญาตให้เดา (แยกจากรายการคำตอบ) ถ้าไม่มีไฟล์นี้ เกมจะไม่ตรวจว่าคำเดาอยู่ในรายการ
+ALLOWED_GUESS_FILE = "words_allowed.txt"
+# รายการคำตอบที่รวมเข้าไปในคำที่เดาได้เสมอ ไฟล์ที่ไม่มีอยู่จะถูกข้ามไป
+ANSWER_FILES = ("words_easy.txt", "words_medium.txt", "words_hard.txt")
+# คำยาวได้ไม่เกินนี้ (ไบต์ ASCII ของคำต้องใส่ใน uint64 ได้)
+MAX_PACKED_LENGTH = 8
+# (ไฟล์คำที่อนุญาต, ไฟล์คำตอบ) -> (id ของ tuple ต้นทาง, tuple ต้นทาง, CompactLexicon)
+_ALLOWED = {}
+
+
+def _read_words(path, word_length):
+    with open(path, 'r', encoding='utf-8') as f:
+        return tuple(line.strip().lower() for line in f if len(line.strip()) == word_length and line.strip().isalpha())
+
+
+def load_word_bank(filename, word_length=WORD_LENGTH):
+    """
+    โหลดรายการคำจากไฟล์ผ่านแคช คืน tuple ของคำ (อาจว่างถ้าไฟล์ไม่มีคำที่ใช้ได้)
+    ถ้าไม่พบไฟล์จะ raise FileNotFoundError เหมือน open()
+    """
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size, word_length)
+    with _LOCK:
+        cached = _CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    words = _read_words(path, word_length)
+    with _LOCK:
+        _CACHE[path] = (key, words)
+    return words
+
+
+class CompactLexicon:
+    """
+    ชุดคำขนาดใหญ่แบบประหยัดหน่วยความจำ (ประมาณ 12-24 ไบต์ต่อคำ แทน ~60 ไบต์ของ set ของ str)
+    แต่ละคำถูกแปลงเป็นจำนวนเต็ม (ไบต์ ASCII ของคำ) แล้วเก็บในตาราง hash แบบ open addressing
+    (array ของ uint64, 0 = ช่องว่าง) การตรวจสอบใช้ hash ของ str (ซึ่ง Python cache ไว้ในตัว str)
+    แล้วเทียบจำนวนเต็มในช่อง ไม่ต้องตัดไบต์ออกมาเทียบ
+    """
+
+    def __init__(self, words, word_length=WORD_LENGTH):
+        if not 0 < word_length <= MAX_PACKED_LENGTH:
+            raise ValueError(f"CompactLexicon supports words of 1-{MAX_PACKED_LENGTH} letters, got {word_length}")
+        self.word_length = word_length
+        unique = sorted({word for word in words if len(word) == word_length and word.isascii()})
+        self.count = len(unique)
+        # ขนาดตารางเป็นกำลังสองที่ทำให้ load factor ไม่เกิน ~0.67
+        size = 1 << max(3, (self.count * 3 // 2).bit_length())
+        self.mask = size - 1
+        self.slots = array('Q', [0]) * size
+        for word in unique:
+            i = hash(word) & self.mask
+            while self.slots[i]:
+                i = (i + 1) & self.mask
+            self.slots[i] = int.from_bytes(word.encode('ascii'), 'little')
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        try:
+            if len(word) != self.word_length:
+                return False
+            key = int.from_bytes(word.encode('ascii'), 'little')
+        except (UnicodeEncodeError, AttributeError, TypeError):
+            return False
+        slots, mask = self.slots, self.mask
+        i = hash(word) & mask
+        while True:
+            stored = slots[i]
+            if stored == key:
+                return True
+            if not stored:
+                return False
+            i = (i + 1) & mask
+
+    def memory_bytes(self):
+        """
+        ขนาดหน่วยความจำของข้อมูลคำ (ไบต์)
+        """
+        return self.slots.itemsize * len(self.slots)
+
+
+def load_allowed_guesses(filename=ALLOWED_GUESS_FILE, answer_files=ANSWER_FILES, word_length=WORD_LENGTH):
+    """
+    โหลดรายการคำที่อนุญาตให้เดา (filename รวมกับคำตอบใน answer_files) เป็น CompactLexicon
+    สร้างใหม่เฉพาะเมื่อไฟล์ใดไฟล์หนึ่งเปลี่ยน
+    คืน None ถ้าไม่มีไฟล์ filename หรือไฟล์ไม่มีคำที่ใช้ได้ (เกมจะยอมรับทุกคำที่ยาวถูกต้องเหมือนเดิม
+    แทนที่จะปฏิเสธคำทั่วไปที่ไม่ได้อยู่ในรายการคำตอบ)
+    """
+    try:
+        allowed = load_word_bank(filename, word_length)
+    except FileNotFoundError:
+        return None
+    if not allowed:
+        return None
+    sources = [allowed]
+    for answers in answer_files:
+        try:
+            sources.append(load_word_bank(answers, word_length))
+        except FileNotFoundError:
+            continue
+    key = tuple(id(words) for words in sources)
+    cache_key = (filename, answer_files)
+    with _LOCK:
+        cached = _ALLOWED.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[2]
+    packed = CompactLexicon((word for words in sources for word in words), word_length)
+    with _LOCK:
+        # เก็บ tuple ต้นทางไว้ด้วย เพื่อไม่ให้ id ถูกนำไปใช้ซ้ำ
+        _ALLOWED[cache_key] = (key, sources, packed)
+    return packed
+
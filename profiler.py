@@ -0,0 +1,125 @@
+"""
+ตัวจับเวลาต่อเฟรมของลูปเกม (ไม่ใช้ pygame)
+ลูปเรียก begin_frame แล้ว mark(ชื่อส่วน) หลังทำแต่ละส่วนเสร็จ เวลาตั้งแต่ mark ครั้งก่อนจะถูกนับให้ส่วนนั้น
+เก็บเวลาของ ROLLING_FRAMES เฟรมล่าสุดเพื่อคำนวณ p50/p95/p99 และเขียนทุกเฟรมลง CSV ได้
+เมื่อปิดอยู่ (ไม่แสดง overlay และไม่บันทึก CSV) ทุกเมธอดคืนค่าทันที
+"""
+import csv
+import time
+from collections import deque
+
+# ส่วนต่าง ๆ ของหนึ่งเฟรม (ตามลำดับคอลัมน์ใน CSV) "frame" คือเวลารวมทั้งเฟรม
+SECTIONS = ("events", "update", "layout", "header", "board", "keyboard", "message",
+            "icons", "menu", "overlay", "flip", "frame")
+# จำนวนเฟรมล่าสุดที่ใช้คำนวณเปอร์เซ็นไทล์
+ROLLING_FRAMES = 300
+# คำนวณข้อความสรุปใหม่ทุก ๆ กี่เฟรม
+SUMMARY_EVERY = 30
+
+
+class FrameProfiler:
+    """
+    จับเวลาแต่ละส่วนของเฟรม (มิลลิวินาที)
+    """
+
+    def __init__(self, window=ROLLING_FRAMES):
+        self.active = False # True เมื่อแสดง overlay หรือบันทึก CSV
+        self.overlay = False
+        self.samples = {name: deque(maxlen=window) for name in SECTIONS}
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.frames = 0
+        self.summary_version = 0 # เพิ่มขึ้นทุกครั้งที่ข้อความสรุปเปลี่ยน
+        self._summary = []
+        self._frame_start = self._last = 0.0
+        self._in_frame = False # เฟรมนี้เริ่มจับเวลาตอนที่เปิดอยู่ (เปิดกลางเฟรมจะเริ่มนับเฟรมถัดไป)
+        self.csv_path = None
+        self._csv_file = None
+        self._csv_writer = None
+
+    def _update_active(self):
+        self.active = self.overlay or self._csv_writer is not None
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self._update_active()
+        return self.overlay
+
+    def start_csv(self, path):
+        """
+        เริ่มเขียนเวลาของทุกเฟรมลงไฟล์ CSV (หนึ่งแถวต่อเฟรม)
+        """
+        self.stop_csv()
+        try:
+            self._csv_file = open(path, 'w', newline='', encoding='utf-8')
+        except OSError as e:
+            print(f"Could not open profile CSV {path}: {e}")
+            return False
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(("frame_index", "time") + SECTIONS)
+        self.csv_path = path
+        self._update_active()
+        return True
+
+    def stop_csv(self):
+        """
+        ปิดไฟล์ CSV ที่กำลังบันทึก คืน path ของไฟล์ (หรือ None ถ้าไม่ได้บันทึกอยู่)
+        """
+        path = self.csv_path
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = self._csv_writer = self.csv_path = None
+        self._update_active()
+        return path
+
+    def begin_frame(self):
+        self._in_frame = self.active
+        if not self.active:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        for name in SECTIONS:
+            self.current[name] = 0.0
+
+    def mark(self, name):
+        """
+        นับเวลาตั้งแต่ mark ครั้งก่อน (หรือตั้งแต่ begin_frame) ให้ส่วน name
+        """
+        if not self._in_frame:
+            return
+        now = time.perf_counter()
+        self.current[name] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if not self._in_frame:
+            return
+        self._in_frame = False
+        now = time.perf_counter()
+        self.current["frame"] = (now - self._frame_start) * 1000
+        for name in SECTIONS:
+            self.samples[name].append(self.current[name])
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([self.frames, f"{time.time():.3f}"] +
+                                      [f"{self.current[name]:.4f}" for name in SECTIONS])
+        self.frames += 1
+        if self.frames % SUMMARY_EVERY == 0:
+            self._summary = None
+
+    def percentiles(self, name, qs=(50, 95, 99)):
+        values = sorted(self.samples[name])
+        if not values:
+            return tuple(0.0 for _ in qs)
+        last = len(values) - 1
+        return tuple(values[min(last, int(q / 100 * len(values)))] for q in qs)
+
+    def summary_lines(self):
+        """
+        ข้อความสรุป p50/p95/p99 ของแต่ละส่วน (คำนวณใหม่ทุก SUMMARY_EVERY เฟรม)
+        """
+        if not self._summary:
+            lines = ["section    p50    p95    p99"]
+            for name in SECTIONS:
+                p50, p95, p99 = self.percentiles(name)
+                lines.append(f"{name:<8} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            self._summary = lines
+            self.summary_version += 1
+        return self._summary
@@ -0,0 +1,136 @@
+"""
+ตัววาดหน้าเกมแบบ texture ผ่าน pygame._sdl2 (SDL2 Renderer)
+Surface ที่หน้าเกมวาด (sprite ของกล่อง/ปุ่ม, ข้อความ, ไอคอน) ถูกอัปโหลดเป็น Texture ครั้งเดียว
+แล้วประกอบทั้งเฟรมด้วย Renderer แทนการ blit ลง SCREEN และ display.flip
+SDL สร้าง Renderer บนหน้าต่างที่มี Surface ของ pygame.display อยู่แล้วไม่ได้
+จึงเปิดหน้าต่างของตัวเองแทนหน้าต่างเดิม (ซ่อนหน้าต่างเดิมไว้จนกว่าจะ close)
+ถ้าสร้างไม่ได้ (ไม่มี _sdl2 หรือไม่มี renderer) create คืน None และเกมวาดแบบ software ตามเดิม
+"""
+from collections import OrderedDict
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError: # pygame รุ่นที่ไม่มี _sdl2
+    Renderer = Texture = Window = None
+
+# จำนวน Texture สูงสุดที่เก็บไว้ (Surface ที่ไม่ได้ใช้นานที่สุดถูกทิ้งก่อน)
+MAX_TEXTURES = 1024
+WINDOW_EVENTS = [getattr(pygame, name) for name in dir(pygame) if name.startswith("WINDOW") and name.isupper()]
+
+# Window ของหน้าต่าง pygame.display (สร้างครั้งเดียวและไม่ทิ้ง: SDL เก็บ pointer ของ object นี้ไว้กับหน้าต่าง
+# ถ้า object ถูกลบ event ถัดไปของหน้าต่างจะอ้างถึงหน่วยความจำที่คืนไปแล้ว)
+_DISPLAY_WINDOW = None
+
+
+def display_window():
+    global _DISPLAY_WINDOW
+    if _DISPLAY_WINDOW is None:
+        _DISPLAY_WINDOW = Window.from_display_module()
+    return _DISPLAY_WINDOW
+
+
+class TextureTarget:
+    """
+    ปลายทางการวาดที่มีเมธอดเหมือน Surface เท่าที่หน้าเกมใช้ (blit, fill, get_size)
+    Surface ที่ blit ต้องไม่ถูกแก้ภายหลัง (Texture ถูกแคชตามตัว Surface)
+    และวาดด้วย pygame.draw ลงไปตรง ๆ ไม่ได้
+    """
+
+    def __init__(self, title, size):
+        self.display_window = display_window()
+        self.window = Window(title, size=size, resizable=True)
+        self.window.position = self.display_window.position
+        try:
+            self.renderer = Renderer(self.window)
+        except pygame.error:
+            self.renderer = Renderer(self.window, accelerated=0) # software renderer ของ SDL
+        self.display_window.hide()
+        self.logical_size = None
+        self.textures = OrderedDict()
+        self.uploads = 0
+
+    @classmethod
+    def create(cls, title, size):
+        """
+        เปิดหน้าต่างแบบ texture หรือคืน None ถ้าใช้ไม่ได้
+        """
+        if Renderer is None:
+            print("Texture renderer unavailable (no pygame._sdl2), using software rendering")
+            return None
+        try:
+            return cls(title, size)
+        except Exception as e:
+            print(f"Texture renderer unavailable, using software rendering: {e}")
+            return None
+
+    def close(self):
+        """
+        ปิดหน้าต่างนี้และแสดงหน้าต่างเดิมของ pygame.display อีกครั้ง
+        """
+        self.textures.clear()
+        self.renderer = None
+        self.window.destroy()
+        # ทิ้ง window event ที่ค้างอยู่ของหน้าต่างที่ปิดแล้ว (pygame แปลง event ที่อ้างถึงหน้าต่างที่ไม่มีแล้วไม่ได้)
+        pygame.event.clear(WINDOW_EVENTS)
+        self.display_window.show()
+
+    def set_logical_size(self, size):
+        """
+        วาดที่ขนาด size แล้วให้ Renderer ย่อ/ขยายให้เต็มหน้าต่าง (None = วาดตามขนาดหน้าต่าง)
+        """
+        if size != self.logical_size:
+            self.logical_size = size
+            self.renderer.logical_size = size or (0, 0)
+
+    def get_size(self):
+        return self.logical_size or self.window.size
+
+    def get_width(self):
+        return self.get_size()[0]
+
+    def get_height(self):
+        return self.get_size()[1]
+
+    def texture(self, surface):
+        """
+        Texture ของ surface (อัปโหลดครั้งแรกที่ใช้)
+        """
+        key = id(surface)
+        entry = self.textures.get(key)
+        if entry is not None and entry[0] is surface:
+            self.textures.move_to_end(key)
+            return entry[1]
+        texture = Texture.from_surface(self.renderer, surface)
+        self.uploads += 1
+        self.textures[key] = (surface, texture) # เก็บ surface ไว้ด้วย id จึงไม่ถูกใช้ซ้ำ
+        if len(self.textures) > MAX_TEXTURES:
+            self.textures.popitem(last=False)
+        return texture
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def blit(self, source, dest, area=None):
+        # เหมือน Surface.blit: ใช้เฉพาะมุมซ้ายบนของ dest
+        if area is None:
+            rect = pygame.Rect(dest[0], dest[1], source.get_width(), source.get_height())
+        else:
+            area = pygame.Rect(area)
+            rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+        self.texture(source).draw(srcrect=area, dstrect=rect)
+        return rect
+
+    def present(self):
+        self.renderer.present()
+
+    def to_surface(self):
+        """
+        อ่านภาพที่วาดล่าสุดกลับมาเป็น Surface (สำหรับเทียบผลหรือบันทึกภาพ)
+        """
+        return self.renderer.to_surface()
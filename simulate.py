@@ -0,0 +1,175 @@
+"""
+จำลองการเล่น Wordle จำนวนมากโดยไม่ใช้หน้าจอ (ใช้กติกาจาก WordleEngine)
+แบ่งเกมเป็นชุดแล้วกระจายไปหลาย process ด้วย ProcessPoolExecutor
+รายงานความเร็ว (เกม/วินาที), อัตราชนะ และการกระจายจำนวนครั้งที่เดาของแต่ละไฟล์คำศัพท์
+
+วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+    python simulate.py --strategy entropy --games 20000 --workers 4
+"""
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from wordle_engine import WordleEngine
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+WORD_LISTS = ("words_easy.txt", "words_medium.txt", "words_hard.txt")
+# จำนวนเกมต่อชุดงานที่ส่งให้แต่ละ process
+CHUNK_SIZE = 500
+
+# engine ของ process นี้ (สร้างครั้งเดียวต่อ process)
+_ENGINE = None
+# คำเปิดเกมของกลยุทธ์ frequency ต่อรายการคำ (คำนวณครั้งเดียวต่อ process)
+_FREQUENCY_OPENINGS = {}
+
+
+# --- กลยุทธ์การเดา: รับ engine และ random.Random แล้วคืนคำเดาถัดไป ---
+
+def random_consistent(engine, rng):
+    """
+    สุ่มคำจากคำตอบที่ยังเป็นไปได้
+    """
+    if engine.candidate_bits == engine.constraint_index.all_bits: # ยังไม่ได้เดา
+        return rng.choice(engine.word_bank)
+    candidates = engine.constraint_index.words_in(engine.candidate_bits)
+    return rng.choice(candidates) if candidates else rng.choice(engine.word_bank)
+
+
+def frequency(engine, rng):
+    """
+    เลือกคำที่ยังเป็นไปได้ซึ่งมีตัวอักษร (ไม่ซ้ำ) ที่พบบ่อยที่สุดในคำที่เหลือ
+    """
+    index = engine.constraint_index
+    first_guess = engine.candidate_bits == index.all_bits
+    if first_guess and id(index) in _FREQUENCY_OPENINGS:
+        return _FREQUENCY_OPENINGS[id(index)]
+    candidates = index.words_in(engine.candidate_bits)
+    if not candidates:
+        return rng.choice(engine.word_bank)
+    counts = Counter()
+    for word in candidates:
+        counts.update(set(word))
+    guess = max(candidates, key=lambda word: sum(counts[letter] for letter in set(word)))
+    if first_guess:
+        _FREQUENCY_OPENINGS[id(index)] = guess
+    return guess
+
+
+def entropy(engine, rng):
+    """
+    คำเดาที่ให้ข้อมูลมากที่สุดจาก solver (แบบเดียวกับปุ่ม Hint)
+    """
+    return engine.hint() or random_consistent(engine, rng)
+
+
+STRATEGIES = {"random": random_consistent, "frequency": frequency, "entropy": entropy}
+
+
+def play(engine, strategy, filename, target, rng):
+    """
+    เล่นหนึ่งเกมด้วยกติกา Classic (เดาได้ 6 ครั้ง) คืนจำนวนครั้งที่เดาถ้าชนะ หรือ 0 ถ้าแพ้
+    """
+    engine.start_new_game('classic', target_word=target, filename=filename)
+    while not engine.game_over:
+        engine.current_guess = strategy(engine, rng)
+        if engine.submit_guess() is None: # คำเดาไม่ผ่านการตรวจสอบ
+            return 0
+    return len(engine.guesses) if engine.win else 0
+
+
+def run_shard(task):
+    """
+    เล่นเกมหนึ่งชุดใน process ลูก task = (ไฟล์คำ, ชื่อกลยุทธ์, รายการคำตอบ, seed)
+    คืน (ไฟล์คำ, จำนวนเกม, Counter ของจำนวนครั้งที่เดา โดย 0 = แพ้, เวลาที่ใช้)
+    """
+    global _ENGINE
+    filename, strategy_name, targets, seed = task
+    if _ENGINE is None:
+        _ENGINE = WordleEngine()
+    strategy = STRATEGIES[strategy_name]
+    rng = random.Random(seed)
+    results = Counter()
+    start = time.perf_counter()
+    for target in targets:
+        results[play(_ENGINE, strategy, filename, target, rng)] += 1
+    return filename, len(targets), results, time.perf_counter() - start
+
+
+def make_tasks(word_lists, strategy_name, games, seed, chunk_size=CHUNK_SIZE):
+    """
+    แบ่งเกมของแต่ละไฟล์เป็นชุดละ chunk_size (คำตอบวนตามรายการคำที่สับแล้ว จึงครอบคลุมทุกคำเมื่อ games มากพอ)
+    """
+    engine = WordleEngine()
+    tasks = []
+    for filename in word_lists:
+        engine.start_new_game('classic', filename=filename)
+        bank = list(engine.word_bank)
+        random.Random(seed).shuffle(bank)
+        targets = [bank[i % len(bank)] for i in range(games)]
+        for i in range(0, games, chunk_size):
+            tasks.append((filename, strategy_name, targets[i:i + chunk_size], seed + len(tasks)))
+    return tasks
+
+
+def simulate(word_lists=WORD_LISTS, strategy_name="entropy", games=10_000, workers=None, seed=0):
+    """
+    จำลองเกมทั้งหมดแล้วรวมผลต่อไฟล์คำศัพท์
+    คืน dict: ไฟล์ -> {"games", "wins", "guess_dist", "cpu_seconds"} และเวลาจริงทั้งหมด
+    """
+    if strategy_name == "entropy":
+        try:
+            import feedback
+            feedback.precompute_all(word_lists) # สร้างตารางก่อน ไม่ให้ทุก process สร้างพร้อมกัน
+        except ImportError as e:
+            print(f"Entropy strategy needs numpy: {e}")
+            raise
+    tasks = make_tasks(word_lists, strategy_name, games, seed)
+    merged = {filename: {"games": 0, "wins": 0, "guess_dist": Counter(), "cpu_seconds": 0.0}
+              for filename in word_lists}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for filename, count, results, seconds in pool.map(run_shard, tasks):
+            summary = merged[filename]
+            summary["games"] += count
+            summary["wins"] += count - results.get(0, 0)
+            summary["guess_dist"].update({k: v for k, v in results.items() if k})
+            summary["cpu_seconds"] += seconds
+    return merged, time.perf_counter() - start
+
+
+def report(merged, elapsed, workers):
+    total = sum(summary["games"] for summary in merged.values())
+    print(f"{total} games in {elapsed:.2f} s with {workers} workers: {total / elapsed:,.0f} games/sec")
+    for filename, summary in merged.items():
+        games, wins = summary["games"], summary["wins"]
+        if not games:
+            continue
+        dist = summary["guess_dist"]
+        avg = sum(k * v for k, v in dist.items()) / wins if wins else 0.0
+        per_core = games / summary["cpu_seconds"] if summary["cpu_seconds"] else 0.0
+        print(f"  {filename}: win rate {wins / games:.2%}, avg guesses {avg:.3f}, "
+              f"{per_core:,.0f} games/sec per worker")
+        print("    guesses: " + "  ".join(f"{k}:{dist.get(k, 0)}" for k in range(1, 7))
+              + f"  lost:{games - wins}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate headless Wordle games.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--games", type=int, default=10_000, help="games per word list")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("word_lists", nargs="*", default=list(WORD_LISTS))
+    args = parser.parse_args()
+
+    os.chdir(ROOT) # ไฟล์คำศัพท์และ cache อ้างอิงจากโฟลเดอร์ของเกม
+    merged, elapsed = simulate(args.word_lists, args.strategy, args.games, args.workers, args.seed)
+    report(merged, elapsed, args.workers)
+
+
+if __name__ == "__main__":
+    main()
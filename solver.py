@@ -0,0 +1,189 @@
+"""
+Solver สำหรับ Wordle: เลือกคำเดาที่ให้ข้อมูลคาดหวัง (entropy) มากที่สุด
+เทียบกับคำตอบที่ยังเป็นไปได้ โดยเปิดจากตารางผลลัพธ์ (feedback.FeedbackMatrix)
+แทนการเรียก check_guess วนลูป ใช้สำหรับปุ่ม Hint และการเล่นทดสอบอัตโนมัติ
+"""
+import json
+import os
+
+import numpy as np
+
+import feedback
+
+OPENINGS_FILE = os.path.join(feedback.CACHE_DIR, "openings.json")
+# จำนวนคำตอบที่เหลือสูงสุดที่ใช้วิธีเรียงรหัส (มากกว่านี้ใช้วิธีนับทุกรหัส)
+SORT_THRESHOLD = 300
+# เมื่อคำตอบที่เหลือมากกว่า PRUNE_THRESHOLD ให้คะแนนจริงเฉพาะคำตอบที่เหลือ
+# และ PROBE_LIMIT คำเดาที่คัดด้วยคะแนนตัวอักษร (ตอนท้ายเกมให้คะแนนทุกคำเดา)
+PRUNE_THRESHOLD = 40
+PROBE_LIMIT = 200
+
+# คำเปิดเกมที่คำนวณแล้ว (key: digest ของรายการคำ)
+_OPENINGS = {}
+# solver ที่สร้างแล้วของแต่ละตาราง
+_SOLVERS = {}
+
+
+def _load_openings():
+    try:
+        with open(OPENINGS_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            _OPENINGS.update(data)
+    except (OSError, ValueError):
+        pass
+
+
+def _save_openings():
+    try:
+        os.makedirs(feedback.CACHE_DIR, exist_ok=True)
+        tmp_path = OPENINGS_FILE + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_OPENINGS, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, OPENINGS_FILE)
+    except OSError as e:
+        print(f"Could not save openings cache: {e}")
+
+
+_load_openings()
+
+
+class WordleSolver:
+    """
+    เลือกคำเดาที่ดีที่สุดจากตารางผลลัพธ์ของรายการคำหนึ่งชุด
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.matrix = np.asarray(table.matrix)
+        self.words = table.words
+        self._all = np.arange(len(self.words))
+        # ตัวอักษรที่มีในแต่ละคำ (N x 26) และตัวอักษรในแต่ละตำแหน่ง (N x 5*26) สำหรับคัดคำเดา
+        letters = feedback.encode_words(self.words).astype(np.intp)
+        rows = np.arange(len(self.words))[:, None]
+        self.letters = np.zeros((len(self.words), 26), dtype=np.float32)
+        self.letters[rows, letters] = 1
+        self.positions = np.zeros((len(self.words), feedback.WORD_LENGTH * 26), dtype=np.float32)
+        self.positions[rows, np.arange(feedback.WORD_LENGTH) * 26 + letters] = 1
+        if len(self.words) > PROBE_LIMIT:
+            self._probes(self._all) # ครั้งแรกที่คูณเมทริกซ์ช้า (numpy เริ่ม BLAS) จึงทำตอนสร้าง solver
+
+    def candidates(self, history):
+        """
+        คืน index ของคำตอบที่ยังสอดคล้องกับประวัติการเดา
+        history: list ของ (คำเดา, ผลลัพธ์) โดยผลลัพธ์เป็น list ชื่อสีหรือรหัสฐาน 3
+        """
+        cand = self._all
+        for guess, result in history:
+            code = result if isinstance(result, (int, np.integer)) else feedback.pattern_code(result)
+            g = self.table.index.get(guess)
+            if g is not None:
+                codes = self.matrix[g, cand]
+            else:
+                # คำเดาที่ไม่อยู่ในตาราง: ให้คะแนนสดกับคำที่เหลือ
+                codes = feedback.score_many(guess, feedback.encode_words([self.words[i] for i in cand]))
+            cand = cand[codes == code]
+        return cand
+
+    def _cost_sorted(self, cand, n_log_n, rows=None):
+        """
+        sum(n*log2(n)) ของแต่ละคำเดา (ทุกคำ หรือเฉพาะ rows) โดยเรียงรหัสในแต่ละแถวแล้วนับความยาวของช่วงที่ซ้ำกัน
+        (เร็วเมื่อคำตอบที่เหลือมีน้อย เพราะทำงานแค่ N x C)
+        """
+        n_cand = len(cand)
+        if rows is None:
+            n_words, codes = len(self.words), self.matrix[:, cand]
+        else:
+            n_words, codes = len(rows), self.matrix[np.ix_(rows, cand)]
+        codes = np.sort(codes, axis=1, kind='stable') # uint8 ใช้ radix sort
+        is_start = np.empty((n_words, n_cand), dtype=bool)
+        is_start[:, 0] = True
+        np.not_equal(codes[:, 1:], codes[:, :-1], out=is_start[:, 1:])
+        starts = np.flatnonzero(is_start.ravel())
+        runs = np.diff(starts, append=n_words * n_cand)
+        return np.bincount(starts // n_cand, weights=n_log_n[runs], minlength=n_words)
+
+    def _cost_counted(self, cand, n_log_n):
+        """
+        sum(n*log2(n)) ของแต่ละคำเดา โดยนับจำนวนของทุกรหัส (N x 243 ช่อง)
+        (เร็วกว่าเมื่อคำตอบที่เหลือมีมาก เช่นตอนหาคำเปิดเกม)
+        """
+        n_words = len(self.words)
+        idx = self.matrix[:, cand].astype(np.intp)
+        idx += (np.arange(n_words, dtype=np.intp) * feedback.NUM_PATTERNS)[:, None]
+        counts = np.bincount(idx.ravel(), minlength=n_words * feedback.NUM_PATTERNS)
+        return n_log_n[counts].reshape(n_words, feedback.NUM_PATTERNS).sum(axis=1)
+
+    def _probes(self, cand):
+        """
+        คำเดาที่ควรให้คะแนนจริง (เรียงตาม index): คำตอบที่เหลือทั้งหมด และ PROBE_LIMIT คำ
+        ที่มีตัวอักษรซึ่งแบ่งคำที่เหลือได้ใกล้ครึ่งมากที่สุด (นับทั้งแบบมีในคำและแบบตรงตำแหน่ง)
+        """
+        n_cand = len(cand)
+        has = self.letters[cand].sum(axis=0)
+        at = self.positions[cand].sum(axis=0)
+        score = self.letters @ np.minimum(has, n_cand - has) + self.positions @ np.minimum(at, n_cand - at)
+        probes = np.argpartition(-score, PROBE_LIMIT)[:PROBE_LIMIT]
+        return np.union1d(probes, cand)
+
+    def _rank(self, cand, prune=True):
+        """
+        คืน index ของคำเดาที่แบ่งคำตอบที่เหลือได้ดีที่สุด (entropy สูงสุด)
+        entropy = log2(C) - sum(n*log2(n))/C จึงเลือกคำที่ sum(n*log2(n)) น้อยที่สุด
+        prune=False ให้คะแนนทุกคำเดาเสมอ (ใช้ตอนหาคำเปิดเกมที่คำนวณครั้งเดียว)
+        """
+        n_cand = len(cand)
+        n = np.arange(n_cand + 1, dtype=np.float64)
+        n_log_n = np.zeros(n_cand + 1)
+        n_log_n[1:] = n[1:] * np.log2(n[1:])
+        rows = self._all
+        if prune and n_cand > PRUNE_THRESHOLD and len(self.words) > PROBE_LIMIT:
+            rows = self._probes(cand)
+            cost = self._cost_sorted(cand, n_log_n, rows)
+        elif n_cand <= SORT_THRESHOLD:
+            cost = self._cost_sorted(cand, n_log_n)
+        else:
+            cost = self._cost_counted(cand, n_log_n)
+
+        # ถ้าคะแนนเท่ากัน เลือกคำที่ยังเป็นคำตอบได้ (มีโอกาสชนะทันที)
+        is_candidate = np.zeros(len(self.words), dtype=bool)
+        is_candidate[cand] = True
+        best = rows[cost <= cost.min() + 1e-9]
+        preferred = best[is_candidate[best]]
+        return int(preferred[0] if len(preferred) else best[0])
+
+    def opening(self):
+        """
+        คำเปิดเกมของรายการคำนี้ (คำนวณครั้งเดียวแล้วเก็บไว้ใน cache)
+        """
+        word = _OPENINGS.get(self.table.digest)
+        if word in self.table.index:
+            return word
+        word = self.words[self._rank(self._all, prune=False)]
+        _OPENINGS[self.table.digest] = word
+        _save_openings()
+        return word
+
+    def best_guess(self, history):
+        """
+        คืนคำเดาที่ดีที่สุดจากประวัติการเดา หรือ None ถ้าไม่มีคำตอบที่สอดคล้องเหลืออยู่
+        """
+        if not history:
+            return self.opening()
+        cand = self.candidates(history)
+        if len(cand) == 0:
+            return None
+        if len(cand) <= 2:
+            return self.words[cand[0]]
+        return self.words[self._rank(cand)]
+
+
+def get_solver(table):
+    """
+    คืน solver ของตารางผลลัพธ์ (สร้างครั้งเดียวต่อรายการคำ)
+    """
+    solver = _SOLVERS.get(table.digest)
+    if solver is None or solver.table is not table:
+        solver = WordleSolver(table)
+        _SOLVERS[table.digest] = solver
+    return solver
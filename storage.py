@@ -0,0 +1,235 @@
+"""
+ที่เก็บสถิติการเล่นแบบ append-only
+แต่ละเกมถูกต่อท้ายไฟล์ log เป็น JSON หนึ่งบรรทัด (ต้นทุนคงที่ต่อเกม ไม่ว่าประวัติจะยาวแค่ไหน)
+ส่วนสรุป (played, wins, streak, guess_dist) อัปเดตในหน่วยความจำทีละเกม
+และถูกเขียนเป็น snapshot (ไฟล์สถิติรูปแบบเดิม) เป็นระยะ ๆ แบบ write-temp-then-rename
+"""
+import json
+import os
+import time
+
+from analytics import StatsAnalytics
+
+# รหัสสีที่ใช้เก็บผลลัพธ์ใน log (ตรงกับ feedback.GRAY/YELLOW/GREEN)
+RESULT_DIGITS = {"GRAY": "0", "YELLOW": "1", "GREEN": "2"}
+# เขียน snapshot ใหม่ทุก ๆ กี่เกม
+COMPACT_EVERY = 50
+# เวลาที่รอหลังการเปลี่ยนครั้งล่าสุดก่อนเขียนไฟล์การตั้งค่า (วินาที)
+SETTINGS_SAVE_DELAY = 0.5
+
+
+def atomic_write_json(path, data, indent=None):
+    """
+    เขียน JSON ลงไฟล์ชั่วคราวแล้ว os.replace ทับไฟล์จริง
+    ถ้าโปรแกรมดับระหว่างเขียน ไฟล์เดิมยังอยู่ครบ
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class DebouncedJsonWriter:
+    """
+    รวมการเขียนไฟล์ JSON ที่เกิดถี่ ๆ (เช่นตอนลากแถบเลื่อนความดัง) ให้เหลือครั้งเดียว
+    mark_dirty บอกว่าข้อมูลเปลี่ยน, poll เขียนเมื่อไม่มีการเปลี่ยนมาแล้ว delay วินาที,
+    flush เขียนทันที (เช่นตอนกด Back หรือปิดโปรแกรม) ทุกครั้งเขียนด้วย atomic_write_json
+    """
+
+    def __init__(self, path, get_data, delay=SETTINGS_SAVE_DELAY, indent=4):
+        self.path = path
+        self.get_data = get_data # ฟังก์ชันที่คืนข้อมูลล่าสุดที่จะเขียน
+        self.delay = delay
+        self.indent = indent
+        self.dirty_since = None # เวลาที่เปลี่ยนครั้งล่าสุด (None = ไม่มีอะไรค้าง)
+        self.writes = 0
+
+    def mark_dirty(self):
+        self.dirty_since = time.monotonic()
+
+    def poll(self):
+        """
+        เขียนไฟล์ถ้ามีการเปลี่ยนค้างอยู่และนิ่งมาแล้ว delay วินาที (คืน True ถ้าเขียน)
+        """
+        if self.dirty_since is None or time.monotonic() - self.dirty_since < self.delay:
+            return False
+        return self.flush()
+
+    def flush(self):
+        """
+        เขียนไฟล์ทันทีถ้ามีการเปลี่ยนค้างอยู่
+        """
+        if self.dirty_since is None:
+            return False
+        try:
+            atomic_write_json(self.path, self.get_data(), indent=self.indent)
+            self.writes += 1
+        except OSError as e:
+            print(f"Could not save {os.path.basename(self.path)}: {e}")
+        self.dirty_since = None
+        return True
+
+
+def encode_result(result):
+    """
+    แปลงผลลัพธ์หนึ่งแถว (list ชื่อสี) เป็นสตริงตัวเลข เช่น "02110"
+    """
+    return "".join(RESULT_DIGITS.get(color, "0") for color in result)
+
+
+def empty_stats():
+    return {"played": 0, "wins": 0, "current_streak": 0, "max_streak": 0, "guess_dist": {}}
+
+
+class GameLogStore:
+    """
+    สถิติการเล่น = snapshot (stats_file) + เกมใน log ที่ต่อท้ายหลัง snapshot ครั้งล่าสุด
+    snapshot เก็บ log_offset (จำนวน byte ของ log ที่รวมไว้แล้ว) ตอนโหลดจึงอ่านเฉพาะส่วนท้ายของ log
+    """
+
+    def __init__(self, stats_file, log_file=None, compact_every=COMPACT_EVERY):
+        self.stats_file = stats_file
+        self.log_file = log_file or os.path.splitext(stats_file)[0] + ".log.jsonl"
+        self.compact_every = compact_every
+        self.log_offset = 0
+        self.pending = 0 # จำนวนเกมใน log ที่ยังไม่อยู่ใน snapshot
+        self.needs_snapshot = False # log_offset ใน snapshot ไม่ตรงกับไฟล์ log แล้ว
+        self.analytics = StatsAnalytics()
+        self.stats = self._load()
+        if self.needs_snapshot:
+            self.compact()
+
+    def _load(self):
+        stats = empty_stats()
+        analytics = None
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.log_offset = int(data.pop("log_offset", 0))
+                analytics = data.pop("analytics", None)
+                stats.update(data)
+        except (OSError, ValueError) as e:
+            if os.path.exists(self.stats_file):
+                print(f"Could not load stats: {e}")
+
+        if analytics is not None:
+            self.analytics = StatsAnalytics.from_dict(analytics)
+
+        offset = self.log_offset
+        for record in self._read_log(offset):
+            self.apply(stats, record)
+            self.analytics.add_game(record)
+            self.pending += 1
+        if self.log_offset != offset:
+            # log ถูกลบหรือตัดทิ้ง: เขียน snapshot ให้ชี้ตำแหน่งใหม่ ไม่เช่นนั้นเกมที่ต่อท้าย log ใหม่
+            # จะอยู่ก่อน offset เดิมและถูกข้ามตอนโหลดครั้งถัดไป
+            self.needs_snapshot = True
+        return stats
+
+
+    def _read_log(self, offset):
+        """
+        อ่านเกมใน log ตั้งแต่ byte ที่ offset (ข้ามบรรทัดที่เขียนไม่ครบตอนโปรแกรมดับ)
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                if offset > size: # log ถูกลบหรือตัดทิ้ง: ไม่มีอะไรต้องอ่านต่อ
+                    self.log_offset = size
+                    return []
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            self.log_offset = 0
+            return []
+
+        if data and not data.endswith(b"\n"):
+            # บรรทัดสุดท้ายเขียนไม่ครบ: ตัดทิ้ง ไม่ให้เกมถัดไปต่อท้ายบรรทัดที่เสีย
+            cut = data.rfind(b"\n") + 1
+            self._truncate_log(offset + cut)
+            data = data[:cut]
+
+        records = []
+        for line in data.splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+    def _truncate_log(self, size):
+        try:
+            with open(self.log_file, 'r+b') as f:
+                f.truncate(size)
+        except OSError as e:
+            print(f"Could not repair game log: {e}")
+
+    @staticmethod
+    def apply(stats, record):
+        """
+        อัปเดตส่วนสรุปด้วยเกมหนึ่งเกม (เกมที่ counted เป็น False เก็บใน log แต่ไม่นับในสถิติ)
+        """
+        if not record.get("counted", True):
+            return
+        stats["played"] += 1
+        if record.get("win"):
+            stats["wins"] += 1
+            stats["current_streak"] += 1
+            stats["max_streak"] = max(stats["max_streak"], stats["current_streak"])
+            guess_count = str(len(record.get("guesses", [])))
+            stats["guess_dist"][guess_count] = stats["guess_dist"].get(guess_count, 0) + 1
+        else:
+            stats["current_streak"] = 0
+
+    def record_game(self, record):
+        """
+        ต่อท้ายเกมหนึ่งเกมลง log แล้วอัปเดตส่วนสรุป
+        record: dict ของ mode, target, guesses, results, win, duration_ms (เติม ts ให้ถ้าไม่มี)
+        """
+        record.setdefault("ts", round(time.time(), 3))
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        try:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Could not append game log: {e}")
+        self.apply(self.stats, record)
+        self.analytics.add_game(record)
+        self.pending += 1
+        if self.pending >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """
+        เขียน snapshot ของส่วนสรุปพร้อมตำแหน่งท้าย log ที่รวมไว้แล้ว
+        """
+        try:
+            offset = os.path.getsize(self.log_file)
+        except OSError:
+            offset = 0
+        try:
+            snapshot = dict(self.stats, log_offset=offset, analytics=self.analytics.to_dict())
+            atomic_write_json(self.stats_file, snapshot, indent=4)
+            self.log_offset = offset
+            self.pending = 0
+        except OSError as e:
+            print(f"Could not save stats: {e}")
+
+    def iter_games(self):
+        """
+        อ่านทุกเกมใน log ตั้งแต่ต้น (สำหรับการวิเคราะห์ย้อนหลัง)
+        """
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            return
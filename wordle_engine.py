@@ -0,0 +1,298 @@
+"""
+ตรรกะหลักของเกม Wordle แบบไม่ใช้ pygame (headless)
+เก็บสถานะเกมและกฎทั้งหมด (การเดา, ผลลัพธ์, สีคีย์บอร์ด, ชนะ/แพ้, ตัวจับเวลา, โหมด Unlimited)
+ใช้ได้ทั้งกับหน้าจอ pygame (Wordle.py) และการจำลองเกมจำนวนมากโดยไม่ต้องมีหน้าจอหรือเสียง
+"""
+import random
+import time
+from collections import Counter
+
+import constraints
+import lexicon
+import storage
+
+try:
+    import feedback # ตารางผลลัพธ์ที่คำนวณไว้ล่วงหน้า (ต้องใช้ numpy)
+    import solver
+except ImportError as e:
+    print(f"Feedback matrix disabled: {e}")
+    feedback = solver = None
+
+# ไฟล์คำศัพท์ของแต่ละโหมด
+WORD_FILES = {'classic': 'words_medium.txt', 'unlimited': 'words_easy.txt', 'limited_time': 'words_hard.txt'}
+DEFAULT_WORD_FILE = 'words_medium.txt'
+FALLBACK_WORDS = ('apple', 'train', 'audio', 'house', 'world')
+
+
+class WordleEngine:
+    """
+    คลาสเก็บสถานะและกฎของเกม Wordle (ไม่มีการวาดหรือเล่นเสียง)
+    เวลาทั้งหมดเป็นมิลลิวินาทีจาก now() ซึ่งคลาสลูกเปลี่ยนได้ (เช่นใช้ pygame.time.get_ticks)
+    """
+
+    def __init__(self):
+        self.WORD_LENGTH = 5
+        self.MAX_GUESSES = 6
+        self.word_bank, self.target_word = [], ""
+        self.feedback_table = None # ตารางผลลัพธ์ของ word_bank ปัจจุบัน
+        self.constraint_index = None # ดัชนี bitset ของ word_bank ปัจจุบัน
+        self.candidate_bits = 0 # คำใน word_bank ที่ยังสอดคล้องกับผลลัพธ์ทั้งหมด
+        self.allowed_guesses = None # คำที่อนุญาตให้เดา (lexicon.CompactLexicon, None = ไม่ตรวจ)
+        self.guesses, self.results, self.current_guess = [], [], ""
+        self.game_over, self.win = False, False
+        self.current_mode = 'classic'
+        self.message, self.message_timer = "", 0
+        self.keyboard_colors = {chr(c): "KEY_DEFAULT" for c in range(ord('a'), ord('z') + 1)}
+
+        self.game_start_time = 0 # เวลาเริ่มเกมปัจจุบัน (ใช้คำนวณเวลาที่ใช้ใน log)
+
+        # ตัวแปรสำหรับโหมดจับเวลา
+        self.timer_start_time = 0
+        self.time_limit = 30000 # 30 วินาที (ในหน่วยมิลลิวินาที)
+        self.time_remaining = 30.0 # สำหรับแสดงผล
+
+    def now(self):
+        """
+        เวลาปัจจุบัน (มิลลิวินาที) ที่ใช้กับตัวจับเวลาและข้อความแจ้งเตือน
+        """
+        return int(time.monotonic() * 1000)
+
+    def reset_game_state(self):
+        """
+        รีเซ็ตสถานะเกม (การเดา, ผลลัพธ์, คีย์บอร์ด) เพื่อเริ่มเกมใหม่
+        """
+        self.guesses, self.results, self.current_guess = [], [], ""
+        self.game_over, self.win = False, False
+        self.message = ""
+        self.keyboard_colors = {chr(c): "KEY_DEFAULT" for c in range(ord('a'), ord('z') + 1)}
+        self.candidate_bits = self.constraint_index.all_bits if self.constraint_index else 0
+        # รีเซ็ตตัวจับเวลา
+        self.timer_start_time = 0
+        self.time_remaining = 30.0
+
+    def set_message(self, text, color="WHITE"):
+        """
+        ตั้งค่าข้อความแจ้งเตือน (เช่น "คำไม่ถูกต้อง") ให้แสดงชั่วคราว
+        """
+        self.message = (text, color)
+        self.message_timer = self.now()
+
+    def _load_words_from_file(self, filename):
+        """
+        โหลดรายการคำศัพท์จากไฟล์ .txt สำหรับโหมดเกมที่เลือก
+        (ผ่านแคชของ lexicon: อ่านไฟล์ใหม่เฉพาะเมื่อไฟล์เปลี่ยน, word_bank เป็น tuple)
+        """
+        try:
+            words = lexicon.load_word_bank(filename, self.WORD_LENGTH)
+            if not words:
+                print(f"Warning: Word file '{filename}' is empty or invalid. Using default list.")
+                self.word_bank = FALLBACK_WORDS
+            else:
+                self.word_bank = words
+        except FileNotFoundError:
+            print(f"Warning: Word file '{filename}' not found. Using default list and creating file.")
+            self.word_bank = FALLBACK_WORDS
+            try:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    pass
+            except Exception as e:
+                print(f"Could not create file {filename}: {e}")
+        self.constraint_index = constraints.get_constraint_index(self.word_bank, filename)
+        self.allowed_guesses = lexicon.load_allowed_guesses()
+        self._load_feedback_table(filename)
+
+    def _load_feedback_table(self, filename):
+        """
+        โหลดตารางผลลัพธ์ของ word_bank ปัจจุบัน (คำนวณใหม่เฉพาะเมื่อไฟล์คำเปลี่ยน)
+        """
+        self.feedback_table = None
+        if feedback is None:
+            return
+        try:
+            self.feedback_table = feedback.load_feedback_matrix(self.word_bank, filename)
+        except Exception as e:
+            print(f"Could not load feedback matrix for {filename}: {e}")
+
+    def check_guess(self, guess):
+        """
+        ตรวจสอบคำเดาเทียบกับคำตอบ และคืนผลลัพธ์ (เขียว, เหลือง, เทา)
+        """
+        result = self._score_guess(guess)
+
+        # อัปเดตสีคีย์บอร์ด
+        for i, letter in enumerate(guess):
+            if 'a' <= letter <= 'z':
+                if result[i] == "GREEN":
+                    self.keyboard_colors[letter] = "GREEN"
+                elif result[i] == "YELLOW" and self.keyboard_colors[letter] != "GREEN":
+                    self.keyboard_colors[letter] = "YELLOW"
+                elif self.keyboard_colors[letter] == "KEY_DEFAULT":
+                    self.keyboard_colors[letter] = "KEY_USED"
+        return result
+
+    def _score_guess(self, guess):
+        """
+        คำนวณผลลัพธ์ของคำเดา: เปิดจากตารางผลลัพธ์ถ้ามี
+        ถ้าคำไม่อยู่ในตาราง ใช้วิธีนับตัวอักษรแบบเดิม
+        """
+        if self.feedback_table is not None:
+            result = self.feedback_table.pattern(guess, self.target_word)
+            if result is not None:
+                return result
+
+        result = ["GRAY"] * self.WORD_LENGTH
+        target_counts = Counter(self.target_word)
+
+        # ตรวจสอบตัวที่ถูก (สีเขียว) ก่อน
+        for i, letter in enumerate(guess):
+            if letter == self.target_word[i]:
+                result[i] = "GREEN"
+                target_counts[letter] -= 1
+
+        # ตรวจสอบตัวที่เกือบถูก (สีเหลือง)
+        for i, letter in enumerate(guess):
+            if result[i] != "GREEN" and letter in target_counts and target_counts[letter] > 0:
+                result[i] = "YELLOW"
+                target_counts[letter] -= 1
+        return result
+
+    def is_valid_guess(self, guess):
+        """
+        ตรวจสอบว่าคำเดาถูกต้องตามรูปแบบหรือไม่ (เช่น ความยาว)
+        """
+        if len(guess) != self.WORD_LENGTH:
+            self.set_message(f"Guess must be {self.WORD_LENGTH} letters", "RED")
+            return False
+        # ตรวจสอบว่าคำมีใน word bank หรือในรายการคำที่อนุญาตให้เดา
+        if self.constraint_index is not None and guess in self.constraint_index.word_index:
+            return True
+        if self.allowed_guesses is not None and guess not in self.allowed_guesses:
+            self.set_message("Not in word list", "RED")
+            return False
+        return True
+
+    def type_letter(self, letter):
+        """
+        เพิ่มตัวอักษรในคำเดาปัจจุบัน คืน True ถ้าเพิ่มได้
+        """
+        if self.game_over or len(self.current_guess) >= self.WORD_LENGTH:
+            return False
+        self.current_guess += letter
+        return True
+
+    def backspace(self):
+        """
+        ลบตัวอักษรตัวสุดท้ายของคำเดาปัจจุบัน
+        """
+        self.current_guess = self.current_guess[:-1]
+
+    def submit_guess(self):
+        """
+        ส่งคำเดาปัจจุบัน (เหมือนกด Enter)
+        คืน "win" / "lose" เมื่อเกมจบ, "continue" เมื่อเดาแล้วยังไม่จบ, None ถ้าคำเดาไม่ถูกต้อง
+        """
+        if self.game_over: # ถ้าเกมจบทแล้ว (เช่น หมดเวลา) ไม่ต้องทำอะไร
+            return None
+        if not self.is_valid_guess(self.current_guess):
+            return None
+
+        self.guesses.append(self.current_guess)
+        self.results.append(self.check_guess(self.current_guess))
+        if self.constraint_index is not None:
+            self.candidate_bits = self.constraint_index.apply(self.candidate_bits, self.guesses[-1], self.results[-1])
+        self.current_guess = ""
+
+        # ตรวจสอบว่าชนะหรือไม่
+        if self.guesses[-1] == self.target_word:
+            self.win = self.game_over = True
+            self.set_message("YOU WIN", "GREEN")
+            return "win"
+
+        # ตรวจสอบว่าแพ้ (เดาครบ 6 ครั้ง) หรือไม่ (โหมด Unlimited เดาได้ไม่จำกัด)
+        if len(self.guesses) == self.MAX_GUESSES and self.current_mode != 'unlimited':
+            self.game_over = True
+            self.set_message("LOSE", "RED")
+            return "lose"
+        return "continue"
+
+    def remaining_candidates(self):
+        """
+        จำนวนคำใน word_bank ที่ยังเป็นคำตอบได้ (สอดคล้องกับผลลัพธ์ทั้งหมดที่ผ่านมา)
+        """
+        if self.constraint_index is None:
+            return len(self.word_bank)
+        return self.constraint_index.count(self.candidate_bits)
+
+    def is_consistent(self, word):
+        """
+        ตรวจสอบว่าคำนี้ยังสอดคล้องกับผลลัพธ์ทั้งหมด (ใช้กับกฎแบบ hard mode)
+        """
+        if self.constraint_index is None:
+            return True
+        if word in self.constraint_index.word_index:
+            return self.constraint_index.contains(self.candidate_bits, word)
+        # คำที่ไม่อยู่ใน word bank: สร้างดัชนีของคำนี้คำเดียวแล้วกรองด้วยประวัติการเดา
+        probe = constraints.ConstraintIndex([word])
+        return probe.filter(zip(self.guesses, self.results)) == probe.all_bits
+
+    def hint(self):
+        """
+        แนะนำคำเดาถัดไปจาก solver (entropy สูงสุด) ตามคำเดาที่ผ่านมา
+        คืน None ถ้าเกมจบแล้วหรือไม่มีตารางผลลัพธ์
+        """
+        if self.game_over or self.feedback_table is None:
+            return None
+        return solver.get_solver(self.feedback_table).best_guess(list(zip(self.guesses, self.results)))
+
+    def game_record(self):
+        """
+        ข้อมูลของเกมที่จบแล้วสำหรับบันทึกลง log (ดู storage.GameLogStore.record_game)
+        """
+        return {
+            "mode": self.current_mode,
+            "target": self.target_word,
+            "guesses": list(self.guesses),
+            "results": [storage.encode_result(result) for result in self.results],
+            "win": self.win,
+            "duration_ms": self.now() - self.game_start_time,
+        }
+
+    def update_timer(self):
+        """
+        อัปเดตเวลาที่เหลือในโหมด Limited Time
+        คืน True ในรอบที่เวลาหมด (เกมจบด้วยการแพ้)
+        """
+        if self.current_mode != 'limited_time' or self.game_over:
+            return False
+        elapsed = self.now() - self.timer_start_time
+        self.time_remaining = (self.time_limit - elapsed) / 1000.0 # แปลงเป็นวินาที (ทศนิยม)
+
+        if self.time_remaining <= 0:
+            self.time_remaining = 0
+            self.game_over = True
+            self.win = False # แพ้เพราะหมดเวลา
+            self.set_message("TIME'S UP!", "RED")
+            return True
+        return False
+
+    def start_new_game(self, mode, target_word=None, filename=None):
+        """
+        เริ่มต้นเกมใหม่ในโหมดที่เลือก (โหลดคำ, รีเซ็ตสถานะ, เริ่มจับเวลา)
+        target_word ใช้กำหนดคำตอบเอง (เช่นตอนจำลองเกม) ถ้าไม่ระบุจะสุ่มจาก word bank
+        filename ใช้รายการคำอื่นแทนไฟล์ประจำโหมด (เช่นจำลองกติกา Classic กับทุกไฟล์)
+        """
+        filename = filename or WORD_FILES.get(mode, DEFAULT_WORD_FILE)
+
+        self._load_words_from_file(filename)
+        self.reset_game_state()
+        self.current_mode = mode
+        if not self.word_bank:
+            print("Error: Word bank is empty. Cannot start game.")
+            return False
+        self.target_word = target_word if target_word else random.choice(self.word_bank)
+        self.game_start_time = self.now()
+
+        # เริ่มจับเวลาถ้าเป็นโหมด Limited Time
+        if self.current_mode == 'limited_time':
+            self.timer_start_time = self.now()
+        return True